@@ -19,10 +19,16 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
+import os
 import sys
 import re
 from argparse import ArgumentParser, RawDescriptionHelpFormatter
 
+from moto_lib.basic import (
+    AsciiBasicToListingConverter,
+    TokenizedBasicToListingConverter,
+)
+
 
 def createArgParser() -> ArgumentParser:
     parser = ArgumentParser(
@@ -58,7 +64,8 @@ If not, see <https://www.gnu.org/licenses/>. 
         type=str,
         nargs="*",
         help="a list of BASIC files to convert, MUST have the 'BAS' extension (case insensitive) ;"
-        " ASCII listing are indicated with a ',a' after the extension (case insensitive)",
+        " ASCII listing are indicated with a ',a' after the extension (case insensitive),"
+        " otherwise the format is detected ; a directory designates all its BASIC files",
     )
 
     parser.add_argument(
@@ -67,36 +74,93 @@ If not, see <https://www.gnu.org/licenses/>. 
         help=f"When present, use MS-DOS end of line (CR LF sequence).",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="<count>",
+        type=int,
+        default=1,
+        help="the count of processes converting the source files in parallel ; errors are"
+        " reported for each source file, in the order of the source files ; defaults to 1",
+    )
+
     return parser
 
 
 class BasicToListingCli:
+    def listSources(self, sources: list[str]) -> list[str]:
+        """Replace each directory by the BASIC files it contains, in alphabetical order."""
+        result = []
+        for source in sources:
+            if os.path.isdir(source):
+                result += sorted(
+                    entry.path
+                    for entry in os.scandir(source)
+                    if entry.is_file() and entry.name[-4:].upper() == ".BAS"
+                )
+            else:
+                result.append(source)
+        return result
+
+    def processSource(self, source: str, endOfLine: bytes):
+        asciiMode = False
+        if source[-2:].upper() == ",A":
+            source = source[:-2]
+            asciiMode = True
+        if source[-3:].upper() != "BAS":
+            raise ValueError(
+                f"Extension 'BAS' (case insensitive) not found for '{source}'."
+            )
+        with open(source, "rb") as f:
+            data = f.read()
+        converter = (
+            AsciiBasicToListingConverter()
+            if asciiMode or len(data) == 0 or data[0] != 0xFF
+            else TokenizedBasicToListingConverter()
+        )
+        with open(source[:-3] + "lst", "wb") as lst:
+            converter.convert(data, lst, endOfLine)
+
+    def processInParallel(self, sources: list[str], jobs: int, endOfLine: bytes) -> int:
+        """Convert the source files with a pool of processes.
+
+        Returns:
+            int: 0 when all the source files have been converted, 1 otherwise.
+        """
+        # not imported with the module, it is slow and only needed with --jobs
+        from concurrent.futures import ProcessPoolExecutor
+
+        returnCode = 0
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for source, error in zip(
+                sources,
+                executor.map(_processInWorker, sources, [endOfLine] * len(sources)),
+            ):
+                if error is not None:
+                    print(f"Error on {source} : {error}")
+                    returnCode = 1
+        return returnCode
+
     def run(self) -> int:
         self.args = args = createArgParser().parse_args()
         endOfLine = bytes([0xD, 0xA]) if args.dos else bytes([0xA])
+        sources = self.listSources(args.sources)
 
-        for source in args.sources:
-            asciiMode = False
-            if source[-2:].upper() == ",A":
-                source = source[:-2]
-                asciiMode = True
-            if source[-3:].upper() != "BAS":
-                raise ValueError(
-                    f"Extension 'BAS' (case insensitive) not found for '{source}'."
-                )
-            with open(source, "rb") as f:
-                data = f.read()
-            if asciiMode:
-                with open(source[:-3] + "lst", "wb") as lst:
-                    lineOfCodeLength = 0
-                    for byte in data:
-                        if byte in [0xD, 0xA]:
-                            if lineOfCodeLength > 0:
-                                lst.write(endOfLine)
-                            lineOfCodeLength = 0
-                        else:
-                            lst.write(bytes([byte]))
-                            lineOfCodeLength += 1
-                    if lineOfCodeLength > 0:
-                        lst.write(endOfLine)
+        if args.jobs > 1:
+            return self.processInParallel(sources, args.jobs, endOfLine)
+        for source in sources:
+            self.processSource(source, endOfLine)
         return 0
+
+
+def _processInWorker(source: str, endOfLine: bytes) -> str:
+    """Convert a source file inside a process of the pool.
+
+    Returns:
+        str: the error message, or None.
+    """
+    try:
+        BasicToListingCli().processSource(source, endOfLine)
+        return None
+    except (ValueError, OSError) as e:
+        return str(e)
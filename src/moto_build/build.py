@@ -0,0 +1,175 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+from argparse import ArgumentParser, RawDescriptionHelpFormatter
+
+from moto_lib.basic import ListingToTokenizedBasicConverter, TokenizedLineCache
+from moto_lib.build import (
+    BuildManifest,
+    BuildPipeline,
+    BuiltFile,
+    ManifestBuilder,
+)
+from moto_lib.fs_disk.controller import FileSystemController
+from moto_lib.fs_disk.image import TypeOfDiskImage
+from moto_lib.fs_disk.image_manager import SingleDiskImageManager
+from moto_lib.fs_tape.image_manager import SingleTapeImageManager
+
+TYPES_OF_DISK_IMAGE = {
+    "fd": TypeOfDiskImage.EMULATOR_FLOPPY_IMAGE,
+    "sd": TypeOfDiskImage.SDDRIVE_FLOPPY_IMAGE,
+}
+
+
+def createArgParser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="python3 -m moto_build",
+        description="Convert listings and gather them with binaries and data files into a tape or disk archive, in one go.",
+        epilog="""---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>. 
+---
+""",
+        formatter_class=RawDescriptionHelpFormatter,
+        allow_abbrev=False,
+    )
+
+    # Add the arguments
+    parser.add_argument(
+        "sources",
+        metavar="<source file>",
+        type=str,
+        nargs="*",
+        help="a list of files to put into the archive, in this order ; listings with the 'lst'"
+        " extension (case insensitive) are numbered and tokenized, or converted into ASCII"
+        " basic files when a ',a' is appended after the extension",
+    )
+
+    parser.add_argument(
+        "--manifest",
+        metavar="<manifest.toml>",
+        help="a TOML file describing the files of each side of a disk archive ; only the"
+        " sides and files whose sources changed since the last build are rebuilt",
+    )
+
+    parser.add_argument(
+        "--into",
+        dest="archive",
+        metavar="<archive>",
+        help="The archive to create, with the 'k7', 'sd' or 'fd' extension (case insensitive)"
+        " ; it is overwritten when it exists.",
+    )
+
+    parser.add_argument(
+        "--cache",
+        metavar="<cache file>",
+        help="a json file where tokenized lines are kept between runs, like with moto_lst2bas",
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help=f"When present, each file written into the archive is displayed.",
+    )
+
+    return parser
+
+
+class BuildCli:
+    def createPipeline(self) -> BuildPipeline:
+        return BuildPipeline(ListingToTokenizedBasicConverter(self._lineCache))
+
+    def writeArchive(self, archive: str, files: list[BuiltFile]):
+        pipeline = self._pipeline
+        typeOfArchive = archive[archive.rfind(".") + 1 :].lower()
+        if typeOfArchive == "k7":
+            imageManager = SingleTapeImageManager(archive)
+            pipeline.writeIntoTape(files, imageManager.image)
+        elif typeOfArchive in TYPES_OF_DISK_IMAGE:
+            imageManager = SingleDiskImageManager(
+                TYPES_OF_DISK_IMAGE[typeOfArchive], archive
+            )
+            for side in imageManager.image.sides:
+                FileSystemController(side).initFileSystem()
+            pipeline.writeIntoDiskImage(files, imageManager.image)
+        else:
+            raise ValueError(f"error.unknown.type.of.archive:{archive}")
+        imageManager.save()
+
+    def buildManifest(self, manifestFile: str) -> int:
+        try:
+            manifest = BuildManifest.load(manifestFile)
+            written = ManifestBuilder(manifest, self._pipeline).build()
+        except (ValueError, OSError) as error:
+            print(f"Error : {error}")
+            return 1
+        if self.args.verbose:
+            for file in written:
+                print(file)
+        return 0
+
+    def run(self) -> int:
+        parser = createArgParser()
+        self.args = args = parser.parse_args()
+        if args.manifest is None and (args.archive is None or len(args.sources) == 0):
+            parser.error("either --manifest, or --into and source files, are required")
+        self._lineCache = (
+            TokenizedLineCache(args.cache) if args.cache is not None else None
+        )
+        self._pipeline = self.createPipeline()
+        if args.manifest is not None:
+            returnCode = self.buildManifest(args.manifest)
+            if self._lineCache is not None:
+                self._lineCache.save()
+            return returnCode
+        try:
+            files = self._pipeline.build(args.sources)
+            self.writeArchive(args.archive, files)
+        except (ValueError, OSError) as error:
+            print(f"Error : {error}")
+            return 1
+        if args.verbose:
+            for file in files:
+                print(
+                    f"{file.name}.{file.extension}"
+                    f"\t{file.typeOfFile.toStringForCatalog()}"
+                    f"\t{file.typeOfData.toStringForCatalog(file.typeOfFile)}"
+                    f"\t{len(file.data)} octets\t<-- {file.source}"
+                )
+        if self._lineCache is not None:
+            self._lineCache.save()
+        return 0
@@ -0,0 +1,226 @@
+"""
+Thin client of the daemon of MO/TO tools, running the tools locally when there is no daemon.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import importlib
+import json
+import os
+import socket
+import sys
+import tempfile
+
+# the tools that can be run, as `moto_<tool>`
+TOOLS = [
+    "bas2lst",
+    "build",
+    "conv",
+    "fdar",
+    "lst2bas",
+    "nl",
+    "prettier",
+    "sdar",
+    "tar",
+    "xref",
+]
+
+# arguments requiring the terminal of the client : reading the standard input, watching
+ARGUMENTS_TO_RUN_LOCALLY = ["-", "--watch"]
+
+# the tools reading the standard input when there is no source file, with their options
+# taking a value, to tell those values from the source files
+OPTIONS_WITH_VALUE_OF_FILTERS = {
+    "nl": [
+        "-i",
+        "--line-increment",
+        "-v",
+        "--starting-line-number",
+        "-w",
+        "--number-width",
+    ],
+    "prettier": [],
+    "xref": ["--indent"],
+}
+
+# environment variables of the client that are given to the daemon, e.g. MOTO_CACHE_DIR
+PREFIX_OF_FORWARDED_ENVIRONMENT = "MOTO_"
+
+
+def defaultSocketPath() -> str:
+    path = os.environ.get("MOTO_DAEMON_SOCKET")
+    if path:
+        return path
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    user = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    return os.path.join(directory, f"moto_daemon-{user}.sock")
+
+
+def mustRunLocally(tool: str, args: list[str]) -> bool:
+    """Tell whether a tool needs the terminal of the client, and cannot run into the daemon.
+
+    Returns:
+        bool: True when the tool reads the standard input or watches files.
+    """
+    if any(arg in ARGUMENTS_TO_RUN_LOCALLY for arg in args):
+        return True
+    if tool not in OPTIONS_WITH_VALUE_OF_FILTERS:
+        return False
+    optionsWithValue = OPTIONS_WITH_VALUE_OF_FILTERS[tool]
+    isValue = False
+    for i, arg in enumerate(args):
+        if isValue:
+            isValue = False
+        elif arg == "--":
+            return i == len(args) - 1
+        elif arg.startswith("-"):
+            isValue = arg in optionsWithValue
+        else:
+            return False  # a source file
+    return True
+
+
+def runTool(tool: str, args: list[str]) -> int:
+    """Run a tool in the current process, like its command line would.
+
+    Returns:
+        int: the exit code of the tool.
+    """
+    if tool not in TOOLS:
+        raise ValueError(f"error.unknown.tool:{tool}")
+    main = importlib.import_module(f"moto_{tool}.__main__").main
+    savedArgv = sys.argv
+    sys.argv = [f"moto_{tool}"] + args
+    try:
+        main()
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    finally:
+        sys.argv = savedArgv
+
+
+def sendMessage(stream, message: dict, payload: tuple[bytes] = ()):
+    """Send a json header on one line, followed by the given blocks of bytes."""
+    stream.write(b"".join([json.dumps(message).encode("utf-8"), b"\n", *payload]))
+    stream.flush()
+
+
+def receiveMessage(stream) -> dict:
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("error.daemon.connection.closed")
+    return json.loads(line)
+
+
+class DaemonClient:
+    """Send the command lines of the tools to a running daemon."""
+
+    def __init__(self, socketPath: str = None):
+        self._socketPath = socketPath if socketPath is not None else defaultSocketPath()
+
+    def request(self, message: dict) -> tuple[dict, bytes, bytes]:
+        """Send a request to the daemon.
+
+        Raises:
+            FileNotFoundError, ConnectionRefusedError: when there is no daemon listening on
+            the socket.
+
+        Returns:
+            tuple[dict, bytes, bytes]: the response, and the standard and error outputs.
+        """
+        if not hasattr(socket, "AF_UNIX"):  # e.g. windows, there is never a daemon
+            raise FileNotFoundError(
+                f"error.unix.socket.not.supported:{self._socketPath}"
+            )
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(self._socketPath)
+            with client.makefile("rwb") as stream:
+                sendMessage(stream, message)
+                response = receiveMessage(stream)
+                out = stream.read(response.get("sizeOfStdout", 0))
+                err = stream.read(response.get("sizeOfStderr", 0))
+        return response, out, err
+
+    def run(self, tool: str, args: list[str]) -> tuple[int, bytes, bytes]:
+        """Run a tool into the daemon, from the current directory and environment.
+
+        Returns:
+            tuple[int, bytes, bytes]: the exit code, and the standard and error outputs.
+        """
+        response, out, err = self.request(
+            {
+                "command": "run",
+                "tool": tool,
+                "args": args,
+                "cwd": os.getcwd(),
+                "encoding": sys.stdout.encoding or "utf-8",
+                "environment": {
+                    name: value
+                    for name, value in os.environ.items()
+                    if name.startswith(PREFIX_OF_FORWARDED_ENVIRONMENT)
+                },
+            }
+        )
+        return response["returnCode"], out, err
+
+    def stop(self):
+        self.request({"command": "stop"})
+
+
+USAGE = f"""usage: moto <tool> [<arguments>...]
+   or: python3 -m moto_client <tool> [<arguments>...]
+
+Run a tool of MO/TO tools, in the daemon when it is running, see moto_daemon.
+
+<tool> is one of : {', '.join(TOOLS)} ; 'moto <tool> --help' displays the help of a tool."""
+
+
+class ClientCli:
+    """`moto <tool> [args...]` : run the tool into the daemon, or locally when the daemon is
+    not running.
+
+    No argument parser there, it would be imported and built for nothing : the arguments are
+    given as is to the tool, and only the modules of the tool are imported.
+    """
+
+    def run(self) -> int:
+        if len(sys.argv) == 2 and sys.argv[1] in ["-h", "--help"]:
+            print(USAGE)
+            return 0
+        if len(sys.argv) < 2 or sys.argv[1] not in TOOLS:
+            print(USAGE, file=sys.stderr)
+            return 2
+        tool, args = sys.argv[1], sys.argv[2:]
+        if mustRunLocally(tool, args):
+            return runTool(tool, args)
+        try:
+            returnCode, out, err = DaemonClient().run(tool, args)
+        except (FileNotFoundError, ConnectionRefusedError):  # no daemon
+            returnCode = None
+        if returnCode is None:
+            return runTool(tool, args)
+        sys.stdout.buffer.write(out)
+        sys.stdout.flush()
+        sys.stderr.buffer.write(err)
+        sys.stderr.flush()
+        return returnCode
@@ -0,0 +1,164 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import os
+from argparse import ArgumentParser, RawDescriptionHelpFormatter
+
+from moto_lib.fs_convert import DiskToTapeConverter, TapeToDiskConverter
+from moto_lib.fs_disk.controller import FileSystemController
+from moto_lib.fs_disk.image import TypeOfDiskImage
+from moto_lib.fs_disk.image_manager import (
+    SingleDiskImageManager,
+    DiskImageFromDiskManager,
+)
+from moto_lib.fs_tape.image_manager import (
+    SingleTapeImageManager,
+    TapeImageFromDiskManager,
+)
+from moto_lib.fs_tape.listeners import (
+    TapeImageCliListener,
+    TapeImageCliListenerQuiet,
+    TapeImageCliListenerVerbose,
+)
+
+TYPES_OF_DISK_IMAGE = {
+    "fd": TypeOfDiskImage.EMULATOR_FLOPPY_IMAGE,
+    "sd": TypeOfDiskImage.SDDRIVE_FLOPPY_IMAGE,
+}
+
+
+def createArgParser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="python3 -m moto_conv",
+        description="Convert tape archives into disk archives, or disk archives into tape archives, usable with MO/TO computer emulators.",
+        epilog="""---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>. 
+---
+""",
+        formatter_class=RawDescriptionHelpFormatter,
+        allow_abbrev=False,
+    )
+
+    # Add the arguments
+    parser.add_argument(
+        "sources",
+        metavar="<source archive>",
+        type=str,
+        nargs="+",
+        help="a list of archives to convert, with the 'k7', 'sd' or 'fd' extension (case insensitive)",
+    )
+
+    parser.add_argument(
+        "--to",
+        dest="target",
+        choices=["k7", "sd", "fd"],
+        required=True,
+        help="The type of archive to convert into.",
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help=f"When present, each processed files is displayed in a tabulated format.",
+    )
+
+    parser.add_argument(
+        "--into",
+        metavar="<directory>",
+        help="Directory where converted archives will be generated.",
+    )
+
+    return parser
+
+
+class ArchiveConverterCli:
+    def createListener(self, verbose: bool) -> TapeImageCliListener:
+        return (
+            TapeImageCliListenerVerbose("Converting")
+            if verbose
+            else TapeImageCliListenerQuiet("Converting")
+        )
+
+    def convertTapeIntoDisk(self, source: str, target: str, targetType: str) -> int:
+        tapeManager = TapeImageFromDiskManager(source)
+        diskManager = SingleDiskImageManager(TYPES_OF_DISK_IMAGE[targetType], target)
+        for side in diskManager.image.sides:
+            FileSystemController(side).initFileSystem()
+        returnCode = TapeToDiskConverter().convert(
+            tapeManager.image, diskManager.image, self.createListener(self.args.verbose)
+        )
+        diskManager.save()
+        return returnCode
+
+    def convertDiskIntoTape(self, source: str, target: str, sourceType: str) -> int:
+        diskManager = DiskImageFromDiskManager(TYPES_OF_DISK_IMAGE[sourceType], source)
+        tapeManager = SingleTapeImageManager(target)
+        returnCode = DiskToTapeConverter().convert(
+            diskManager.image, tapeManager.image, self.createListener(self.args.verbose)
+        )
+        tapeManager.save()
+        return returnCode
+
+    def run(self) -> int:
+        self.args = args = createArgParser().parse_args()
+        targetType = args.target
+
+        returnCode = 0
+        for source in args.sources:
+            dotPos = source.rfind(".")
+            if dotPos < 0:
+                raise ValueError(f"error.file.name.must.have.extension:{source}")
+            sourceType = source[dotPos + 1 :].lower()
+            if sourceType not in ["k7", "sd", "fd"]:
+                raise ValueError(f"error.unknown.type.of.archive:{source}")
+
+            targetDir = args.into if args.into is not None else os.path.dirname(source)
+            target = os.path.join(
+                targetDir, f"{os.path.basename(source[:dotPos])}.{targetType}"
+            )
+
+            if sourceType == "k7" and targetType != "k7":
+                status = self.convertTapeIntoDisk(source, target, targetType)
+            elif sourceType != "k7" and targetType == "k7":
+                status = self.convertDiskIntoTape(source, target, sourceType)
+            else:
+                raise ValueError(
+                    f"error.unsupported.conversion:{sourceType}.to.{targetType}:{source}"
+                )
+            returnCode = returnCode if status == 0 else status
+
+        return returnCode
@@ -0,0 +1,261 @@
+"""
+Daemon of MO/TO tools, running the tools without paying the start of a process each time.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import importlib
+import io
+import os
+import socketserver
+import sys
+import time
+import traceback
+
+from argparse import ArgumentParser, RawDescriptionHelpFormatter
+from contextlib import redirect_stderr, redirect_stdout
+
+from moto_lib.file_cache import FileDataCache, useFileDataCache
+
+from moto_client.client import (
+    PREFIX_OF_FORWARDED_ENVIRONMENT,
+    TOOLS,
+    DaemonClient,
+    defaultSocketPath,
+    receiveMessage,
+    runTool,
+    sendMessage,
+)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            self.handleMessage(receiveMessage(self.rfile))
+        except (ConnectionError, ValueError):  # the client is gone, or is not a client
+            return
+
+    def handleMessage(self, message: dict):
+        command = message.get("command")
+        if command == "ping":
+            sendMessage(self.wfile, {"returnCode": 0})
+        elif command == "stop":
+            self.server.isStopping = True
+            sendMessage(self.wfile, {"returnCode": 0})
+        elif command == "run":
+            returnCode, out, err = self.server.runRequest(message)
+            sendMessage(
+                self.wfile,
+                {
+                    "returnCode": returnCode,
+                    "sizeOfStdout": len(out),
+                    "sizeOfStderr": len(err),
+                },
+                (out, err),
+            )
+        else:
+            error = f"error.unknown.command:{command}\n".encode("utf-8")
+            sendMessage(
+                self.wfile,
+                {"returnCode": 2, "sizeOfStdout": 0, "sizeOfStderr": len(error)},
+                (error,),
+            )
+
+
+class MotoDaemon(socketserver.UnixStreamServer):
+    """Serve the command lines of the tools on a unix socket, one at a time.
+
+    Requests are processed in turn because a tool works on the current directory, the
+    environment and the standard outputs of the process ; the modules of the tools are
+    imported once, and the images are read through a cache kept in memory.
+    """
+
+    request_queue_size = 64
+
+    def __init__(
+        self,
+        socketPath: str,
+        fileDataCache: FileDataCache = None,
+        verbose: bool = False,
+    ):
+        self._fileDataCache = (
+            fileDataCache if fileDataCache is not None else FileDataCache()
+        )
+        self._verbose = verbose
+        self.isStopping = False
+        MotoDaemon.removeStaleSocket(socketPath)
+        super().__init__(socketPath, _RequestHandler)
+        os.chmod(socketPath, 0o600)
+
+    @staticmethod
+    def removeStaleSocket(socketPath: str):
+        if not os.path.exists(socketPath):
+            return
+        try:
+            DaemonClient(socketPath).request({"command": "ping"})
+        except (FileNotFoundError, ConnectionRefusedError):
+            os.remove(socketPath)
+            return
+        raise ValueError(f"error.daemon.already.running:{socketPath}")
+
+    @staticmethod
+    def preload():
+        for tool in TOOLS:
+            importlib.import_module(f"moto_{tool}.__main__")
+
+    def serve(self):
+        """Serve requests until a stop request."""
+        useFileDataCache(self._fileDataCache)
+        try:
+            while not self.isStopping:
+                self.handle_request()
+        finally:
+            useFileDataCache(None)
+            self.server_close()
+            os.remove(self.server_address)
+
+    def runRequest(self, message: dict) -> tuple[int, bytes, bytes]:
+        """Run a tool from the directory and with the environment of the client.
+
+        Returns:
+            tuple[int, bytes, bytes]: the exit code, and the standard and error outputs.
+        """
+        encoding = message.get("encoding", "utf-8")
+        out = io.TextIOWrapper(io.BytesIO(), encoding=encoding, write_through=True)
+        err = io.TextIOWrapper(io.BytesIO(), encoding=encoding, write_through=True)
+        savedDirectory = os.getcwd()
+        savedEnvironment = {
+            name: value
+            for name, value in os.environ.items()
+            if name.startswith(PREFIX_OF_FORWARDED_ENVIRONMENT)
+        }
+        start = time.perf_counter()
+        try:
+            for name in savedEnvironment:
+                del os.environ[name]
+            os.environ.update(message.get("environment", {}))
+            os.chdir(message["cwd"])
+            with redirect_stdout(out), redirect_stderr(err):
+                try:
+                    returnCode = runTool(message["tool"], message.get("args", []))
+                except Exception:
+                    traceback.print_exc()
+                    returnCode = 1
+        finally:
+            os.chdir(savedDirectory)
+            for name in list(os.environ):
+                if name.startswith(PREFIX_OF_FORWARDED_ENVIRONMENT):
+                    del os.environ[name]
+            os.environ.update(savedEnvironment)
+        if self._verbose:
+            elapsed = (time.perf_counter() - start) * 1000
+            print(
+                f"moto_{message['tool']} {' '.join(message.get('args', []))}"
+                f"\t-> {returnCode}\t{elapsed:.1f} ms",
+                file=sys.stderr,
+            )
+        out.flush()
+        err.flush()
+        return returnCode, out.buffer.getvalue(), err.buffer.getvalue()
+
+
+def createArgParser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="python3 -m moto_daemon",
+        description="Keep the tools loaded into a process serving their command lines on a unix socket, for moto_client.",
+        epilog="""---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>. 
+---
+""",
+        formatter_class=RawDescriptionHelpFormatter,
+        allow_abbrev=False,
+    )
+
+    parser.add_argument(
+        "--socket",
+        metavar="<path>",
+        default=defaultSocketPath(),
+        help="the unix socket to listen to ; defaults to the environment variable"
+        " MOTO_DAEMON_SOCKET, or 'moto_daemon-<uid>.sock' in the runtime directory of the user.",
+    )
+    parser.add_argument(
+        "--memory",
+        metavar="<megabytes>",
+        type=int,
+        default=FileDataCache.DEFAULT_MAX_SIZE // (1024 * 1024),
+        help="the maximal size of the images kept in memory between requests ; defaults to"
+        f" {FileDataCache.DEFAULT_MAX_SIZE // (1024 * 1024)}.",
+    )
+    parser.add_argument(
+        "--stop",
+        action="store_true",
+        help="When present, stop the daemon listening to the socket.",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="When present, each request is reported on the error output, with its exit code"
+        " and its duration.",
+    )
+
+    return parser
+
+
+class DaemonCli:
+    def run(self) -> int:
+        args = createArgParser().parse_args()
+        if args.stop:
+            try:
+                DaemonClient(args.socket).stop()
+            except (FileNotFoundError, ConnectionRefusedError):
+                print(f"Error : no daemon listening to {args.socket}", file=sys.stderr)
+                return 1
+            return 0
+
+        MotoDaemon.preload()
+        try:
+            daemon = MotoDaemon(
+                args.socket, FileDataCache(args.memory * 1024 * 1024), args.verbose
+            )
+        except ValueError as e:
+            print(f"Error : {e}", file=sys.stderr)
+            return 1
+        if args.verbose:
+            print(f"moto_daemon : listening to {args.socket}", file=sys.stderr)
+        try:
+            daemon.serve()
+        except KeyboardInterrupt:
+            pass
+        return 0
@@ -20,10 +20,12 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
-from .fs_tape import *
-from .basic.tokenizer import *
+from .lazy import lazyExports
 
 __all__ = [
+    "ArchiveEntry",
+    "DiskArchive",
+    "TapeArchive",
     "TypeOfTapeBlock",
     "TapeBlock",
     "Tape",
@@ -32,3 +34,19 @@ __all__ = [
     "TokenizerPhase",
     "TokenizerPhaseAutomaton",
 ]
+
+__getattr__, __dir__ = lazyExports(
+    __name__,
+    {
+        "ArchiveEntry": ".archive",
+        "DiskArchive": ".archive",
+        "TapeArchive": ".archive",
+        "TypeOfTapeBlock": ".fs_tape",
+        "TapeBlock": ".fs_tape",
+        "Tape": ".fs_tape",
+        "LeaderTapeBlockDescriptor": ".fs_tape",
+        "TokenizerContext": ".basic.tokenizer",
+        "TokenizerPhase": ".basic.tokenizer",
+        "TokenizerPhaseAutomaton": ".basic.tokenizer",
+    },
+)
@@ -0,0 +1,384 @@
+"""
+Archives opened once, to list, read, write and delete files in memory, then save them.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import os
+
+from typing import Iterator
+
+from .fs_convert.converter import toDiskFileTypes, toTapeFileTypes
+from .fs_disk.catalog import TypeOfData, TypeOfDiskFile
+from .fs_disk.controller import FileSystemController, FileSystemUsage
+from .fs_disk.image import TypeOfDiskImage
+from .fs_disk.image_manager import DiskImageFromDiskManager, SingleDiskImageManager
+from .fs_disk.sides import replaceFileOnSides
+from .fs_tape.block_descriptor import LeaderTapeBlockDescriptor
+from .fs_tape.consts import TypeOfTapeBlock
+from .fs_tape.image_manager import SingleTapeImageManager, TapeImageFromDiskManager
+
+TYPES_OF_DISK_IMAGE = {
+    "fd": TypeOfDiskImage.EMULATOR_FLOPPY_IMAGE,
+    "sd": TypeOfDiskImage.SDDRIVE_FLOPPY_IMAGE,
+}
+
+# types of file and of data of a file written without explicit types, like with moto_sdar
+TYPES_BY_EXTENSION = {
+    "BAS": (TypeOfDiskFile.BASIC_PROGRAM, TypeOfData.BINARY_DATA),
+    "BIN": (TypeOfDiskFile.MACHINE_LANGUAGE_PROGRAM, TypeOfData.BINARY_DATA),
+    "TXT": (TypeOfDiskFile.TEXT_FILE, TypeOfData.ASCII_DATA),
+}
+TYPES_BY_NAME = {
+    "AUTO.BAT": (TypeOfDiskFile.BASIC_PROGRAM, TypeOfData.BINARY_DATA),
+}
+DEFAULT_TYPES = (TypeOfDiskFile.BASIC_DATA, TypeOfData.BINARY_DATA)
+
+
+def splitName(fullName: str) -> (str, str):
+    """Split `NAME.EXT` into the upper-cased name and extension of a file of an archive.
+
+    Raises:
+        ValueError: when the name is longer than 8 chars, or the extension than 3 chars.
+    """
+    name, _, extension = fullName.upper().rpartition(".")
+    if name == "":
+        name, extension = extension, ""
+    if len(name) > 8 or len(extension) > 3:
+        raise ValueError(f"error.file.name.too.long:{fullName}")
+    return name, extension
+
+
+def typesOf(
+    fullName: str, typeOfFile: TypeOfDiskFile = None, typeOfData: TypeOfData = None
+) -> (TypeOfDiskFile, TypeOfData):
+    """Complete the missing types of a file from its name."""
+    name, extension = splitName(fullName)
+    guessed = TYPES_BY_NAME.get(
+        f"{name}.{extension}", TYPES_BY_EXTENSION.get(extension, DEFAULT_TYPES)
+    )
+    return (
+        typeOfFile if typeOfFile is not None else guessed[0],
+        typeOfData if typeOfData is not None else guessed[1],
+    )
+
+
+class ArchiveEntry:
+    """A file of an archive."""
+
+    def __init__(
+        self,
+        name: str,
+        extension: str,
+        typeOfFile: TypeOfDiskFile,
+        typeOfData: TypeOfData,
+        size: int,
+        side: int = 0,
+    ):
+        self.name = name
+        self.extension = extension
+        self.typeOfFile = typeOfFile
+        self.typeOfData = typeOfData
+        self.size = size
+        self.side = side  # always 0 for a tape
+
+    @property
+    def fullName(self) -> str:
+        return f"{self.name}.{self.extension}" if self.extension else self.name
+
+    def toDict(self) -> dict[str, any]:
+        return {
+            "name": self.name,
+            "extension": self.extension,
+            "typeOfFile": self.typeOfFile.toStringForCatalog(),
+            "typeOfData": self.typeOfData.toStringForCatalog(self.typeOfFile),
+            "size": self.size,
+            "side": self.side,
+        }
+
+
+class DiskArchive:
+    """A disk archive (`*.sd` or `*.fd`) in memory, worked on without any listener.
+
+    ```python
+    archive = DiskArchive.open("game.sd")
+    for entry in archive.entries():
+        print(entry.side, entry.fullName, entry.size)
+    archive.write("LOADER.BAS", loader)  # replaced if it exists
+    archive.save()
+    ```
+    """
+
+    def __init__(self, imageManager: SingleDiskImageManager):
+        self._imageManager = imageManager
+        self._controllers = [
+            FileSystemController(side) for side in imageManager.image.sides
+        ]
+
+    @staticmethod
+    def typeOfDiskImageOf(path: str) -> TypeOfDiskImage:
+        extension = os.path.splitext(path)[1][1:].lower()
+        if extension not in TYPES_OF_DISK_IMAGE:
+            raise ValueError(f"error.file.name.extension.should.be.sd.or.fd:{path}")
+        return TYPES_OF_DISK_IMAGE[extension]
+
+    @staticmethod
+    def open(path: str) -> "DiskArchive":
+        """Load an existing disk archive, the type of archive is given by the extension."""
+        return DiskArchive(
+            DiskImageFromDiskManager(DiskArchive.typeOfDiskImageOf(path), path)
+        )
+
+    @staticmethod
+    def create(path: str) -> "DiskArchive":
+        """Create an empty disk archive in memory, written by `save()`."""
+        archive = DiskArchive(
+            SingleDiskImageManager(DiskArchive.typeOfDiskImageOf(path), path)
+        )
+        for controller in archive._controllers:
+            controller.initFileSystem()
+        return archive
+
+    @property
+    def countOfSides(self) -> int:
+        return len(self._controllers)
+
+    def _sides(self, side: int = None) -> list[int]:
+        if side is None:
+            return list(range(len(self._controllers)))
+        if side < 0 or side >= len(self._controllers):
+            raise ValueError(f"error.no.such.side:{side}")
+        return [side]
+
+    def entries(self, side: int = None) -> Iterator[ArchiveEntry]:
+        """Enumerate the files of one side, or of all the sides."""
+        for s in self._sides(side):
+            for entry in self._controllers[s].listFiles():
+                record = entry.record
+                fileDict = entry.toDict()
+                yield ArchiveEntry(
+                    fileDict["name"].rstrip(),
+                    fileDict["extension"].rstrip(),
+                    record.typeOfFile,
+                    record.typeOfData,
+                    fileDict["sizeInBytes"],
+                    s,
+                )
+
+    def find(self, fullName: str, side: int = None) -> ArchiveEntry:
+        """Find a file on one side, or on the first side having it.
+
+        Returns:
+            ArchiveEntry: the file, or None when not found.
+        """
+        name, extension = splitName(fullName)
+        for entry in self.entries(side):
+            if entry.name == name and entry.extension == extension:
+                return entry
+        return None
+
+    def read(self, fullName: str, side: int = None) -> bytes:
+        found = self.find(fullName, side)
+        if found is None:
+            raise ValueError(f"error.file.not.found:{fullName}")
+        controller = self._controllers[found.side]
+        return bytes(controller.readFile(controller.findFile(*splitName(fullName))))
+
+    def write(
+        self,
+        fullName: str,
+        data: bytes,
+        *,
+        typeOfFile: TypeOfDiskFile = None,
+        typeOfData: TypeOfData = None,
+        side: int = None,
+    ) -> ArchiveEntry:
+        """Write a file, replacing the file of the same name.
+
+        The file goes on the given side ; otherwise on the side of the replaced file, or else
+        on the first side with enough space. The types of file and of data are guessed from the
+        name when missing.
+
+        Raises:
+            DiskIsFullError: when there is not enough space ; a replaced file is then kept.
+        """
+        name, extension = splitName(fullName)
+        typeOfFile, typeOfData = typesOf(fullName, typeOfFile, typeOfData)
+        replaced = self.find(fullName, side)
+        s = replaceFileOnSides(
+            self._controllers,
+            data,
+            name,
+            extension,
+            typeOfFile=typeOfFile,
+            typeOfData=typeOfData,
+            sides=[replaced.side] if replaced is not None else self._sides(side),
+        )
+        return self.find(fullName, s)
+
+    def delete(self, fullName: str, side: int = None) -> bool:
+        """Delete a file from one side, or from the first side having it.
+
+        Returns:
+            bool: True when the file has been found and deleted.
+        """
+        found = self.find(fullName, side)
+        if found is None:
+            return False
+        return self._controllers[found.side].deleteFile(*splitName(fullName))
+
+    def usage(self, side: int) -> FileSystemUsage:
+        return self._controllers[self._sides(side)[0]].computeUsage()
+
+    def save(self):
+        self._imageManager.save()
+
+
+class TapeArchive:
+    """A tape archive (`*.k7`) in memory, as a sequence of files.
+
+    A modified tape is written again from its files when saved, like `moto_tar --create`
+    would do ; an unmodified tape is not written.
+
+    ```python
+    archive = TapeArchive.open("game.k7")
+    archive.delete("OLD.BAS")
+    archive.write("GAME.BIN", game)  # appended, or replaced at the same place
+    archive.save()
+    ```
+    """
+
+    def __init__(
+        self, path: str, files: list[(LeaderTapeBlockDescriptor, bytes)] = None
+    ):
+        self._path = path
+        self._files = list(files) if files is not None else []
+        self._isModified = False
+
+    @staticmethod
+    def open(path: str) -> "TapeArchive":
+        """Load the files of an existing tape archive ; a file without end of file block is
+        ignored."""
+        tape = TapeImageFromDiskManager(path).image
+        files = []
+        block = tape.nextBlock()
+        while block is not None:
+            if block.type == TypeOfTapeBlock.LEADER:
+                desc = LeaderTapeBlockDescriptor.buildFromTapeBlock(block.rawData)
+                fileContent = []  # initialize accumulator of views over the tape
+            elif block.type == TypeOfTapeBlock.EOF:
+                files.append((desc, b"".join(fileContent)))
+            else:
+                fileContent.append(block.body)
+            block = tape.nextBlock()
+        return TapeArchive(path, files)
+
+    @staticmethod
+    def create(path: str) -> "TapeArchive":
+        """Create an empty tape archive in memory, written by `save()`."""
+        archive = TapeArchive(path)
+        archive._isModified = True
+        return archive
+
+    def _indexOf(self, fullName: str) -> int:
+        name, extension = splitName(fullName)
+        for i, (desc, _) in enumerate(self._files):
+            if (
+                desc.fileName.upper() == name
+                and desc.fileExtension.upper() == extension
+            ):
+                return i
+        return -1
+
+    def entries(self) -> Iterator[ArchiveEntry]:
+        for desc, data in self._files:
+            typeOfFile, typeOfData = toDiskFileTypes(desc.fileType, desc.fileMode)
+            yield ArchiveEntry(
+                desc.fileName, desc.fileExtension, typeOfFile, typeOfData, len(data)
+            )
+
+    def find(self, fullName: str) -> ArchiveEntry:
+        """Find the first file of the given name.
+
+        Returns:
+            ArchiveEntry: the file, or None when not found.
+        """
+        index = self._indexOf(fullName)
+        return None if index < 0 else list(self.entries())[index]
+
+    def read(self, fullName: str) -> bytes:
+        index = self._indexOf(fullName)
+        if index < 0:
+            raise ValueError(f"error.file.not.found:{fullName}")
+        return self._files[index][1]
+
+    def write(
+        self,
+        fullName: str,
+        data: bytes,
+        *,
+        typeOfFile: TypeOfDiskFile = None,
+        typeOfData: TypeOfData = None,
+    ) -> ArchiveEntry:
+        """Write a file at the place of the file of the same name, or at the end of the tape.
+
+        The types of file and of data are guessed from the name when missing.
+        """
+        name, extension = splitName(fullName)
+        typeOfFile, typeOfData = typesOf(fullName, typeOfFile, typeOfData)
+        desc = LeaderTapeBlockDescriptor(
+            name, extension, *toTapeFileTypes(typeOfFile, typeOfData)
+        )
+        index = self._indexOf(fullName)
+        if index < 0:
+            self._files.append((desc, bytes(data)))
+        else:
+            self._files[index] = (desc, bytes(data))
+        self._isModified = True
+        return ArchiveEntry(name, extension, typeOfFile, typeOfData, len(data))
+
+    def delete(self, fullName: str) -> bool:
+        """Delete the first file of the given name.
+
+        Returns:
+            bool: True when the file has been found and deleted.
+        """
+        index = self._indexOf(fullName)
+        if index < 0:
+            return False
+        del self._files[index]
+        self._isModified = True
+        return True
+
+    def save(self, *, pack: bool = False):
+        """Write the tape again when modified.
+
+        Args:
+            pack (bool, optional): when True, the tape is not padded. Defaults to False.
+        """
+        if not self._isModified:
+            return
+        imageManager = SingleTapeImageManager(self._path)
+        tape = imageManager.image
+        for desc, data in self._files:
+            tape.writeFile(desc, data, extend=True)
+        if pack:
+            tape.trim()
+        imageManager.save()
+        self._isModified = False
@@ -0,0 +1,85 @@
+"""
+Options of the command line interfaces of the archive tools, without importing their implementation.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import os
+
+# the default maximal size of the cache of archives, in megabytes
+DEFAULT_SIZE_OF_ARCHIVE_CACHE = 256
+
+
+def addBatchArguments(parser, helpOfJobs: str = None):
+    """Add the options of the batch mode to a command line interface.
+
+    Args:
+        parser (ArgumentParser): the parser of the command line interface
+        helpOfJobs (str): the help of `--jobs`, for a tool also using it outside of the batch
+        mode
+    """
+    group = parser.add_argument_group("batch mode, when listing archives")
+    group.add_argument(
+        "--batch",
+        action="store_true",
+        help="When present, the designated archive is a directory, walked for archives ; the"
+        " files of each archive are written as a line of json (NDJSON), as soon as known.",
+    )
+    group.add_argument(
+        "-j",
+        "--jobs",
+        metavar="<count>",
+        type=int,
+        default=1,
+        help=helpOfJobs
+        or "with --batch, the count of processes listing archives in parallel ; defaults"
+        " to 1",
+    )
+    group.add_argument(
+        "--ordered",
+        action="store_true",
+        help="with --batch, the archives are written in the order of their paths, instead of"
+        " the order of completion.",
+    )
+
+
+def addArchiveCacheArguments(parser):
+    """Add the options of the cache of archives to a command line interface."""
+    group = parser.add_argument_group("cache of archives, when creating an archive")
+    group.add_argument(
+        "--cache-dir",
+        metavar="<directory>",
+        default=os.environ.get("MOTO_CACHE_DIR"),
+        help="a directory where created archives are kept, to be reused when the same sources"
+        " and options are given again ; defaults to the environment variable MOTO_CACHE_DIR.",
+    )
+    group.add_argument(
+        "--cache-size",
+        metavar="<megabytes>",
+        type=int,
+        default=DEFAULT_SIZE_OF_ARCHIVE_CACHE,
+        help="the maximal size of the cache, the least recently used archives are removed"
+        f" first ; defaults to {DEFAULT_SIZE_OF_ARCHIVE_CACHE}.",
+    )
+    group.add_argument(
+        "--cache-link",
+        action="store_true",
+        help="When present, an archive found in the cache is hard linked instead of copied ;"
+        " the archive MUST then not be modified in place.",
+    )
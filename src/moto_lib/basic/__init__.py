@@ -19,12 +19,35 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
-from .converter_from_listing import (
-    ListingToAsciiBasicConverter,
-    ListingToTokenizedBasicConverter,
-)
+from ..lazy import lazyExports
 
 __all__ = [
+    "AsciiBasicToListingConverter",
+    "BasicMemoryMapReport",
+    "LineNumbering",
+    "ListingAnalyzer",
     "ListingToAsciiBasicConverter",
     "ListingToTokenizedBasicConverter",
+    "Minifier",
+    "Renumbering",
+    "TokenizedBasicToListingConverter",
+    "TokenizedLineCache",
+    "readLines",
 ]
+
+__getattr__, __dir__ = lazyExports(
+    __name__,
+    {
+        "AsciiBasicToListingConverter": ".converter_to_listing",
+        "BasicMemoryMapReport": ".memory_map",
+        "LineNumbering": ".numbering",
+        "ListingAnalyzer": ".analyzer",
+        "ListingToAsciiBasicConverter": ".converter_from_listing",
+        "ListingToTokenizedBasicConverter": ".converter_from_listing",
+        "Minifier": ".minify",
+        "Renumbering": ".renumber",
+        "TokenizedBasicToListingConverter": ".converter_to_listing",
+        "TokenizedLineCache": ".line_cache",
+        "readLines": ".sources",
+    },
+)
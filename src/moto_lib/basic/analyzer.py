@@ -0,0 +1,206 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import re
+
+from typing import Iterable
+
+from .converter_from_listing import (
+    ListingToTokenizedBasicConverter,
+    basicTokensDb,
+    basicTokensMap,
+)
+from .renumber import findReferences
+from .scanner import TypeOfSegment, splitLine
+from .tokenizer import TokenizerEngine
+
+_NUMBERED_LINE = re.compile("^([1-9][0-9]*) ?(.*)$")
+
+# items of a DATA statement, separated by commas outside of string litterals
+_DATA_SEPARATOR = re.compile(r',(?=(?:[^"]*"[^"]*")*[^"]*$)')
+
+
+def _token(keyword: str) -> bytes:
+    value = basicTokensMap[keyword]
+    return bytes([value >> 8, value & 0xFF]) if value > 0xFF else bytes([value])
+
+
+# lexical elements of a tokenized line ; the keywords of two bytes are prefixed by 0xFF
+_LEXEMES = re.compile(
+    rb'(?P<litteral>"[^"]*"?)'
+    rb"|(?P<comment>[" + re.escape(_token("REM") + _token("'")) + rb"].*)"
+    rb"|(?P<data>" + re.escape(_token("DATA")) + rb'(?:"[^"]*"?|[^:"])*)'
+    rb"|(?P<keyword>\xff.|[\x80-\xfe])"
+    rb"|(?P<number>&[HO]?[0-9A-F]+|(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[ED]["
+    + re.escape(_token("+") + _token("-"))
+    + rb"]?[0-9]+)?)"
+    rb"|(?P<variable>[A-Z][A-Z0-9]*[$%!#]?)(?P<array> *\()?"
+    rb"|(?P<separator>:)"
+    rb"|(?P<open>\()"
+    rb"|(?P<close>\))",
+    re.DOTALL,
+)
+
+# after these keywords, a new statement starts
+_START_OF_STATEMENT = {_token("THEN"), _token("ELSE")}
+
+# after these keywords, each variable of the statement is assigned
+_ASSIGNING_STATEMENTS = {_token("FOR"), _token("READ"), _token("INPUT")}
+
+_EQUAL = _token("=")[0]
+
+# ends the variable of a FOR statement
+_TO = _token("TO")
+
+
+class ListingAnalyzer:
+    """Index a numbered listing in one pass : line numbers, references to line numbers, uses of
+    variables and DATA statements.
+
+    Variables are found in the tokenized lines, so that a name containing a keyword is seen as
+    the BASIC interpreter sees it ; arrays are suffixed by '()'. A variable is assigned when it
+    starts a statement and is followed by '=', or when it appears in a FOR, READ or INPUT
+    statement outside of the indexes of an array ; otherwise it is used.
+    """
+
+    def __init__(self):
+        self._tokenizer = TokenizerEngine(
+            basicTokensDb, ListingToTokenizedBasicConverter.SPECIAL_CHARS
+        )
+        self.reset()
+
+    def reset(self):
+        self._lines = []
+        self._jumps = {}  # target -> lines
+        self._variables = {}  # name -> {"assigned": lines, "used": lines}
+        self._data = []
+
+    def _addUse(self, name: str, kind: str, lineNumber: int):
+        uses = self._variables.setdefault(name, {"assigned": [], "used": []})[kind]
+        if not uses or uses[-1] != lineNumber:
+            uses.append(lineNumber)
+
+    def analyzeVariables(self, tokenized: bytes, lineNumber: int):
+        isStartOfStatement = True
+        isAssigning = False
+        depth = 0  # of parentheses
+        for match in _LEXEMES.finditer(tokenized):
+            kind = match.lastgroup
+            if kind == "array":
+                kind = "variable"
+            if kind == "open":
+                depth += 1
+            elif kind == "close":
+                depth = max(depth - 1, 0)
+            elif kind == "variable":
+                name = match.group("variable").decode("ascii")
+                if isStartOfStatement and name == "LET":
+                    continue
+                if match.group("array") is not None:
+                    name += "()"
+                if (isAssigning and depth == 0) or (
+                    isStartOfStatement and self._isFollowedByEqual(tokenized, match)
+                ):
+                    self._addUse(name, "assigned", lineNumber)
+                else:
+                    self._addUse(name, "used", lineNumber)
+                if match.group("array") is not None:
+                    depth += 1
+                isStartOfStatement = False
+            elif kind == "keyword":
+                keyword = match.group("keyword")
+                isStartOfStatement = keyword in _START_OF_STATEMENT
+                if keyword in _ASSIGNING_STATEMENTS:
+                    isAssigning = True
+                elif keyword == _TO or isStartOfStatement:
+                    isAssigning = False  # TO ends the FOR variable
+            elif kind == "separator":
+                isStartOfStatement = True
+                isAssigning = False
+                depth = 0
+            elif kind == "comment":
+                break
+
+    def _isFollowedByEqual(self, tokenized: bytes, match) -> bool:
+        position = match.end()
+        if match.group("array") is not None:  # skip the indexes
+            depth = 1
+            while position < len(tokenized) and depth > 0:
+                char = tokenized[position]
+                depth += 1 if char == 0x28 else -1 if char == 0x29 else 0
+                position += 1
+        while position < len(tokenized) and tokenized[position] == 0x20:
+            position += 1
+        return position < len(tokenized) and tokenized[position] == _EQUAL
+
+    def analyzeLine(self, lineNumber: int, text: str):
+        self._lines.append(lineNumber)
+        for target in findReferences(text):
+            lines = self._jumps.setdefault(target, [])
+            if not lines or lines[-1] != lineNumber:
+                lines.append(lineNumber)
+        for typeOfSegment, segment in splitLine(text):
+            if typeOfSegment == TypeOfSegment.DATA:
+                self._data.append(
+                    {
+                        "line": lineNumber,
+                        "values": [
+                            value.strip(" ")
+                            for value in _DATA_SEPARATOR.split(segment[len("DATA") :])
+                        ],
+                    }
+                )
+        self.analyzeVariables(self._tokenizer.tokenize(text), lineNumber)
+
+    def analyze(self, lines: Iterable[str]) -> dict:
+        """Analyze a numbered listing.
+
+        Returns:
+            dict: the index, that can be serialized into JSON : `lines`, `jumps` (the lines
+            referring to each line number), `danglingReferences` (references to missing lines),
+            `variables` (the lines assigning and using each variable) and `data` (the items of
+            each DATA statement).
+        """
+        self.reset()
+        for line in lines:
+            match = _NUMBERED_LINE.match(line.rstrip("\n"))
+            if match is None:
+                raise ValueError(f"No line number in this line : '{line}'")
+            self.analyzeLine(int(match.group(1)), match.group(2))
+
+        existingLines = set(self._lines)
+        return {
+            "lines": self._lines,
+            "jumps": {
+                f"{target}": lines for target, lines in sorted(self._jumps.items())
+            },
+            "danglingReferences": [
+                {"line": line, "target": target}
+                for target, lines in sorted(self._jumps.items())
+                if target not in existingLines
+                for line in lines
+            ],
+            "variables": {
+                name: self._variables[name] for name in sorted(self._variables)
+            },
+            "data": self._data,
+        }
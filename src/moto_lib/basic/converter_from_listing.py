@@ -21,7 +21,9 @@ If not, see <https://www.gnu.org/licenses/>.
 
 import re
 
-from .tokenizer import TokenizerContext
+from .line_cache import TokenizedLineCache
+from .scanner import splitLitterals
+from .tokenizer import TokenizerContext, TokenizerEngine
 
 
 basicTokensMap = {
@@ -183,20 +185,17 @@ basicTokensDb = {"map": basicTokensMap, "rules": {"requireColonIfNotBlank": ["EL
 
 litteralTokensDb = {}  # no tokenization in litterals
 
+# address of the first line of a program loaded by the BASIC of the MO5
+DEFAULT_LOAD_ADDRESS = 0x25A4
+
 
 class ListingToAsciiBasicConverter:
     def convert(self, f, bas):
+        """Convert the listing line by line, non ASCII chars are removed."""
         endOfLine = bytes([0xD])
-        lines = f.readlines()
-        lineOfCodeLength = 0
         bas.write(endOfLine)
-        for line in lines:
-            line = line.rstrip()
-            for car in line:
-                car = ord(car)
-                if car < 0x80:
-                    bas.write(bytes([car]))
-            bas.write(endOfLine)
+        for line in f:
+            bas.write(line.rstrip().encode("ascii", "ignore") + endOfLine)
 
 
 class ListingToTokenizedBasicConverter:
@@ -209,6 +208,22 @@ class ListingToTokenizedBasicConverter:
         " ",
     ]
 
+    def __init__(
+        self,
+        lineCache: TokenizedLineCache = None,
+        loadAddress: int = DEFAULT_LOAD_ADDRESS,
+    ):
+        """Initialize the converter.
+
+        Args:
+            lineCache (TokenizedLineCache, optional): when present, only the lines missing from
+            the cache are tokenized. Defaults to None.
+            loadAddress (int, optional): the address of the first line, from which the pointers
+            to the next lines are computed. Defaults to DEFAULT_LOAD_ADDRESS.
+        """
+        self._lineCache = lineCache
+        self._loadAddress = loadAddress
+
     def toUint16(self, value):
         return bytes([(value // 256) & 0xFF, value & 0xFF])
 
@@ -224,62 +239,81 @@ class ListingToTokenizedBasicConverter:
         return (lineNumber, line)
 
     def parseLine(self, line, tokenizer):
-        isInLiteralString = False
-        for char in line:
-            charBytes = bytes(char, "utf-8")
-            if char == '"':
+        for i, part in enumerate(splitLitterals(line)):
+            if i % 2 == 1:
+                # string litteral, with its quotes
+                isClosed = len(part) > 1 and part[-1] == '"'
                 tokenizer.commit()
-                isInLiteralString = not isInLiteralString
-                if isInLiteralString:
-                    tokenizer.appendAsLitteral(char)
-                else:
-                    tokenizer.appendAsToken(char)
+                tokenizer.appendAsLitteral('"')
                 tokenizer.commit()
+                for char in part[1:-1] if isClosed else part[1:]:
+                    tokenizer.appendAsLitteral(char)
+                if isClosed:
+                    tokenizer.commit()
+                    tokenizer.appendAsToken('"')
+                    tokenizer.commit()
                 continue
-            if isInLiteralString:
-                tokenizer.appendAsLitteral(char)
-                continue
-            if char in ListingToTokenizedBasicConverter.SPECIAL_CHARS:
+            for char in part:
+                if char in ListingToTokenizedBasicConverter.SPECIAL_CHARS:
+                    tokenizer.appendAsToken(char)
+                    tokenizer.commit()
+                    continue
+                # not in string litteral, convert to uppercase
+                char = char.upper()
                 tokenizer.appendAsToken(char)
-                tokenizer.commit()
-                continue
-            # not in string litteral, convert to uppercase
-            char = char.upper()
-            charBytes = bytes(char, "utf-8")
-            tokenizer.appendAsToken(char)
 
     def convert(self, f, bas):
-        lines = f.readlines()
-        header = bytearray()
-        body = bytearray()
-        pointerNext = 0x25A4
+        """Convert the listing line by line.
+
+        Line records are written as soon as they are tokenized, the length of the program is
+        then written into the header when the output is seekable ; otherwise, the program is
+        buffered until its length is known.
+        """
+        pointerNext = self._loadAddress
         zeroUint8 = bytes([0])
         zeroUint16 = bytes([0, 0])
 
+        if bas.seekable():
+            output = bas
+            startOfHeader = bas.tell()
+            bas.write(bytes([0xFF]) + zeroUint16)  # the length is written at the end
+        else:
+            output = bytearray()
+        bodyLength = 0
+
         # convert source line by line
-        tokenizer = TokenizerContext(basicTokensDb, litteralTokensDb)
-        for line in lines:
-            tokenizer.reset()
+        tokenizer = TokenizerEngine(
+            basicTokensDb, ListingToTokenizedBasicConverter.SPECIAL_CHARS
+        )
+        lineCache = self._lineCache
+        for line in f:
             # 1 -- extract the line number and the first space after
             (lineNumber, line) = self.extractLineParts(line)
 
-            # 2 -- parse the line
-            self.parseLine(line, tokenizer)
-
-            tokenizer.commit()
-            lineBuffer = tokenizer.doneBuffer
-            lineBuffer += zeroUint8
+            # 2 -- tokenize the line
+            lineBuffer = (
+                tokenizer.tokenize(line)
+                if lineCache is None
+                else lineCache.tokenize(line, tokenizer)
+            ) + zeroUint8
             pointerNext += len(lineBuffer) + 4
-            body += self.toUint16(pointerNext)
-            body += self.toUint16(lineNumber)
-            body += lineBuffer
-
-        # build header
-        body += zeroUint16
-        bodyLength = len(body)
-        header += bytes([0xFF])
-        header += self.toUint16(bodyLength)
+            record = self.toUint16(pointerNext) + self.toUint16(lineNumber) + lineBuffer
+            bodyLength += len(record)
+            if output is bas:
+                bas.write(record)
+            else:
+                output += record
 
-        # write to file
-        bas.write(header)
-        bas.write(body)
+        # end of program
+        bodyLength += len(zeroUint16)
+        header = bytes([0xFF]) + self.toUint16(bodyLength)
+        if output is bas:
+            bas.write(zeroUint16)
+            endOfBody = bas.tell()
+            bas.seek(startOfHeader)
+            bas.write(header)
+            bas.seek(endOfBody)
+        else:
+            bas.write(header)
+            bas.write(output)
+            bas.write(zeroUint16)
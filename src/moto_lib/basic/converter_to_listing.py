@@ -0,0 +1,113 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import re
+
+from .converter_from_listing import basicTokensDb
+
+
+def _buildTablesOfTokens(databaseOfTokens) -> (list[bytes], list[bytes]):
+    """Build the lookup tables to decode one byte tokens, and two bytes tokens prefixed by 0xFF.
+
+    Unknown tokens are decoded as themselves.
+    """
+    singleByteTokens = [bytes([i]) for i in range(256)]
+    prefixedTokens = [bytes([0xFF, i]) for i in range(256)]
+    for keyword, token in databaseOfTokens["map"].items():
+        if token > 0xFF:
+            prefixedTokens[token & 0xFF] = bytes(keyword, "utf-8")
+        else:
+            singleByteTokens[token] = bytes(keyword, "utf-8")
+    return (singleByteTokens, prefixedTokens)
+
+
+_SINGLE_BYTE_TOKENS, _PREFIXED_TOKENS = _buildTablesOfTokens(basicTokensDb)
+
+# the colon before the tokens that require one has been added by the tokenizer
+_COLON_BEFORE_TOKEN = {
+    basicTokensDb["map"][keyword]: bytes(keyword, "utf-8")
+    for keyword in basicTokensDb["rules"]["requireColonIfNotBlank"]
+}
+
+_TOKENS = re.compile(
+    b"\\xff[\\x80-\\xff]|:["
+    + b"".join(re.escape(bytes([t])) for t in _COLON_BEFORE_TOKEN)
+    + b"]|[\\x80-\\xff]"
+)
+
+
+def _decodeToken(match) -> bytes:
+    token = match.group(0)
+    if len(token) == 1:
+        return _SINGLE_BYTE_TOKENS[token[0]]
+    if token[0] == 0xFF:
+        return _PREFIXED_TOKENS[token[1]]
+    return _COLON_BEFORE_TOKEN[token[1]]
+
+
+class TokenizedBasicToListingConverter:
+    """Convert a tokenized BASIC program, as saved by MO/TO BASIC, into a listing.
+
+    The program is a 0xFF byte, the length of the program, then a sequence of line records : the
+    address of the next line record, the line number, the tokenized line, and a 0x00 byte. The
+    program ends with a null address.
+    """
+
+    def decodeLine(self, line: bytes) -> bytes:
+        """Decode the tokens of a line, except inside string litterals."""
+        parts = line.split(b'"')
+        for i in range(0, len(parts), 2):
+            parts[i] = _TOKENS.sub(_decodeToken, parts[i])
+        return b'"'.join(parts)
+
+    def decodeProgram(self, data: bytes, endOfLine: bytes = b"\n") -> bytes:
+        if len(data) < 3 or data[0] != 0xFF:
+            raise ValueError("error.not.tokenized.basic")
+        end = min(len(data), 3 + (data[1] << 8 | data[2]))
+        lines = []
+        position = 3
+        while position + 4 <= end:
+            if data[position] == 0 and data[position + 1] == 0:
+                break
+            lineNumber = data[position + 2] << 8 | data[position + 3]
+            position += 4
+            endOfTokens = data.find(b"\x00", position, end)
+            if endOfTokens == -1:
+                endOfTokens = end
+            tokens = data[position:endOfTokens]
+            lines.append(b"%d " % lineNumber + self.decodeLine(tokens))
+            position = endOfTokens + 1
+        lines.append(b"")
+        return endOfLine.join(lines)
+
+    def convert(self, data: bytes, lst, endOfLine: bytes = b"\n"):
+        lst.write(self.decodeProgram(data, endOfLine))
+
+
+class AsciiBasicToListingConverter:
+    """Convert a BASIC program saved in ASCII format into a listing, blank lines are removed."""
+
+    def convert(self, data: bytes, lst, endOfLine: bytes = b"\n"):
+        lines = [line for line in re.split(b"[\\r\\n]", data) if len(line) > 0]
+        if len(lines) > 0:
+            lines.append(b"")
+            lst.write(endOfLine.join(lines))
@@ -0,0 +1,100 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import hashlib
+import json
+
+from .tokenizer import TOKENIZER_VERSION, TokenizerEngine
+
+
+class TokenizedLineCache:
+    """Cache of tokenized lines, kept in a json file between runs.
+
+    Lines are identified by a hash of their text, without line number ; the lines used during
+    the run are merged into the saved lines, that are kept from the least to the most recently
+    used, so that the least recently used lines are dropped first when there are more than
+    `maxCountOfLines` lines. The cache is ignored when it has been written by another version
+    of the tokenizer.
+    """
+
+    DEFAULT_MAX_COUNT_OF_LINES = 50000
+
+    def __init__(
+        self, filePath: str, maxCountOfLines: int = DEFAULT_MAX_COUNT_OF_LINES
+    ):
+        self._filePath = filePath
+        self._maxCountOfLines = maxCountOfLines
+        self._savedLines = {}
+        self._usedLines = {}
+        self.load()
+
+    @staticmethod
+    def keyOf(line: str) -> str:
+        return hashlib.blake2b(line.encode("utf-8"), digest_size=16).hexdigest()
+
+    def load(self):
+        try:
+            with open(self._filePath, "rt") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == TOKENIZER_VERSION:
+            self._savedLines = data.get("lines", {})
+
+    def tokenize(self, line: str, tokenizer: TokenizerEngine) -> bytes:
+        """Get the tokenized line from the cache, or tokenize it."""
+        key = TokenizedLineCache.keyOf(line)
+        tokenized = self._usedLines.get(key)
+        if tokenized is None:
+            saved = self._savedLines.get(key)
+            tokenized = (
+                bytes.fromhex(saved) if saved is not None else tokenizer.tokenize(line)
+            )
+            self._usedLines[key] = tokenized
+        return tokenized
+
+    def popUsedLines(self) -> dict[str, bytes]:
+        """Get the lines used since the last call, e.g. to send them to another process."""
+        usedLines = self._usedLines
+        self._mergeUsedLines()
+        self._usedLines = {}
+        return usedLines
+
+    def addUsedLines(self, usedLines: dict[str, bytes]):
+        """Add lines used in another process, to be saved."""
+        self._usedLines.update(usedLines)
+
+    def _mergeUsedLines(self):
+        """Move the used lines at the end of the saved lines, as the most recently used ones."""
+        savedLines = self._savedLines
+        for key, value in self._usedLines.items():
+            savedLines.pop(key, None)
+            savedLines[key] = value.hex()
+
+    def save(self):
+        self._mergeUsedLines()
+        lines = self._savedLines
+        if len(lines) > self._maxCountOfLines:
+            lines = dict(list(lines.items())[len(lines) - self._maxCountOfLines :])
+            self._savedLines = lines
+        with open(self._filePath, "wt") as f:
+            json.dump({"version": TOKENIZER_VERSION, "lines": lines}, f)
@@ -0,0 +1,88 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+from .converter_from_listing import DEFAULT_LOAD_ADDRESS
+
+###
+# First address that a BASIC program cannot use, for each family of computers : the end of the
+# user RAM of the MO5 (0x2000-0x9FFF), and of the user RAM of the TO7-70 (0x8000-0xDFFF) ; the
+# free memory is an estimation, as the variables and the stack of BASIC also use it.
+#
+END_OF_MEMORY = {"MO5": 0xA000, "TO": 0xE000}
+
+
+class BasicMemoryMapReport:
+    """Addresses and sizes of the lines of a tokenized program once loaded, and estimation of
+    the memory left."""
+
+    def __init__(
+        self,
+        loadAddress: int,
+        lines: list[(int, int, int)],
+        sizeOfProgram: int,
+        endOfMemory: int,
+    ):
+        self.loadAddress = loadAddress
+        self.lines = lines  # (line number, address, size)
+        self.sizeOfProgram = sizeOfProgram
+        self.endOfMemory = endOfMemory
+
+    @property
+    def endAddress(self) -> int:
+        """The first address after the program."""
+        return self.loadAddress + self.sizeOfProgram
+
+    @property
+    def freeMemory(self) -> int:
+        """The count of bytes between the end of the program and the end of memory, negative
+        when the program does not fit."""
+        return self.endOfMemory - self.endAddress
+
+    @staticmethod
+    def buildFromProgram(
+        data: bytes,
+        loadAddress: int = DEFAULT_LOAD_ADDRESS,
+        endOfMemory: int = END_OF_MEMORY["MO5"],
+    ):
+        """Walk the line records of a tokenized program, with its header.
+
+        Each record is made of the pointer to the next record, the line number, the tokens and
+        a 0 ; the program ends with a null pointer, and is loaded without its header.
+        """
+        if len(data) < 5 or data[0] != 0xFF:
+            raise ValueError("error.not.tokenized.basic")
+        lines = []
+        position = 3
+        while position + 2 <= len(data) and (data[position] or data[position + 1]):
+            endOfRecord = data.find(b"\x00", position + 4)
+            if endOfRecord < 0:
+                raise ValueError(f"error.truncated.line.at:{position}")
+            size = endOfRecord + 1 - position
+            lines.append(
+                (
+                    data[position + 2] * 256 + data[position + 3],
+                    loadAddress + position - 3,
+                    size,
+                )
+            )
+            position += size
+        return BasicMemoryMapReport(loadAddress, lines, position + 2 - 3, endOfMemory)
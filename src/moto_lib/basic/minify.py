@@ -0,0 +1,152 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import re
+
+from typing import Iterable
+
+from .converter_from_listing import ListingToTokenizedBasicConverter, basicTokensDb
+from .renumber import findReferences
+from .scanner import TypeOfSegment, splitLine
+from .tokenizer import TokenizerEngine
+
+_NUMBERED_LINE = re.compile("^([1-9][0-9]*) ?(.*)$")
+
+# spaces that may be removed when the removal of all the spaces changes the tokens
+_SPACES_AROUND_PUNCTUATION = re.compile(r" *([,;:()=<>+\-*/^]) *")
+
+# a statement following an IF is conditional, no line can be merged after it
+_IF = re.compile("IF", re.IGNORECASE)
+
+# a comment following THEN or ELSE is kept, as it is the only statement of the branch
+_ENDS_WITH_BRANCH = re.compile("(THEN|ELSE) *$", re.IGNORECASE)
+
+
+class Minifier:
+    """Shrink a listing : remove the comments and the non significant spaces, then merge the
+    consecutive lines with ':' when no line number refers to them.
+
+    As the tokenizer depends on the spaces, a line is tokenized before and after the removal of
+    its spaces, the removal is kept only when the tokens are the same. String litterals and
+    DATA statements are kept as they are. A line containing IF, or ending inside a string
+    litteral, is never followed by a merged line, as the merged statements would become
+    conditional or part of the litteral.
+    """
+
+    MAX_LENGTH_OF_LINE = 255  # size of the line buffer of the BASIC editor
+
+    def __init__(self):
+        self._tokenizer = TokenizerEngine(
+            basicTokensDb, ListingToTokenizedBasicConverter.SPECIAL_CHARS
+        )
+
+    def extractLineParts(self, line: str) -> (int, str):
+        match = _NUMBERED_LINE.match(line.rstrip("\n"))
+        if match is None:
+            raise ValueError(f"No line number in this line : '{line}'")
+        return (int(match.group(1)), match.group(2))
+
+    def _significantTokens(self, code: str) -> bytes:
+        parts = self._tokenizer.tokenize(code).split(b'"')
+        for i in range(0, len(parts), 2):
+            parts[i] = parts[i].replace(b" ", b"")
+        return b'"'.join(parts)
+
+    def _removeSpaces(self, segments: list[(TypeOfSegment, str)], removal) -> str:
+        return "".join(
+            removal(text) if typeOfSegment == TypeOfSegment.CODE else text
+            for typeOfSegment, text in segments
+        ).strip(" ")
+
+    def minifyLine(self, line: str) -> str:
+        """Remove the comment and the non significant spaces of the text of a line, without its
+        line number ; the result may be empty."""
+        segments = splitLine(line)
+        if segments and segments[-1][0] == TypeOfSegment.COMMENT:
+            if len(segments) > 1 and _ENDS_WITH_BRANCH.search(segments[-2][1]):
+                return line.strip(" ")
+            segments.pop()
+            while segments and segments[-1][0] == TypeOfSegment.CODE:
+                code = segments[-1][1].rstrip(" :")
+                if code:
+                    segments[-1] = (TypeOfSegment.CODE, code)
+                    break
+                segments.pop()
+        code = self._removeSpaces(segments, lambda text: text)
+        expected = self._significantTokens(code)
+        for removal in [
+            lambda text: text.replace(" ", ""),
+            lambda text: _SPACES_AROUND_PUNCTUATION.sub(r"\1", text),
+        ]:
+            minified = self._removeSpaces(segments, removal)
+            if self._significantTokens(minified) == expected:
+                return minified
+        return code
+
+    def mayBeFollowed(self, code: str) -> bool:
+        """Tell whether a line may be followed by a merged line."""
+        return _IF.search(code) is None and code.count('"') % 2 == 0
+
+    def minify(self, lines: Iterable[str]) -> list[str]:
+        """Minify a numbered listing.
+
+        Returns:
+            list[str]: the numbered lines of the minified listing, without their end of line.
+        """
+        numberedLines = [self.extractLineParts(line) for line in lines]
+        targets = set()
+        for _, text in numberedLines:
+            targets.update(findReferences(text))
+
+        result = []
+        current = None  # [line number, code, may be followed by a merged line]
+        for lineNumber, text in numberedLines:
+            code = self.minifyLine(text)
+            if lineNumber not in targets and current is not None and current[2]:
+                if not current[1]:
+                    merged = code
+                elif not code:
+                    merged = current[1]
+                else:
+                    merged = f"{current[1]}:{code}"
+                if len(f"{current[0]} {merged}") <= self.MAX_LENGTH_OF_LINE:
+                    current[1] = merged
+                    current[2] = self.mayBeFollowed(merged)
+                    continue
+            elif lineNumber not in targets and not code:
+                continue  # nothing left of the line
+            if current is not None:
+                result.append(current)
+            current = [lineNumber, code, self.mayBeFollowed(code)]
+        if current is not None:
+            result.append(current)
+        return [
+            f"{lineNumber} {code if code else 'REM'}" for lineNumber, code, _ in result
+        ]
+
+    def sizeOfProgram(self, lines: Iterable[str]) -> int:
+        """Compute the size of the tokenized program of a numbered listing, with its header."""
+        size = 3 + 2  # header, end of program
+        for line in lines:
+            _, text = self.extractLineParts(line)
+            size += 4 + len(self._tokenizer.tokenize(text)) + 1
+        return size
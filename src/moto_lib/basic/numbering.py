@@ -0,0 +1,58 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import re
+
+_LINE_NUMBER = re.compile("^([1-9][0-9]*)")
+
+
+class LineNumbering:
+    """Number the lines without line number.
+
+    An already numbered line is left untouched, and is taken into account to number the next
+    line.
+    """
+
+    def __init__(self, start: int = 10, increment: int = 10, width: int = 0):
+        """Initialize the numbering.
+
+        Args:
+            start (int, optional): the number of the first line. Defaults to 10.
+            increment (int, optional): added to the number of a line to number the next line.
+            Defaults to 10.
+            width (int, optional): the number is padded with spaces to occupy the required
+            width. Defaults to 0.
+        """
+        self.nextNumber = start
+        self._increment = increment
+        self._width = width
+
+    def numberLine(self, line: str) -> str:
+        """Number the line, without its end of line."""
+        line = line.rstrip("\n")
+        match = _LINE_NUMBER.match(line)
+        if match is None:
+            paddedNumber = f"{self.nextNumber}".ljust(self._width)
+            self.nextNumber += self._increment
+            return f"{paddedNumber} {line}"
+        self.nextNumber = int(match.group(1)) + self._increment
+        return line
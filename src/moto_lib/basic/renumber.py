@@ -0,0 +1,121 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import re
+
+from typing import Iterable, Iterator
+
+from .scanner import TypeOfSegment, splitLine
+
+_LINE_NUMBER = re.compile("^([1-9][0-9]*)")
+
+# keyword followed by one or more line numbers
+_REFERENCES = re.compile(
+    r"(GO\s*TO|GO\s*SUB|THEN|ELSE|RESTORE|RESUME|RUN)(\s*)([0-9]+(?:\s*,\s*[0-9]+)*)",
+    re.IGNORECASE,
+)
+_NUMBER = re.compile("[0-9]+")
+
+# not a line number : ON ERROR GOTO 0 disables the error handler, RESUME 0 is RESUME
+NOT_A_LINE_NUMBER = 0
+
+
+def findReferences(line: str) -> Iterator[int]:
+    """Find the line numbers referenced by the text of a line, without its line number."""
+    for typeOfSegment, text in splitLine(line):
+        if typeOfSegment == TypeOfSegment.CODE:
+            for match in _REFERENCES.finditer(text):
+                for number in _NUMBER.findall(match.group(3)):
+                    if int(number) != NOT_A_LINE_NUMBER:
+                        yield int(number)
+
+
+class Renumbering:
+    """Renumber a listing, and rewrite the references to line numbers.
+
+    A first pass maps the old line numbers to the new ones, a second pass rewrites the
+    references following GOTO, GOSUB, THEN, ELSE, RESTORE, RESUME and RUN (including the lists
+    of ON ... GOTO/GOSUB), outside of string litterals, comments and DATA statements.
+    """
+
+    def __init__(self, start: int = 10, increment: int = 10, width: int = 0):
+        self._start = start
+        self._increment = increment
+        self._width = width
+        self.lineMap = {}
+        self.undefinedReferences = []  # (new line number, referenced line number)
+
+    def buildLineMap(self, lines: Iterable[str]) -> dict[int, int]:
+        self.lineMap = lineMap = {}
+        newNumber = self._start
+        for line in lines:
+            match = _LINE_NUMBER.match(line)
+            if match is not None:
+                lineMap[int(match.group(1))] = newNumber
+            newNumber += self._increment
+        return lineMap
+
+    def _rewriteReferences(self, code: str, lineNumber: int) -> str:
+        lineMap = self.lineMap
+
+        def rewriteNumber(match) -> str:
+            target = int(match.group(0))
+            if target == NOT_A_LINE_NUMBER:
+                return match.group(0)
+            if target in lineMap:
+                return f"{lineMap[target]}"
+            self.undefinedReferences.append((lineNumber, target))
+            return match.group(0)
+
+        def rewriteReference(match) -> str:
+            return (
+                match.group(1)
+                + match.group(2)
+                + _NUMBER.sub(rewriteNumber, match.group(3))
+            )
+
+        return _REFERENCES.sub(rewriteReference, code)
+
+    def rewriteLine(self, line: str, lineNumber: int) -> str:
+        """Rewrite the references of the text of a line, without its line number."""
+        return "".join(
+            (
+                self._rewriteReferences(text, lineNumber)
+                if typeOfSegment == TypeOfSegment.CODE
+                else text
+            )
+            for typeOfSegment, text in splitLine(line)
+        )
+
+    def renumber(self, lines: list[str]) -> Iterator[str]:
+        """Renumber the lines, without their end of line ; lines without number get one."""
+        self.buildLineMap(lines)
+        newNumber = self._start
+        for line in lines:
+            line = line.rstrip("\n")
+            match = _LINE_NUMBER.match(line)
+            if match is None:
+                text = f" {line}"
+            else:
+                text = line[match.end() :]
+            yield f"{newNumber}".ljust(self._width) + self.rewriteLine(text, newNumber)
+            newNumber += self._increment
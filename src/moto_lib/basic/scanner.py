@@ -0,0 +1,94 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import re
+
+from enum import Enum
+
+
+class TypeOfSegment(Enum):
+    CODE = 0
+    STRING_LITTERAL = 1  # including the quotes
+    COMMENT = 2  # from REM or ' to the end of the line
+    DATA = 3  # from DATA to the next statement
+
+
+# start of a string litteral, of a comment until the end of line, or of a DATA statement
+_NOT_CODE = re.compile("\"|REM|'|DATA", re.IGNORECASE)
+
+
+def splitLitterals(line: str) -> list[str]:
+    """Split a line into code and string litterals, by looking for the quotes with `str.find`.
+
+    Returns:
+        list[str]: the code and the string litterals, alternately, starting and ending with
+        code, that may be empty ; a string litteral includes its quotes, an unclosed string
+        litteral ends with the line.
+    """
+    result = []
+    position = 0
+    start = line.find('"')
+    while start >= 0:
+        end = line.find('"', start + 1)
+        end = len(line) if end == -1 else end + 1
+        result.append(line[position:start])
+        result.append(line[start:end])
+        position = end
+        start = line.find('"', position)
+    result.append(line[position:])
+    return result
+
+
+def splitLine(line: str) -> list[(TypeOfSegment, str)]:
+    """Split the text of a line, without line number, into segments of code and other text.
+
+    Returns:
+        list[(TypeOfSegment, str)]: the segments, the concatenation of the texts of the segments
+        is the line.
+    """
+    result = []
+    position = 0
+    length = len(line)
+    while position < length:
+        match = _NOT_CODE.search(line, position)
+        if match is None:
+            result.append((TypeOfSegment.CODE, line[position:]))
+            break
+        if match.start() > position:
+            result.append((TypeOfSegment.CODE, line[position : match.start()]))
+        token = match.group(0).upper()
+        if token == "REM" or token == "'":
+            result.append((TypeOfSegment.COMMENT, line[match.start() :]))
+            break
+        if token == '"':
+            end = line.find('"', match.end())
+            end = length if end == -1 else end + 1
+            result.append((TypeOfSegment.STRING_LITTERAL, line[match.start() : end]))
+        else:
+            end = match.end()
+            inLitteral = False
+            while end < length and (inLitteral or line[end] != ":"):
+                inLitteral = inLitteral != (line[end] == '"')
+                end += 1
+            result.append((TypeOfSegment.DATA, line[match.start() : end]))
+        position = end
+    return result
@@ -0,0 +1,42 @@
+"""
+Reading of the sources of the tools working on listings.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import sys
+
+from typing import Iterator
+
+
+def readLines(sources: list[str]) -> Iterator[str]:
+    """Stream the lines of the sources, one after the other.
+
+    Args:
+        sources (list[str]): the paths of the sources, a dash `-` designates the standard
+        input ; the standard input is read when there is no source.
+    """
+    if len(sources) == 0:
+        sources = ["-"]
+    for source in sources:
+        if source == "-":
+            yield from sys.stdin
+        else:
+            with open(source, "rt") as f:
+                yield from f
@@ -20,9 +20,17 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
+import re
+
 from enum import Enum
 from typing import List
 
+from .scanner import splitLitterals
+
+
+# to be increased each time the output of the tokenizer changes, to invalidate the caches
+TOKENIZER_VERSION = 1
+
 
 def toUint8(value):
     return bytes([value & 0xFF])
@@ -167,3 +175,122 @@ class TokenizerPhaseAutomaton:
                 self.phase = TokenizerPhase.DO_TOKENIZE
                 return True
         return False
+
+
+class KeywordTrie:
+    """Trie of the keywords of a database of tokens.
+
+    Each node is a dict mapping a character to the next node ; a node ending a keyword maps
+    `KeywordTrie.TOKEN` to the encoded token, and `KeywordTrie.TOKEN_AFTER_COLON` to the encoded
+    token prefixed by a colon when the keyword requires it.
+    """
+
+    TOKEN = 0
+    TOKEN_AFTER_COLON = 1
+
+    def __init__(self, databaseOfTokens):
+        self.root = {}
+        requireColon = databaseOfTokens["rules"]["requireColonIfNotBlank"]
+        for keyword, token in databaseOfTokens["map"].items():
+            node = self.root
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[KeywordTrie.TOKEN] = bytesFromUint(token)
+            node[KeywordTrie.TOKEN_AFTER_COLON] = (
+                toUint8(0x3A) + bytesFromUint(token)
+                if keyword in requireColon
+                else bytesFromUint(token)
+            )
+
+
+class TokenizerEngine:
+    """Tokenize a whole line, walking a keyword trie.
+
+    The output is the same as feeding a `TokenizerContext` with each character of the line
+    (`ListingToTokenizedBasicConverter.parseLine`). As the context is committed after each
+    special char and around string litterals, the line is split into segments ending with a
+    special char, each one is tokenized once and then found in a cache.
+    """
+
+    SIZE_OF_CACHE = 1 << 16
+
+    def __init__(self, databaseOfTokens, specialChars: List[str]):
+        self._trie = KeywordTrie(databaseOfTokens)
+        self._tokens = {
+            keyword: bytesFromUint(token)
+            for keyword, token in databaseOfTokens["map"].items()
+        }
+        self._specialChars = set(specialChars)
+        notSpecial = "".join(re.escape(c) for c in specialChars)
+        self._segments = re.compile(f"[^{notSpecial}]*[{notSpecial}]?")
+        self._cache = {}
+
+    def tokenize(self, line: str) -> bytes:
+        parts = splitLitterals(line)
+        for i in range(0, len(parts), 2):
+            parts[i] = self.tokenizeCode(parts[i])
+        for i in range(1, len(parts), 2):
+            parts[i] = parts[i].encode("utf-8")  # string litterals are kept as they are
+        return b"".join(parts)
+
+    def tokenizeCode(self, code: str) -> bytes:
+        """Tokenize a part of a line outside of string litterals."""
+        cache = self._cache
+        result = []
+        for segment in self._segments.findall(code):
+            tokenized = cache.get(segment)
+            if tokenized is None:
+                if len(cache) >= self.SIZE_OF_CACHE:
+                    cache.clear()
+                tokenized = cache[segment] = self.tokenizeSegment(segment)
+            result.append(tokenized)
+        return b"".join(result)
+
+    def tokenizeSegment(self, segment: str) -> bytes:
+        """Tokenize a sequence of chars ending with the only special char of the sequence."""
+        TOKEN = KeywordTrie.TOKEN
+        TOKEN_AFTER_COLON = KeywordTrie.TOKEN_AFTER_COLON
+        root = self._trie.root
+        tokens = self._tokens
+        specialChars = self._specialChars
+
+        done = bytearray()
+        candidate = b""
+        bucket = []
+        # node of the chars since the last commit, None when not a prefix
+        sequenceNode = root
+        bucketNode = root  # node of the chars of the bucket, None when not a prefix
+        for char in segment:
+            if char not in specialChars:
+                char = char.upper()
+
+            # same decisions as TokenizerContext.appendAsToken
+            for c in char:
+                if sequenceNode is None:
+                    break
+                sequenceNode = sequenceNode.get(c)
+            if sequenceNode is not None and TOKEN in sequenceNode:
+                candidate = sequenceNode[TOKEN_AFTER_COLON]
+                bucket = []
+                bucketNode = root
+            elif bucketNode is not None and TOKEN in bucketNode:
+                candidate = bucketNode[TOKEN]
+                bucket = []
+                bucketNode = root
+            elif char in tokens:
+                done += candidate
+                done += "".join(bucket).encode("utf-8")
+                done += tokens[char]
+                candidate = b""
+                bucket = []
+                sequenceNode = bucketNode = root
+            else:
+                bucket.append(char)
+                for c in char:
+                    if bucketNode is None:
+                        break
+                    bucketNode = bucketNode.get(c)
+
+        done += candidate
+        done += "".join(bucket).encode("utf-8")
+        return bytes(done)
@@ -0,0 +1,131 @@
+"""
+Batch processing of the archives of a directory tree.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import json
+import os
+import sys
+
+from typing import Iterator
+
+
+def findArchives(directory: str, extension: str) -> list[str]:
+    """Walk a directory tree for the archives having the extension (case insensitive).
+
+    Returns:
+        list[str]: the paths of the archives, sorted.
+    """
+    suffix = f".{extension.lower()}"
+    return sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(directory)
+        for name in names
+        if name.lower().endswith(suffix)
+    )
+
+
+def describeArchive(path: str) -> dict[str, any]:
+    """List the files of an archive, in a way that can be sent from a process to another.
+
+    Returns:
+        dict[str, any]: the path of the archive and its files ; or the path and an error.
+    """
+    # not imported with the module, the command line interfaces only need the arguments
+    from .archive import DiskArchive, TapeArchive
+
+    try:
+        archive = (
+            TapeArchive.open(path)
+            if path.lower().endswith(".k7")
+            else DiskArchive.open(path)
+        )
+        return {"archive": path, "files": [e.toDict() for e in archive.entries()]}
+    except Exception as e:  # a damaged archive must not stop the batch
+        return {"archive": path, "error": str(e) or type(e).__name__}
+
+
+class ArchiveBatch:
+    """List all the archives of a directory tree, with a bounded pool of processes.
+
+    The results are given in the order of completion, or in the order of the paths of the
+    archives when required.
+    """
+
+    # count of archives submitted to the pool or waiting to be given, by process
+    SIZE_OF_WINDOW_BY_JOB = 4
+
+    def __init__(
+        self, directory: str, extension: str, jobs: int = 1, ordered: bool = False
+    ):
+        self._directory = directory
+        self._extension = extension
+        self._jobs = jobs
+        self._ordered = ordered
+
+    def results(self) -> Iterator[dict[str, any]]:
+        paths = findArchives(self._directory, self._extension)
+        if self._jobs <= 1:
+            yield from map(describeArchive, paths)
+            return
+
+        # not imported with the module, it is slow and only needed with --jobs
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        sizeOfWindow = self._jobs * ArchiveBatch.SIZE_OF_WINDOW_BY_JOB
+        with ProcessPoolExecutor(max_workers=self._jobs) as executor:
+            pending = {}  # future -> index of the archive
+            ready = {}  # index of the archive -> result, waiting for its turn
+            countOfSubmitted = 0
+            countOfGiven = 0
+            while countOfGiven < len(paths):
+                while (
+                    countOfSubmitted < len(paths)
+                    and len(pending) + len(ready) < sizeOfWindow
+                ):
+                    future = executor.submit(describeArchive, paths[countOfSubmitted])
+                    pending[future] = countOfSubmitted
+                    countOfSubmitted += 1
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    if self._ordered:
+                        ready[index] = future.result()
+                    else:
+                        yield future.result()
+                        countOfGiven += 1
+                while countOfGiven in ready:
+                    yield ready.pop(countOfGiven)
+                    countOfGiven += 1
+
+    def run(self, output=None) -> int:
+        """Write each result as a line of json (NDJSON), as soon as it is known.
+
+        Returns:
+            int: 0 when all the archives have been listed, 1 otherwise.
+        """
+        output = output if output is not None else sys.stdout
+        returnCode = 0
+        for result in self.results():
+            if "error" in result:
+                returnCode = 1
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+        return returnCode
@@ -0,0 +1,44 @@
+"""
+Build of archives from sources, in one process.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+from ..lazy import lazyExports
+
+__all__ = [
+    "ArchiveCache",
+    "BuildManifest",
+    "BuildPipeline",
+    "BuiltFile",
+    "ManifestBuilder",
+    "ManifestEntry",
+]
+
+__getattr__, __dir__ = lazyExports(
+    __name__,
+    {
+        "ArchiveCache": ".cache",
+        "BuildManifest": ".manifest",
+        "BuildPipeline": ".pipeline",
+        "BuiltFile": ".pipeline",
+        "ManifestBuilder": ".manifest",
+        "ManifestEntry": ".manifest",
+    },
+)
@@ -0,0 +1,160 @@
+"""
+Content-addressed cache of generated archives.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from moto_lib.archive_options import DEFAULT_SIZE_OF_ARCHIVE_CACHE
+from moto_lib.basic.tokenizer import TOKENIZER_VERSION
+
+_toolVersion = None
+
+
+def toolVersion() -> str:
+    """The version of the installed tools, read on first use only, since importing
+    importlib.metadata is slower than the whole listing of an archive."""
+    global _toolVersion
+    if _toolVersion is None:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            _toolVersion = version("moto-tools-by-sporniket")
+        except PackageNotFoundError:  # running from the sources
+            _toolVersion = "unknown"
+    return _toolVersion
+
+
+class ArchiveCache:
+    """A directory of archives, named after a hash of everything used to generate them.
+
+    The key of an archive is a hash of the version of the tools, the type of archive, the
+    options, and the ordered sources with their names and contents ; an archive found in the
+    cache is copied, or hard linked, instead of being generated again. The least recently used
+    archives are removed when the total size of the cache is above its maximal size.
+    """
+
+    DEFAULT_MAX_SIZE = DEFAULT_SIZE_OF_ARCHIVE_CACHE * 1024 * 1024
+    EXTENSION = ".archive"
+
+    def __init__(
+        self, directory: str, maxSize: int = DEFAULT_MAX_SIZE, link: bool = False
+    ):
+        """Initialize the cache.
+
+        Args:
+            directory (str): the directory of the cache, created when missing.
+            maxSize (int, optional): the maximal total size of the archives, in bytes.
+            Defaults to DEFAULT_MAX_SIZE.
+            link (bool, optional): when True, an archive found in the cache is hard linked
+            instead of copied ; the archive MUST then not be modified in place. Defaults to
+            False.
+        """
+        self._directory = directory
+        self._maxSize = maxSize
+        self._link = link
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def keyOf(typeOfArchive: str, sources: list[str], options: dict) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(
+            json.dumps(
+                {
+                    "tool": toolVersion(),
+                    "tokenizer": TOKENIZER_VERSION,
+                    "type": typeOfArchive,
+                    "options": options,
+                    # only the names of the sources end up into the archive
+                    "sources": [os.path.basename(source) for source in sources],
+                },
+                sort_keys=True,
+            ).encode("utf-8")
+        )
+        for source in sources:
+            path = source[:-2] if source[-2:].upper() == ",A" else source
+            if not os.path.isfile(path):  # switches and missing files
+                digest.update((-1).to_bytes(8, "big", signed=True))
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            digest.update(len(data).to_bytes(8, "big", signed=True))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def pathOf(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}{self.EXTENSION}")
+
+    def fetch(self, key: str, target: str) -> bool:
+        """Put the archive of the key at the target path.
+
+        Returns:
+            bool: True when the archive was in the cache.
+        """
+        path = self.pathOf(key)
+        if not os.path.exists(path):
+            return False
+        if os.path.exists(target):
+            os.remove(target)
+        isLinked = False
+        if self._link:
+            try:
+                os.link(path, target)
+                isLinked = True
+            except OSError:  # e.g. not on the same file system
+                pass
+        if not isLinked:
+            shutil.copyfile(path, target)
+        os.utime(path)  # most recently used
+        return True
+
+    def store(self, key: str, archive: str):
+        """Copy a generated archive into the cache, then remove the least recently used
+        archives."""
+        handle, temporary = tempfile.mkstemp(dir=self._directory)
+        os.close(handle)
+        shutil.copyfile(archive, temporary)
+        os.replace(temporary, self.pathOf(key))
+        self.evict()
+
+    def evict(self):
+        entries = []
+        with os.scandir(self._directory) as it:
+            for entry in it:
+                if entry.name.endswith(self.EXTENSION):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        totalSize = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if totalSize <= self._maxSize:
+                break
+            os.remove(path)
+            totalSize -= size
+
+
+def createArchiveCache(args) -> ArchiveCache:
+    """Create the cache of archives required by the command line, or None."""
+    if args.cache_dir is None:
+        return None
+    return ArchiveCache(args.cache_dir, args.cache_size * 1024 * 1024, args.cache_link)
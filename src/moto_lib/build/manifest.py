@@ -0,0 +1,273 @@
+"""
+Declarative build of disk archives, rebuilt incrementally.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import hashlib
+import json
+import os
+
+try:
+    import tomllib
+except ImportError:  # before python 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+from moto_lib.basic.tokenizer import TOKENIZER_VERSION
+from moto_lib.fs_disk.controller import DiskIsFullError, FileSystemController
+from moto_lib.fs_disk.image import TypeOfDiskImage
+from moto_lib.fs_disk.image_manager import (
+    DiskImageFromDiskManager,
+    SingleDiskImageManager,
+)
+
+from .pipeline import BuildPipeline
+
+TYPES_OF_DISK_IMAGE = {
+    "FD": TypeOfDiskImage.EMULATOR_FLOPPY_IMAGE,
+    "SD": TypeOfDiskImage.SDDRIVE_FLOPPY_IMAGE,
+}
+
+# types of file of a manifest, as in the dispatch of DiskImageContentInjector
+TYPES_OF_FILE = ["BAS", "BAS,A", "BIN", "TXT", "AUTO.BAT", "DATA"]
+
+# default type of file for the extension of a source
+_TYPE_OF_EXTENSION = {"LST": "BAS", "BAS": "BAS", "BIN": "BIN", "TXT": "TXT"}
+
+# processor of the pipeline converting a listing into a type of file
+_PROCESSOR_OF_LISTING = {"BAS": "LST", "BAS,A": "LST,A", "AUTO.BAT": "LST"}
+
+
+class ManifestEntry:
+    """A file of a side of the disk archive."""
+
+    def __init__(self, source: str, typeOfFile: str, name: str = None):
+        self.source = source
+        self.typeOfFile = typeOfFile
+        self.name = "AUTO.BAT" if name is None and typeOfFile == "AUTO.BAT" else name
+
+    @property
+    def key(self) -> str:
+        """What identifies the file inside the archive, besides the content of the source."""
+        return f"{self.source}|{self.typeOfFile}|{self.name}"
+
+
+class BuildManifest:
+    """Description of a disk archive, read from a TOML file :
+
+    ```toml
+    archive = "game.sd"
+
+    [[sides]]
+    files = [
+        { source = "loader.lst", type = "AUTO.BAT" },
+        { source = "game.lst" },
+        { source = "sprites.bin", name = "SPRITES.BIN" },
+    ]
+    ```
+
+    Paths are relative to the directory of the manifest. The type of a file is one of
+    `TYPES_OF_FILE`, by default it is given by the extension of the source ; a listing (`lst`)
+    is converted into the type of file.
+    """
+
+    def __init__(self, archive: str, sides: list[list[ManifestEntry]], stateFile: str):
+        self.archive = archive
+        self.sides = sides
+        self.stateFile = stateFile
+
+    @staticmethod
+    def load(filePath: str):
+        if tomllib is None:
+            raise ValueError("error.toml.requires.python.3.11.or.tomli")
+        with open(filePath, "rb") as f:
+            data = tomllib.load(f)
+        baseDir = os.path.dirname(filePath)
+        if "archive" not in data:
+            raise ValueError(f"error.manifest.without.archive:{filePath}")
+        archive = os.path.join(baseDir, data["archive"])
+        sides = []
+        for side in data.get("sides", []):
+            entries = []
+            for file in side.get("files", []):
+                source = file["source"]
+                extension = source[source.rfind(".") + 1 :].upper()
+                typeOfFile = file.get(
+                    "type", _TYPE_OF_EXTENSION.get(extension, "DATA")
+                ).upper()
+                if typeOfFile not in TYPES_OF_FILE:
+                    raise ValueError(f"error.unknown.type.of.file:{typeOfFile}")
+                entries.append(
+                    ManifestEntry(
+                        os.path.join(baseDir, source), typeOfFile, file.get("name")
+                    )
+                )
+            sides.append(entries)
+        stateFile = os.path.join(baseDir, data.get("state", f"{data['archive']}.state"))
+        return BuildManifest(archive, sides, stateFile)
+
+
+class ManifestBuilder:
+    """Build the disk archive of a manifest, rebuilding only what changed.
+
+    The state of the last build is kept in a json file : for each file, the size, the time of
+    modification and a hash of its source. A file is rewritten when its source has another hash
+    (the source is read only when its size or time of modification changed) ; a side is rebuilt
+    from scratch when its list of files changed, or when a rewritten file does not fit.
+    """
+
+    STATE_VERSION = 1
+
+    def __init__(self, manifest: BuildManifest, pipeline: BuildPipeline = None):
+        self._manifest = manifest
+        self._pipeline = pipeline if pipeline is not None else BuildPipeline()
+        self._state = self.loadState()
+
+    def loadState(self) -> dict:
+        try:
+            with open(self._manifest.stateFile, "rt") as f:
+                state = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if (
+            isinstance(state, dict)
+            and state.get("version") == self.STATE_VERSION
+            and state.get("tokenizer") == TOKENIZER_VERSION
+        ):
+            return state
+        return {}
+
+    def saveState(self, sides: list[list[dict]]):
+        with open(self._manifest.stateFile, "wt") as f:
+            json.dump(
+                {
+                    "version": self.STATE_VERSION,
+                    "tokenizer": TOKENIZER_VERSION,
+                    "sides": sides,
+                },
+                f,
+            )
+
+    def processorOf(self, entry: ManifestEntry) -> str:
+        source = entry.source
+        if source[source.rfind(".") + 1 :].upper() == "LST":
+            return _PROCESSOR_OF_LISTING.get(entry.typeOfFile, "LST")
+        return entry.typeOfFile
+
+    def stateOf(self, entry: ManifestEntry, previous: dict) -> dict:
+        """Get the state of the source of a file, reading it only when it seems modified."""
+        stat = os.stat(entry.source)
+        state = {"key": entry.key, "size": stat.st_size, "mtime": stat.st_mtime_ns}
+        if (
+            previous is not None
+            and previous.get("size") == state["size"]
+            and previous.get("mtime") == state["mtime"]
+        ):
+            state["hash"] = previous["hash"]
+        else:
+            with open(entry.source, "rb") as f:
+                state["hash"] = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        return state
+
+    def writeEntry(self, controller: FileSystemController, entry: ManifestEntry) -> str:
+        file = self._pipeline.buildFile(
+            entry.source, self.processorOf(entry), entry.name
+        )
+        controller.deleteFile(file.name, file.extension)
+        controller.writeFile(
+            file.data,
+            file.name,
+            file.extension,
+            typeOfFile=file.typeOfFile,
+            typeOfData=file.typeOfData,
+        )
+        return f"{file.name}.{file.extension}"
+
+    def rebuildSide(self, controller: FileSystemController, entries) -> list[str]:
+        controller.initFileSystem()
+        return [self.writeEntry(controller, entry) for entry in entries]
+
+    def build(self) -> list[str]:
+        """Build or update the disk archive.
+
+        Returns:
+            list[str]: the files written, as `<side>:<name>.<extension>`, empty when the archive
+            was up to date.
+        """
+        manifest = self._manifest
+        archive = manifest.archive
+        extension = archive[archive.rfind(".") + 1 :].upper()
+        typeOfArchive = TYPES_OF_DISK_IMAGE.get(extension)
+        if typeOfArchive is None:
+            raise ValueError(f"error.unknown.type.of.archive:{archive}")
+        previousSides = self._state.get("sides", []) if os.path.exists(archive) else []
+
+        # compare the sources with the last build, before touching the archive
+        sides = []
+        for i, entries in enumerate(manifest.sides):
+            previousSide = previousSides[i] if i < len(previousSides) else []
+            previousStates = {state["key"]: state for state in previousSide}
+            sides.append(
+                [
+                    self.stateOf(entry, previousStates.get(entry.key))
+                    for entry in entries
+                ]
+            )
+        if sides == previousSides:
+            return []
+
+        isNewImage = len(previousSides) == 0
+        if isNewImage:
+            imageManager = SingleDiskImageManager(typeOfArchive, archive)
+        else:
+            imageManager = DiskImageFromDiskManager(typeOfArchive, archive)
+        image = imageManager.image
+        if len(manifest.sides) > len(image.sides):
+            raise ValueError(f"error.too.many.sides:{len(manifest.sides)}")
+        written = []
+        for i, side in enumerate(image.sides):
+            controller = FileSystemController(side)
+            entries = manifest.sides[i] if i < len(manifest.sides) else []
+            states = sides[i] if i < len(sides) else []
+            # a side missing from the manifest is left as is, once initialized
+            previousSide = previousSides[i] if i < len(previousSides) else []
+            if not isNewImage and previousSide == states:
+                continue
+            if isNewImage or [s["key"] for s in previousSide] != [
+                s["key"] for s in states
+            ]:
+                names = self.rebuildSide(controller, entries)
+            else:
+                changed = [
+                    entry
+                    for entry, state, previous in zip(entries, states, previousSide)
+                    if state["hash"] != previous["hash"]
+                ]
+                try:
+                    names = [self.writeEntry(controller, entry) for entry in changed]
+                except DiskIsFullError:
+                    # not enough place left by the previous version of the files
+                    names = self.rebuildSide(controller, entries)
+            written += [f"{i}:{name}" for name in names]
+        imageManager.save()
+        self.saveState(sides)
+        return written
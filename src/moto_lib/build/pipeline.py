@@ -0,0 +1,213 @@
+"""
+Build of archives from sources, in one process.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import io
+import os
+
+from moto_lib.basic import (
+    LineNumbering,
+    ListingToAsciiBasicConverter,
+    ListingToTokenizedBasicConverter,
+)
+from moto_lib.fs_convert import toTapeFileTypes
+from moto_lib.fs_disk.catalog import TypeOfData, TypeOfDiskFile
+from moto_lib.fs_disk.controller import FileSystemController
+from moto_lib.fs_disk.image import DiskImage
+from moto_lib.fs_disk.sides import sidesFrom, writeFileOnSides
+from moto_lib.fs_tape.block_descriptor import LeaderTapeBlockDescriptor
+from moto_lib.fs_tape.tape import Tape
+
+
+class BuiltFile:
+    """A file ready to be written into an archive."""
+
+    def __init__(
+        self,
+        source: str,
+        name: str,
+        extension: str,
+        typeOfFile: TypeOfDiskFile,
+        typeOfData: TypeOfData,
+        data: bytes,
+    ):
+        self.source = source
+        self.name = name
+        self.extension = extension
+        self.typeOfFile = typeOfFile
+        self.typeOfData = typeOfData
+        self.data = data
+
+
+class BuildPipeline:
+    """Convert sources into files in memory, then write them into a disk image or a tape.
+
+    The kind of a source is given by its extension (case insensitive) :
+
+    * `lst` : a listing, numbered like with moto_nl and tokenized into `<name>.BAS`.
+    * `lst,a` : a listing, numbered and converted into the ASCII basic file `<name>.BAS`.
+    * `bas`, `bas,a` : a tokenized or ASCII basic file.
+    * `bin` : a machine language program.
+    * `txt` : a text file.
+    * any other extension : a data file for basic.
+    """
+
+    def __init__(self, converter: ListingToTokenizedBasicConverter = None):
+        """Initialize the pipeline.
+
+        Args:
+            converter (ListingToTokenizedBasicConverter, optional): the converter to use, e.g.
+            with a line cache or another load address. Defaults to a new converter.
+        """
+        self._converter = (
+            converter if converter is not None else ListingToTokenizedBasicConverter()
+        )
+        # setup dispatching to processor according to file extension
+        self._defaultProcessor = self.processFileAsDataForBasic
+        self._processors = {
+            "LST": self.processListingIntoTokenizedBasic,
+            "LST,A": self.processListingIntoAsciiBasic,
+            "BAS": self.processFileAsTokenizedBasic,
+            "BAS,A": self.processFileAsAsciiBasic,
+            "BIN": self.processFileAsBinaryModule,
+            "TXT": self.processFileAsTxt,
+            "AUTO.BAT": self.processFileAsTokenizedBasic,
+        }
+
+    ##############################################
+    ### Conversion of the sources, in memory   ###
+    ##############################################
+
+    def numberListing(self, data: bytes) -> list[str]:
+        numbering = LineNumbering()
+        return [
+            f"{numbering.numberLine(line)}\n"
+            for line in data.decode("utf-8").splitlines()
+        ]
+
+    def processListingIntoTokenizedBasic(self, extension: str, data: bytes) -> tuple:
+        bas = io.BytesIO()
+        self._converter.convert(self.numberListing(data), bas)
+        return (
+            "BAS",
+            TypeOfDiskFile.BASIC_PROGRAM,
+            TypeOfData.BINARY_DATA,
+            bas.getvalue(),
+        )
+
+    def processListingIntoAsciiBasic(self, extension: str, data: bytes) -> tuple:
+        bas = io.BytesIO()
+        ListingToAsciiBasicConverter().convert(self.numberListing(data), bas)
+        return (
+            "BAS",
+            TypeOfDiskFile.BASIC_PROGRAM,
+            TypeOfData.ASCII_DATA,
+            bas.getvalue(),
+        )
+
+    def processFileAsTokenizedBasic(self, extension: str, data: bytes) -> tuple:
+        return ("BAS", TypeOfDiskFile.BASIC_PROGRAM, TypeOfData.BINARY_DATA, data)
+
+    def processFileAsAsciiBasic(self, extension: str, data: bytes) -> tuple:
+        return ("BAS", TypeOfDiskFile.BASIC_PROGRAM, TypeOfData.ASCII_DATA, data)
+
+    def processFileAsBinaryModule(self, extension: str, data: bytes) -> tuple:
+        return (
+            extension,
+            TypeOfDiskFile.MACHINE_LANGUAGE_PROGRAM,
+            TypeOfData.BINARY_DATA,
+            data,
+        )
+
+    def processFileAsTxt(self, extension: str, data: bytes) -> tuple:
+        return (extension, TypeOfDiskFile.TEXT_FILE, TypeOfData.ASCII_DATA, data)
+
+    def processFileAsDataForBasic(self, extension: str, data: bytes) -> tuple:
+        return (extension, TypeOfDiskFile.BASIC_DATA, TypeOfData.BINARY_DATA, data)
+
+    def readSource(self, path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    def buildFile(self, source: str, kind: str = None, name: str = None) -> BuiltFile:
+        """Convert a source into a file.
+
+        Args:
+            source (str): the path of the source, suffixed by ',a' for an ASCII basic file.
+            kind (str, optional): the key of the processor, e.g. 'LST' or 'AUTO.BAT'. Defaults
+            to the extension of the source.
+            name (str, optional): the name and extension of the file, e.g. 'AUTO.BAT'. Defaults
+            to the upper-cased base name of the source, truncated to 8 chars, with the
+            extension given by the processor.
+        """
+        path = source[:-2] if source[-2:].upper() == ",A" else source
+        baseName = os.path.basename(path).upper()
+        dotPos = baseName.rfind(".")
+        if dotPos < 0:
+            fileName, extension = baseName, ""
+        else:
+            fileName, extension = baseName[:dotPos], baseName[dotPos + 1 :]
+        if kind is None:
+            kind = f"{extension},A" if path != source else extension
+        processor = self._processors.get(kind, self._defaultProcessor)
+        extension, typeOfFile, typeOfData, data = processor(
+            extension, self.readSource(path)
+        )
+        if name is not None:
+            dotPos = name.rfind(".")
+            fileName, extension = (
+                (name, "") if dotPos < 0 else (name[:dotPos], name[dotPos + 1 :])
+            )
+        return BuiltFile(
+            source, fileName.upper()[:8], extension.upper(), typeOfFile, typeOfData, data
+        )
+
+    def build(self, sources: list[str]) -> list[BuiltFile]:
+        return [self.buildFile(source) for source in sources]
+
+    ##############################################
+    ### Writing of the files into an archive   ###
+    ##############################################
+
+    def writeIntoDiskImage(self, files: list[BuiltFile], image: DiskImage):
+        """Write the files into a formatted disk image, from the first side to the next sides
+        when a side is full."""
+        controllers = [FileSystemController(side) for side in image.sides]
+        currentSide = 0
+        for file in files:
+            currentSide = writeFileOnSides(
+                controllers,
+                file.data,
+                file.name,
+                file.extension,
+                typeOfFile=file.typeOfFile,
+                typeOfData=file.typeOfData,
+                sides=sidesFrom(currentSide, len(controllers)),
+            )
+
+    def writeIntoTape(self, files: list[BuiltFile], tape: Tape):
+        """Write the files at the current position of the tape, that is extended as needed."""
+        for file in files:
+            fileType, fileMode = toTapeFileTypes(file.typeOfFile, file.typeOfData)
+            leader = LeaderTapeBlockDescriptor(
+                file.name, file.extension, fileType, fileMode
+            )
+            tape.writeFile(leader, file.data, extend=True)
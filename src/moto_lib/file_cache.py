@@ -0,0 +1,99 @@
+"""
+Contents of files kept in memory between runs of the tools, in a long running process.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import os
+import time
+
+from collections import OrderedDict
+
+
+class FileDataCache:
+    """Contents of files, read again only when their inode, size, modification or change time
+    have changed.
+
+    Disk images have always the same size, and file systems with a coarse resolution of time
+    (FAT, NFS...) would not tell a file written twice in the same tick : a file modified less
+    than DELAY_OF_SETTLING ago is read but not kept.
+
+    The least recently read files are forgotten when the total size of the kept contents is
+    above the maximal size.
+    """
+
+    DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+    DELAY_OF_SETTLING = 1_000_000_000  # in nanoseconds
+
+    def __init__(self, maxSize: int = DEFAULT_MAX_SIZE):
+        self._maxSize = maxSize
+        self._files = OrderedDict()  # path -> (stamp, data)
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def read(self, path: str) -> bytes:
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        stamp = (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+        known = self._files.pop(path, None)
+        if known is not None:
+            self._size -= len(known[1])
+        if known is not None and known[0] == stamp:
+            data = known[1]
+        else:
+            with open(path, "rb") as f:
+                data = f.read()
+        if time.time_ns() - stat.st_mtime_ns < FileDataCache.DELAY_OF_SETTLING:
+            return data  # may be written again without changing the stamp
+        self._files[path] = (stamp, data)
+        self._size += len(data)
+        while self._size > self._maxSize and len(self._files) > 1:
+            _, (_, forgotten) = self._files.popitem(last=False)
+            self._size -= len(forgotten)
+        return data
+
+    def forget(self, path: str):
+        known = self._files.pop(os.path.abspath(path), None)
+        if known is not None:
+            self._size -= len(known[1])
+
+
+_sharedCache = None
+
+
+def useFileDataCache(cache: FileDataCache):
+    """Make the image managers read files through the given cache, or directly when None."""
+    global _sharedCache
+    _sharedCache = cache
+
+
+def readFileData(path: str) -> bytes:
+    if _sharedCache is None:
+        with open(path, "rb") as f:
+            return f.read()
+    return _sharedCache.read(path)
+
+
+def forgetFileData(path: str):
+    """To be called when a file is written."""
+    if _sharedCache is not None:
+        _sharedCache.forget(path)
@@ -0,0 +1,162 @@
+"""
+Conversion between file systems.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+from moto_lib.fs_disk.catalog import TypeOfData, TypeOfDiskFile
+from moto_lib.fs_disk.controller import DiskIsFullError, FileSystemController
+from moto_lib.fs_disk.image import DiskImage
+from moto_lib.fs_disk.sides import sidesFrom, writeFileOnSides
+from moto_lib.fs_tape.block_descriptor import LeaderTapeBlockDescriptor
+from moto_lib.fs_tape.consts import TypeOfTapeBlock
+from moto_lib.fs_tape.listeners import TapeImageCliListener
+from moto_lib.fs_tape.tape import Tape
+
+# Types of file in the leader block of a tape
+TAPE_FILE_TYPE_BASIC = 0
+TAPE_FILE_TYPE_DATA = 1
+TAPE_FILE_TYPE_BINARY = 2
+
+# Modes of file in the leader block of a tape
+TAPE_FILE_MODE_BINARY = 0
+TAPE_FILE_MODE_ASCII = 0xFFFF
+
+_TAPE_TO_DISK_FILE_TYPES = {
+    TAPE_FILE_TYPE_BASIC: TypeOfDiskFile.BASIC_PROGRAM,
+    TAPE_FILE_TYPE_DATA: TypeOfDiskFile.BASIC_DATA,
+    TAPE_FILE_TYPE_BINARY: TypeOfDiskFile.MACHINE_LANGUAGE_PROGRAM,
+}
+
+_DISK_TO_TAPE_FILE_TYPES = {
+    TypeOfDiskFile.BASIC_PROGRAM: TAPE_FILE_TYPE_BASIC,
+    TypeOfDiskFile.BASIC_DATA: TAPE_FILE_TYPE_DATA,
+    TypeOfDiskFile.MACHINE_LANGUAGE_PROGRAM: TAPE_FILE_TYPE_BINARY,
+    TypeOfDiskFile.TEXT_FILE: TAPE_FILE_TYPE_DATA,  # no text file on tape
+}
+
+
+def toDiskFileTypes(fileType: int, fileMode: int) -> (TypeOfDiskFile, TypeOfData):
+    """Map the type and mode of a file on tape to their equivalent on disk.
+
+    Args:
+        fileType (int): the type of file, as in the leader block.
+        fileMode (int): the mode of file, as in the leader block.
+
+    Returns:
+        (TypeOfDiskFile, TypeOfData): the type of file and the type of data.
+    """
+    return (
+        _TAPE_TO_DISK_FILE_TYPES.get(fileType, TypeOfDiskFile.BASIC_DATA),
+        (
+            TypeOfData.ASCII_DATA
+            if fileMode == TAPE_FILE_MODE_ASCII
+            else TypeOfData.BINARY_DATA
+        ),
+    )
+
+
+def toTapeFileTypes(typeOfFile: TypeOfDiskFile, typeOfData: TypeOfData) -> (int, int):
+    """Map the type of a file and of its data on disk to their equivalent on tape.
+
+    Args:
+        typeOfFile (TypeOfDiskFile): the type of file, as in the catalog.
+        typeOfData (TypeOfData): the type of data, as in the catalog.
+
+    Returns:
+        (int, int): the type and mode of file, for the leader block.
+    """
+    return (
+        _DISK_TO_TAPE_FILE_TYPES[typeOfFile],
+        (
+            TAPE_FILE_MODE_ASCII
+            if typeOfData == TypeOfData.ASCII_DATA
+            else TAPE_FILE_MODE_BINARY
+        ),
+    )
+
+
+class TapeToDiskConverter:
+    """Copy the files of a tape into a disk image, in memory.
+
+    Files are written into the first side, then into the next sides when a side is full ; a
+    file too big for the current side may still go into a previous side.
+    """
+
+    def convert(
+        self, tape: Tape, image: DiskImage, listener: TapeImageCliListener
+    ) -> int:
+        controllers = [FileSystemController(side) for side in image.sides]
+        currentSide = 0
+        block = tape.nextBlock()
+        while block is not None:
+            if block.type == TypeOfTapeBlock.LEADER:
+                desc = LeaderTapeBlockDescriptor.buildFromTapeBlock(block.rawData)
+                listener.onBeginFileBlock(desc)
+                fileContent = []  # initialize accumulator of views over the tape
+            elif block.type == TypeOfTapeBlock.EOF:
+                typeOfFile, typeOfData = toDiskFileTypes(desc.fileType, desc.fileMode)
+                try:
+                    currentSide = writeFileOnSides(
+                        controllers,
+                        b"".join(fileContent),
+                        desc.fileName,
+                        desc.fileExtension,
+                        typeOfFile=typeOfFile,
+                        typeOfData=typeOfData,
+                        sides=sidesFrom(currentSide, len(controllers)),
+                    )
+                except DiskIsFullError:
+                    listener.onError("disk image is full")
+                    return 1
+                listener.onEndBlock()
+            else:
+                listener.onDataBlock(block)
+                fileContent.append(block.body)
+            block = tape.nextBlock()
+        return 0
+
+
+class DiskToTapeConverter:
+    """Copy the files of all the sides of a disk image into a tape, in memory.
+
+    The tape is extended as needed.
+    """
+
+    def convert(
+        self, image: DiskImage, tape: Tape, listener: TapeImageCliListener
+    ) -> int:
+        for side in image.sides:
+            controller = FileSystemController(side)
+            for entry in controller.listFiles():
+                record = entry.record
+                fileDict = record.toDict()
+                fileType, fileMode = toTapeFileTypes(
+                    record.typeOfFile, record.typeOfData
+                )
+                desc = LeaderTapeBlockDescriptor(
+                    fileDict["name"].rstrip(),
+                    fileDict["extension"].rstrip(),
+                    fileType,
+                    fileMode,
+                )
+                tape.writeFile(
+                    desc, controller.readFile(entry), extend=True, listener=listener
+                )
+        return 0
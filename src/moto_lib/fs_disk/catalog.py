@@ -173,6 +173,14 @@ class CatalogEntryRecord:
     def firstBlock(self) -> int:
         return self._data[13]
 
+    @property
+    def typeOfFile(self) -> TypeOfDiskFile:
+        return TypeOfDiskFile.fromByte(self._data[11])
+
+    @property
+    def typeOfData(self) -> TypeOfData:
+        return TypeOfData.fromByte(self._data[12])
+
     def toBytes(self) -> bytes:
         return bytes(self._data + PADDING_OF_RECORD)
 
@@ -305,6 +313,10 @@ class CatalogEntry:
     def status(self) -> CatalogEntryStatus:
         return self._status
 
+    @property
+    def record(self) -> CatalogEntryRecord:
+        return self._data
+
     def toBytes(self) -> bytes:
         """Returns a 32 bytes sequence that can be put on an image disk."""
         if self._status == CatalogEntryStatus.NEVER_USED:
@@ -21,17 +21,13 @@ If not, see <https://www.gnu.org/licenses/>.
 
 from argparse import ArgumentParser, RawDescriptionHelpFormatter, FileType
 
+from moto_lib.archive_options import addArchiveCacheArguments, addBatchArguments
 from moto_lib.fs_disk.image import TypeOfDiskImage
 from moto_lib.fs_disk.image_manager import (
     SingleDiskImageManager,
     DiskImageFromDiskManager,
 )
-from moto_lib.fs_disk.image_worker import (
-    DiskImageContentEnumerator,
-    DiskImageContentExtractor,
-    DiskImageContentInjector,
-    DiskImageContentInjectorWithImageInitialization,
-)
+from moto_lib.fs_disk import image_worker
 from moto_lib.fs_disk.listener import (
     DiskImageCliListenerQuiet,
     DiskImageCliListenerVerbose,
@@ -132,6 +128,14 @@ If not, see <https://www.gnu.org/licenses/>. 
             help="Directory where output files will be generated.",
         )
 
+        addArchiveCacheArguments(parser)
+        addBatchArguments(
+            parser,
+            helpOfJobs="with --batch, the count of processes listing archives in parallel ;"
+            " with --extract, the count of threads extracting the sides of the archive in"
+            " parallel ; defaults to 1",
+        )
+
         return parser
 
     def __init__(
@@ -147,11 +151,12 @@ If not, see <https://www.gnu.org/licenses/>. 
             "extract": DiskImageFromDiskManager,
             "list": DiskImageFromDiskManager,
         }
+        # names of the workers, imported only for the requested action
         self._workers = {
-            "add": DiskImageContentInjector(typeOfArchive),
-            "create": DiskImageContentInjectorWithImageInitialization(typeOfArchive),
-            "extract": DiskImageContentExtractor(typeOfArchive),
-            "list": DiskImageContentEnumerator(typeOfArchive),
+            "add": "DiskImageContentInjector",
+            "create": "DiskImageContentInjectorWithImageInitialization",
+            "extract": "DiskImageContentExtractor",
+            "list": "DiskImageContentEnumerator",
         }
         self._typesOfProcessing = {
             "add": TypeOfDiskImageProcessing.UPDATING,
@@ -173,13 +178,26 @@ If not, see <https://www.gnu.org/licenses/>. 
             else DiskImageCliListenerQuiet(typeOfProcessing)
         )
 
+    def createWorker(self, action: str) -> "image_worker.DiskImageWorker":
+        return getattr(image_worker, self._workers[action])(self._typeOfArchive)
+
     def createImageManager(self, args) -> SingleDiskImageManager:
         if args.action not in self._imageManagers:
             raise RuntimeError(f"action.not.implemented.yet:{args.action}")
         return self._imageManagers[args.action](self._typeOfArchive, args.archive)
 
     def run(self) -> int:
-        args = self.createArgParser().parse_args()
+        parser = self.createArgParser()
+        args = parser.parse_args()
+        if args.batch:
+            if args.action != "list":
+                parser.error("--batch is only supported with --list")
+            from moto_lib.batch import ArchiveBatch
+
+            batch = ArchiveBatch(
+                args.archive, self._archiveExtension, args.jobs, args.ordered
+            )
+            return batch.run()
 
         listener = self.createListener(args)
 
@@ -198,5 +216,19 @@ If not, see <https://www.gnu.org/licenses/>. 
         if args.action not in self._workers:
             raise RuntimeError(f"action.not.implemented.yet:{args.action}")
 
-        self._workers[args.action].perform(args, imageManager, listener)
+        cache = None
+        if args.action == "create" and args.cache_dir is not None:
+            from moto_lib.build.cache import ArchiveCache, createArchiveCache
+
+            cache = createArchiveCache(args)
+            key = ArchiveCache.keyOf(self._archiveExtension, args.sources, {})
+            if cache.fetch(key, archive):
+                if args.verbose:
+                    print(f"{archive} : from the cache.")
+                return 0
+
+        # skipped sources are reported by the listener, and are not an error of the tool
+        status = self.createWorker(args.action).perform(args, imageManager, listener)
+        if cache is not None and status == 0:
+            cache.store(key, archive)
         return 0
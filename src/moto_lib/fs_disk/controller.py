@@ -22,6 +22,8 @@ If not, see <https://www.gnu.org/licenses/>.
 
 from .image import DiskSide
 from .catalog import (
+    SIZE_OF_ENTRY_EXTENSION,
+    SIZE_OF_ENTRY_NAME,
     CatalogEntry,
     CatalogEntryRecord,
     CatalogEntryStatus,
@@ -53,6 +55,10 @@ def _batToBytes(bat: list[BlockAllocation]) -> bytes:
     return bytes(result)
 
 
+class DiskIsFullError(ValueError):
+    """Not enough free blocks or catalog entries to write a file."""
+
+
 class FileSystemUsage:
     def __init__(self, used: int, reserved: int, free: int):
         self.used = used
@@ -170,7 +176,7 @@ class FileSystemController:
 
         batBlocks = [b for b in bat if b.isFree()][:requiredBlockLength]
         if len(batBlocks) < requiredBlockLength:
-            raise ValueError(
+            raise DiskIsFullError(
                 f"not.enough.blocks:require.{requiredBlockLength}:got.{len(batBlocks)}"
             )
 
@@ -235,7 +241,52 @@ class FileSystemController:
             for b in batBlocks:
                 b.setFree()
             self._bat = bat
-            raise ValueError("no.more.space.in.catalog")
+            raise DiskIsFullError("no.more.space.in.catalog")
+
+    def _findEntry(self, name: str, extension: str) -> (int, int, CatalogEntry):
+        """Find the alive catalog entry of a file.
+
+        Returns:
+            (int, int, CatalogEntry): the catalog sector, the start of the entry inside the
+            sector, and the entry ; or None if the file is not found.
+        """
+        bat = self._bat
+        nameAndExtension = CatalogEntryRecord._bytesFromStr(
+            name.upper(), SIZE_OF_ENTRY_NAME
+        ) + CatalogEntryRecord._bytesFromStr(extension.upper(), SIZE_OF_ENTRY_EXTENSION)
+        for s in range(2, 16):  # catalog is from sector 2 to 15 of track 20
+            catSector = self._diskSide.tracks[20].sectors[s].dataOfPayload
+            for start in range(0, 256, 32):  # a catalog entry every 32 bytes
+                if catSector[start : start + 11] != nameAndExtension:
+                    continue
+                entry = CatalogEntry.fromBytes(catSector[start : start + 32], bat)
+                if entry.status == CatalogEntryStatus.ALIVE:
+                    return (s, start, entry)
+        return None
+
+    def findFile(self, name: str, extension: str) -> CatalogEntry or None:
+        found = self._findEntry(name, extension)
+        return found[2] if found is not None else None
+
+    def deleteFile(self, name: str, extension: str) -> bool:
+        """Mark the catalog entry of the file as deleted, and free its blocks.
+
+        Returns:
+            bool: True if the file has been found and deleted.
+        """
+        found = self._findEntry(name, extension)
+        if found is None:
+            return False
+        s, start, entry = found
+        bat = self._bat
+        for b in entry.toUsageDict()["blocks"]:
+            bat[b].setFree()
+        self._bat = bat
+        entry.markAsDeleted()
+        catSector = bytearray(self._diskSide.tracks[20].sectors[s].dataOfPayload)
+        catSector[start : start + 32] = entry.toBytes()
+        self._diskSide.tracks[20].sectors[s].dataOfPayload = catSector
+        return True
 
     def initFileSystem(self):
         # reset bat
@@ -20,6 +20,7 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
+from ..file_cache import forgetFileData, readFileData
 from .image import DiskImage, TypeOfDiskImage
 
 
@@ -61,6 +62,7 @@ class SingleDiskImageManager:
         return self._image
 
     def save(self):
+        forgetFileData(self._filePath)
         with open(self._filePath, "wb") as f:
             for s in self._image.sides:
                 for t in s.tracks:
@@ -70,5 +72,6 @@ class SingleDiskImageManager:
 
 class DiskImageFromDiskManager(SingleDiskImageManager):
     def prepareImage(self):
-        with open(self._filePath, "rb") as f:
-            self._image = DiskImage(f.read(), typeOfDiskImage=self._typeOfDiskImage)
+        self._image = DiskImage(
+            readFileData(self._filePath), typeOfDiskImage=self._typeOfDiskImage
+        )
@@ -20,17 +20,23 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
-from .base import DiskImageWorker
-from .content_enumerator import DiskImageContentEnumerator
-from .content_extractor import DiskImageContentExtractor
-from .content_injector import (
-    DiskImageContentInjector,
-    DiskImageContentInjectorWithImageInitialization,
-)
+from ...lazy import lazyExports
 
 __all__ = [
     "DiskImageContentEnumerator",
     "DiskImageContentExtractor",
     "DiskImageContentInjector",
     "DiskImageContentInjectorWithImageInitialization",
+    "DiskImageWorker",
 ]
+
+__getattr__, __dir__ = lazyExports(
+    __name__,
+    {
+        "DiskImageContentEnumerator": ".content_enumerator",
+        "DiskImageContentExtractor": ".content_extractor",
+        "DiskImageContentInjector": ".content_injector",
+        "DiskImageContentInjectorWithImageInitialization": ".content_injector",
+        "DiskImageWorker": ".base",
+    },
+)
@@ -40,5 +40,5 @@ class DiskImageWorker:
         args,
         imageManager: SingleDiskImageManager,
         listener: DiskImageCliListener,
-    ):
-        pass
+    ) -> int:
+        return 0
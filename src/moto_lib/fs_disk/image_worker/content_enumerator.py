@@ -39,7 +39,7 @@ class DiskImageContentEnumerator(DiskImageWorker):
         args,
         imageManager: SingleDiskImageManager,
         listener: DiskImageCliListener,
-    ):
+    ) -> int:
         image = imageManager.image
         for i, side in enumerate(image.sides):
             listener.onBeginOfSide(i)
@@ -50,3 +50,4 @@ class DiskImageContentEnumerator(DiskImageWorker):
                 listener.onEndOfFile(file)
             listener.onEndOfSide(controller.computeUsage())
         listener.onDone()
+        return 0
@@ -22,6 +22,8 @@ If not, see <https://www.gnu.org/licenses/>.
 
 import os
 
+from queue import SimpleQueue
+
 from .base import DiskImageWorker
 
 from ..image import TypeOfDiskImage
@@ -30,16 +32,103 @@ from ..listener import DiskImageCliListener
 from ..controller import FileSystemController
 
 
+class _SideEventsRecorder:
+    """Stand-in listener of a side extracted in a thread, queuing its events."""
+
+    def __init__(self, indexOfSide: int, events: SimpleQueue):
+        self._indexOfSide = indexOfSide
+        self._events = events
+
+    def onBeginOfSide(self, sidenumber: int):
+        self._events.put((self._indexOfSide, "onBeginOfSide", sidenumber))
+
+    def onBeginOfFile(self, data: dict[str, any]):
+        self._events.put((self._indexOfSide, "onBeginOfFile", data))
+
+    def onEndOfFile(self, data: dict[str, any]):
+        self._events.put((self._indexOfSide, "onEndOfFile", data))
+
+    def onEndOfSide(self, usage):
+        self._events.put((self._indexOfSide, "onEndOfSide", usage))
+
+
 class DiskImageContentExtractor(DiskImageWorker):
     def __init__(self, typeOfDiskImage: TypeOfDiskImage):
         super().__init__(typeOfDiskImage)
 
+    def extractSide(self, indexOfSide: int, side, targetDir: str, listener):
+        listener.onBeginOfSide(indexOfSide)
+        sidePath = os.path.join(targetDir, f"side{indexOfSide}")
+        os.makedirs(sidePath)
+        controller = FileSystemController(side)
+        for entry in controller.listFiles():
+            file = entry.toDict()
+            listener.onBeginOfFile(file)
+            extractedFileName = file["name"].rstrip() + "." + file["extension"].rstrip()
+            data = controller.readFile(entry)
+            with open(os.path.join(sidePath, extractedFileName), "wb") as outf:
+                outf.write(data)
+            listener.onEndOfFile(file)
+        listener.onEndOfSide(controller.computeUsage())
+
+    def extractSidesInParallel(
+        self, sides: list, targetDir: str, listener: DiskImageCliListener, jobs: int
+    ):
+        """Extract each side in a thread, the work being mostly file i/o.
+
+        The events of the sides are queued, and replayed to the listener side after side,
+        so that the output is the same as when extracting serially ; when a side fails, the
+        events of the other sides, that are extracted anyway, are replayed before raising its
+        error.
+        """
+        # not imported with the module, it is slow and only needed with --jobs
+        from concurrent.futures import ThreadPoolExecutor
+
+        events = SimpleQueue()
+        pendingEvents = [[] for _ in sides]
+        isSideDone = [False for _ in sides]
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(
+                    self.extractSide, i, side, targetDir, _SideEventsRecorder(i, events)
+                )
+                for i, side in enumerate(sides)
+            ]
+            # a side that fails does not send its end of side, wait for all of them
+            for future in futures:
+                future.add_done_callback(lambda _: events.put(None))
+            indexOfReplayedSide = 0
+            countOfRunningSides = len(sides)
+            while countOfRunningSides > 0:
+                event = events.get()
+                if event is None:
+                    countOfRunningSides -= 1
+                    continue
+                indexOfSide, name, data = event
+                pendingEvents[indexOfSide].append((name, data))
+                if name == "onEndOfSide":
+                    isSideDone[indexOfSide] = True
+                # the current side is streamed, the next ones wait for their turn
+                while indexOfReplayedSide < len(sides):
+                    for name, data in pendingEvents[indexOfReplayedSide]:
+                        getattr(listener, name)(data)
+                    pendingEvents[indexOfReplayedSide] = []
+                    if not isSideDone[indexOfReplayedSide]:
+                        break
+                    indexOfReplayedSide += 1
+            # after a failed side, that has no end of side, the next sides are still pending
+            for pending in pendingEvents[indexOfReplayedSide:]:
+                for name, data in pending:
+                    getattr(listener, name)(data)
+            for future in futures:
+                future.result()  # raises the error of a failed side, if any
+
     def perform(
         self,
         args,
         imageManager: SingleDiskImageManager,
         listener: DiskImageCliListener,
-    ):
+    ) -> int:
         hasTargetDirectory = args.into is not None
         if args.into is not None:
             print(f"has into : {args.into}")
@@ -48,20 +137,10 @@ class DiskImageContentExtractor(DiskImageWorker):
         targetDir = args.into if hasTargetDirectory else os.path.dirname(args.archive)
         image = imageManager.image
 
-        for i, side in enumerate(image.sides):
-            listener.onBeginOfSide(i)
-            sidePath = os.path.join(targetDir, f"side{i}")
-            os.makedirs(sidePath)
-            controller = FileSystemController(side)
-            for entry in controller.listFiles():
-                file = entry.toDict()
-                listener.onBeginOfFile(file)
-                extractedFileName = (
-                    file["name"].rstrip() + "." + file["extension"].rstrip()
-                )
-                data = controller.readFile(entry)
-                with open(os.path.join(sidePath, extractedFileName), "wb") as outf:
-                    outf.write(data)
-                listener.onEndOfFile(file)
-            listener.onEndOfSide(controller.computeUsage())
+        if args.jobs > 1:
+            self.extractSidesInParallel(image.sides, targetDir, listener, args.jobs)
+        else:
+            for i, side in enumerate(image.sides):
+                self.extractSide(i, side, targetDir, listener)
         listener.onDone()
+        return 0
@@ -28,7 +28,7 @@ from ..image import TypeOfDiskImage, DiskImage
 from ..image_manager import SingleDiskImageManager
 from ..listener import DiskImageCliListener
 from ..catalog import TypeOfData, TypeOfDiskFile, CatalogEntryStatus
-from ..controller import FileSystemController
+from ..controller import DiskIsFullError, FileSystemController
 
 
 class DiskImageContentInjector(DiskImageWorker):
@@ -93,8 +93,8 @@ class DiskImageContentInjector(DiskImageWorker):
         fileName: str,
         fileExtension: str,
         fileData: bytes,
-    ) -> int:
-        self.writeFile(
+    ) -> bool:
+        return self.writeFile(
             listener,
             fileName,
             fileExtension,
@@ -109,8 +109,8 @@ class DiskImageContentInjector(DiskImageWorker):
         fileName: str,
         fileExtension: str,
         fileData: bytes,
-    ) -> int:
-        self.writeFile(
+    ) -> bool:
+        return self.writeFile(
             listener,
             fileName,
             fileExtension,
@@ -125,8 +125,8 @@ class DiskImageContentInjector(DiskImageWorker):
         fileName: str,
         fileExtension: str,
         fileData: bytes,
-    ) -> int:
-        self.writeFile(
+    ) -> bool:
+        return self.writeFile(
             listener,
             fileName,
             fileExtension,
@@ -141,8 +141,8 @@ class DiskImageContentInjector(DiskImageWorker):
         fileName: str,
         fileExtension: str,
         fileData: bytes,
-    ) -> int:
-        self.writeFile(
+    ) -> bool:
+        return self.writeFile(
             listener,
             fileName,
             "BAS",
@@ -157,8 +157,8 @@ class DiskImageContentInjector(DiskImageWorker):
         fileName: str,
         fileExtension: str,
         fileData: bytes,
-    ) -> int:
-        self.writeFile(
+    ) -> bool:
+        return self.writeFile(
             listener,
             fileName,
             fileExtension,
@@ -175,7 +175,7 @@ class DiskImageContentInjector(DiskImageWorker):
         fileType: TypeOfDiskFile,
         fileMode: TypeOfData,
         fileData: bytes,
-    ):
+    ) -> bool:
         while self._hasController():  # Still have side to try
             try:
                 listener.onBeginOfFile(
@@ -204,8 +204,8 @@ class DiskImageContentInjector(DiskImageWorker):
                         "sizeInBlocks": sizeInBlocks,
                     }
                 )
-                break  # done, no need to retry
-            except ValueError:
+                return True  # done, no need to retry
+            except DiskIsFullError:
                 # not enough place, try next side
                 listener.onAbortFile("too big")
                 listener.onEndOfSide(self._controller.computeUsage())
@@ -213,6 +213,7 @@ class DiskImageContentInjector(DiskImageWorker):
                 if not self._hasController():  # cannot try anymore
                     break
                 listener.onBeginOfSide(self._currentSide)
+        return False
 
     ###############
     ### Perform ###
@@ -223,12 +224,19 @@ class DiskImageContentInjector(DiskImageWorker):
         args,
         imageManager: SingleDiskImageManager,
         listener: DiskImageCliListener,
-    ):
+    ) -> int:
+        """Write the sources into the image.
+
+        Returns:
+            int: 0 when all the sources have been written, 1 when some of them have been
+            skipped.
+        """
         image = imageManager.image
         self._prepareControllers(image)
+        hasSkippedSources = False
 
         listener.onBeginOfSide(self._currentSide)
-        for src in args.sources:
+        for i, src in enumerate(args.sources):
             dotPos = src.rfind(".")
             fileName = os.path.basename(src.upper())
 
@@ -237,6 +245,10 @@ class DiskImageContentInjector(DiskImageWorker):
                 listener.onEndOfSide(self._controller.computeUsage())
                 self._nextController()
                 if not self._hasController():
+                    hasSkippedSources = any(
+                        os.path.basename(s.upper()) != "--EOS"
+                        for s in args.sources[i + 1 :]
+                    )
                     break
                 listener.onBeginOfSide(self._currentSide)
                 continue
@@ -245,6 +257,7 @@ class DiskImageContentInjector(DiskImageWorker):
             cleanSrc = src[:-2] if src[-2:].upper() == ",A" else src
             if not os.path.exists(cleanSrc):
                 listener.onBeforeBeginOfFile(f"-- not found : {src}")
+                hasSkippedSources = True
                 continue
 
             if dotPos > -1:
@@ -255,9 +268,11 @@ class DiskImageContentInjector(DiskImageWorker):
                 fileExtension = fileExtensionWithOption = None
             if len(fileName) > 8:
                 listener.onBeforeBeginOfFile(f"-- too long name : {cleanSrc}")
+                hasSkippedSources = True
                 continue
             if len(fileExtension) > 3:
                 listener.onBeforeBeginOfFile(f"-- too long extension : {cleanSrc}")
+                hasSkippedSources = True
                 continue
 
             with open(cleanSrc, "rb") as sourceFile:
@@ -274,7 +289,8 @@ class DiskImageContentInjector(DiskImageWorker):
                     else self._defaultProcessors
                 )
             )
-            process(listener, fileName, fileExtension, fileData)
+            if not process(listener, fileName, fileExtension, fileData):
+                hasSkippedSources = True
 
             if not self._hasController():  # cannot write anymore
                 break
@@ -292,6 +308,7 @@ class DiskImageContentInjector(DiskImageWorker):
         imageManager.save()
 
         listener.onDone()
+        return 1 if hasSkippedSources else 0
 
 
 class DiskImageContentInjectorWithImageInitialization(DiskImageContentInjector):
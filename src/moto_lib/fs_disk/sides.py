@@ -0,0 +1,125 @@
+"""
+Writing of files on the sides of a disk image.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+from typing import Iterable
+
+from .catalog import TypeOfData, TypeOfDiskFile
+from .controller import DiskIsFullError, FileSystemController
+
+
+def sidesFrom(firstSide: int, countOfSides: int) -> list[int]:
+    """The sides to try, from the given side to the last one, then from the first one."""
+    return list(range(firstSide, countOfSides)) + list(range(firstSide))
+
+
+def writeFileOnSides(
+    controllers: list[FileSystemController],
+    data: bytes,
+    name: str,
+    extension: str,
+    *,
+    typeOfFile: TypeOfDiskFile = TypeOfDiskFile.BASIC_DATA,
+    typeOfData: TypeOfData = TypeOfData.BINARY_DATA,
+    sides: Iterable[int] = None,
+) -> int:
+    """Write a file on the first side having enough space for it.
+
+    Args:
+        controllers (list[FileSystemController]): the controllers of the sides.
+        sides (Iterable[int], optional): the indexes of the sides to try, in order. Defaults
+        to all the sides, from the first one.
+
+    Raises:
+        DiskIsFullError: when no side has enough space ; other errors, e.g. an invalid name,
+        are raised as is.
+
+    Returns:
+        int: the index of the side where the file has been written.
+    """
+    for i in sides if sides is not None else range(len(controllers)):
+        try:
+            controllers[i].writeFile(
+                data, name, extension, typeOfFile=typeOfFile, typeOfData=typeOfData
+            )
+            return i
+        except DiskIsFullError:
+            continue
+    raise DiskIsFullError(f"error.disk.image.is.full:{name}.{extension}")
+
+
+def replaceFileOnSides(
+    controllers: list[FileSystemController],
+    data: bytes,
+    name: str,
+    extension: str,
+    *,
+    typeOfFile: TypeOfDiskFile = TypeOfDiskFile.BASIC_DATA,
+    typeOfData: TypeOfData = TypeOfData.BINARY_DATA,
+    sides: Iterable[int] = None,
+) -> int:
+    """Write a file, replacing the file of the same name found on the first of the sides.
+
+    The side of the replaced file is tried first, then the next ones.
+
+    Raises:
+        DiskIsFullError: when no side has enough space ; the replaced file is then kept.
+
+    Returns:
+        int: the index of the side where the file has been written.
+    """
+    sides = list(sides if sides is not None else range(len(controllers)))
+    replaced = None
+    for i in sides:
+        replaced = controllers[i].findFile(name, extension)
+        if replaced is not None:
+            break
+    if replaced is None:
+        return writeFileOnSides(
+            controllers,
+            data,
+            name,
+            extension,
+            typeOfFile=typeOfFile,
+            typeOfData=typeOfData,
+            sides=sides,
+        )
+    previous = bytes(controllers[i].readFile(replaced))
+    controllers[i].deleteFile(name, extension)
+    try:
+        return writeFileOnSides(
+            controllers,
+            data,
+            name,
+            extension,
+            typeOfFile=typeOfFile,
+            typeOfData=typeOfData,
+            sides=sides[sides.index(i) :] + sides[: sides.index(i)],
+        )
+    except DiskIsFullError:
+        controllers[i].writeFile(
+            previous,
+            name,
+            extension,
+            typeOfFile=replaced.record.typeOfFile,
+            typeOfData=replaced.record.typeOfData,
+        )
+        raise
@@ -19,15 +19,7 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
-from .consts import TypeOfTapeBlock
-from .block import TapeBlock
-from .block_descriptor import LeaderTapeBlockDescriptor
-from .listeners import (
-    TapeImageCliListener,
-    TapeImageCliListenerQuiet,
-    TapeImageCliListenerVerbose,
-)
-from .tape import Tape
+from ..lazy import lazyExports
 
 __all__ = [
     "LeaderTapeBlockDescriptor",
@@ -38,3 +30,16 @@ __all__ = [
     "TapeBlock",
     "TypeOfTapeBlock",
 ]
+
+__getattr__, __dir__ = lazyExports(
+    __name__,
+    {
+        "LeaderTapeBlockDescriptor": ".block_descriptor",
+        "Tape": ".tape",
+        "TapeImageCliListener": ".listeners",
+        "TapeImageCliListenerQuiet": ".listeners",
+        "TapeImageCliListenerVerbose": ".listeners",
+        "TapeBlock": ".block",
+        "TypeOfTapeBlock": ".consts",
+    },
+)
@@ -0,0 +1,246 @@
+"""
+Audio rendering of tapes.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import re
+import wave
+
+from typing import Iterator
+
+from .consts import BAUD_RATE
+
+###
+# Bit encoding of the MO/TO tape interface : each bit lasts 1/1200 second, and starts with a
+# level transition ; a bit 1 has another transition in the middle of its cell, a bit 0 has none.
+# A run of bits 0 is then a square wave of 600 Hz, and a run of bits 1 a square wave of 1200 Hz.
+# Bytes are sent most significant bit first.
+#
+# Samples are 8 bits unsigned PCM, mono ; the sample rate is chosen so that a bit cell is an
+# integral number of samples.
+#
+SAMPLE_RATE = 48000
+SAMPLES_PER_BIT = SAMPLE_RATE // BAUD_RATE
+SAMPLES_PER_HALF_BIT = SAMPLES_PER_BIT // 2
+
+LEVEL_HIGH = 0xC0
+LEVEL_LOW = 0x40
+LEVEL_SILENCE = 0x80
+
+# silence inserted after a leader block and after the end of a file, in seconds
+SILENCE_AFTER_LEADER = 0.5
+SILENCE_AFTER_FILE = 1.0
+
+
+def _buildWaveformTables() -> list[list[(bytes, bool)]]:
+    """Precompute the waveform of each byte value, for each level at the start of the byte.
+
+    Returns:
+        list[list[(bytes, bool)]]: `tables[isHigh][byte]` is a tuple (samples, isHighAtEnd)
+    """
+    halfCells = {
+        True: bytes([LEVEL_HIGH]) * SAMPLES_PER_HALF_BIT,
+        False: bytes([LEVEL_LOW]) * SAMPLES_PER_HALF_BIT,
+    }
+    tables = []
+    for isHighAtStart in [False, True]:
+        table = []
+        for value in range(256):
+            samples = []
+            isHigh = isHighAtStart
+            for bit in range(7, -1, -1):
+                isHigh = not isHigh  # transition at the start of the cell
+                samples.append(halfCells[isHigh])
+                if (value >> bit) & 1:
+                    isHigh = not isHigh  # transition in the middle of the cell
+                samples.append(halfCells[isHigh])
+            table.append((b"".join(samples), isHigh))
+        tables.append(table)
+    return tables
+
+
+_WAVEFORM_TABLES = _buildWaveformTables()
+
+
+class TapeAudioEncoder:
+    """Render a stream of bytes into a wave file, using precomputed waveforms."""
+
+    def __init__(self, filePath: str):
+        self._output = wave.open(filePath, "wb")
+        self._output.setnchannels(1)
+        self._output.setsampwidth(1)
+        self._output.setframerate(SAMPLE_RATE)
+        self._isHigh = False
+
+    def writeBytes(self, data: bytes | bytearray | memoryview):
+        tables = _WAVEFORM_TABLES
+        isHigh = self._isHigh
+        chunks = []
+        for value in data:
+            samples, isHigh = tables[isHigh][value]
+            chunks.append(samples)
+        self._isHigh = isHigh
+        self._output.writeframes(b"".join(chunks))
+
+    def writeSilence(self, duration: float):
+        # a last transition closes the last bit cell before the silence
+        self._isHigh = not self._isHigh
+        closing = bytes([LEVEL_HIGH if self._isHigh else LEVEL_LOW])
+        self._output.writeframes(
+            closing * SAMPLES_PER_HALF_BIT
+            + bytes([LEVEL_SILENCE]) * int(duration * SAMPLE_RATE)
+        )
+
+    def close(self):
+        self._output.close()
+
+
+###
+# Decoding : the signal is reduced to a sequence of signs, the lengths of the runs of samples
+# having the same sign are the intervals between zero crossings ; a short interval is half a
+# bit cell, a long interval is a full bit cell.
+#
+# Start of block : at least one 0x01 byte followed by the 0x3C 0x5A sequence.
+#
+_SYNC_PATTERN = 0x013C5A
+_SYNC_MASK = 0xFFFFFF
+_RUNS_OF_SAME_SIGN = re.compile(rb"\x00+|\x01+")
+
+# to convert the most significant byte of a sample into its sign
+_SIGN_OF_UNSIGNED_BYTE = bytes([1 if i >= 0x80 else 0 for i in range(256)])
+_SIGN_OF_SIGNED_BYTE = bytes([1 if i < 0x80 else 0 for i in range(256)])
+
+
+class TapeAudioDecoder:
+    """Demodulate a wave file into the raw data of tape blocks.
+
+    Any sample rate is supported, samples may be 8 bits unsigned, or 16, 24 or 32 bits signed ;
+    only the first channel is used.
+    """
+
+    SIZE_OF_CHUNK = 1 << 16  # in frames
+
+    def __init__(self, filePath: str):
+        self._filePath = filePath
+
+    def blocks(self) -> Iterator[bytes]:
+        """Decode the wave file chunk by chunk.
+
+        Yields:
+            bytes: the raw data of each block found (type, length, body, checksum), a block
+            interrupted by a silence or a loss of signal is yielded truncated.
+        """
+        with wave.open(self._filePath, "rb") as wav:
+            sizeOfSample = wav.getsampwidth()
+            sizeOfFrame = sizeOfSample * wav.getnchannels()
+            signs = (
+                _SIGN_OF_UNSIGNED_BYTE if sizeOfSample == 1 else _SIGN_OF_SIGNED_BYTE
+            )
+            samplesPerBit = wav.getframerate() / BAUD_RATE
+            minimalInterval = samplesPerBit / 4  # shorter intervals are glitches
+            longInterval = samplesPerBit * 3 / 4
+            silenceInterval = samplesPerBit * 5 / 2
+
+            # state of the demodulation
+            interval = 0  # current interval between two zero crossings
+            isGlitch = False
+            hasPendingShortInterval = False
+            # state of the block reconstruction
+            isHunting = True
+            register = 0
+            currentByte = 0
+            countOfBits = 0
+            block = bytearray()
+            sizeOfBlock = 0
+
+            carry, signOfCarry = 0, None  # last run of a chunk may go on in the next
+            while True:
+                frames = wav.readframes(self.SIZE_OF_CHUNK)
+                isLastChunk = len(frames) == 0
+                if isLastChunk:
+                    runs = [carry, silenceInterval + 1]  # flush with a silence
+                else:
+                    samples = frames[sizeOfSample - 1 :: sizeOfFrame].translate(signs)
+                    runs = [
+                        m.end() - m.start()
+                        for m in _RUNS_OF_SAME_SIGN.finditer(samples)
+                    ]
+                    if samples[0] == signOfCarry:
+                        runs[0] += carry
+                    elif carry > 0:
+                        runs.insert(0, carry)
+                    carry, signOfCarry = runs.pop(), samples[-1]
+
+                for run in runs:
+                    # --- get the interval between two actual zero crossings
+                    if isGlitch:
+                        interval += run
+                        isGlitch = False
+                        continue
+                    if run < minimalInterval:
+                        interval += run
+                        isGlitch = True
+                        continue
+                    previous, interval = interval, run
+
+                    # --- interval to bit
+                    if previous > silenceInterval:
+                        hasPendingShortInterval = False
+                        if not isHunting and len(block) >= 2:
+                            yield bytes(block)
+                        isHunting = True
+                        register = 0
+                        continue
+                    if previous < longInterval:
+                        if not hasPendingShortInterval:
+                            hasPendingShortInterval = True
+                            continue
+                        hasPendingShortInterval = False
+                        bit = 1
+                    else:
+                        hasPendingShortInterval = False
+                        bit = 0
+
+                    # --- bit to block
+                    if isHunting:
+                        register = ((register << 1) | bit) & _SYNC_MASK
+                        if register == _SYNC_PATTERN:
+                            isHunting = False
+                            block = bytearray()
+                            currentByte = 0
+                            countOfBits = 0
+                            sizeOfBlock = 0
+                        continue
+                    currentByte = (currentByte << 1) | bit
+                    countOfBits += 1
+                    if countOfBits < 8:
+                        continue
+                    block.append(currentByte)
+                    currentByte = 0
+                    countOfBits = 0
+                    if len(block) == 2:
+                        sizeOfBlock = (block[1] if block[1] > 0 else 256) + 1
+                    if len(block) == sizeOfBlock:
+                        yield bytes(block)
+                        isHunting = True
+                        register = 0
+
+                if isLastChunk:
+                    break
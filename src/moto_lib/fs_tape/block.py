@@ -22,15 +22,21 @@ If not, see <https://www.gnu.org/licenses/>.
 
 from .consts import TypeOfTapeBlock
 
+# lookup table to avoid building an IntEnum for each block ; unknown types are kept as int
+_TYPES_OF_TAPE_BLOCK = {t.value: t for t in TypeOfTapeBlock}
+
 
 class TapeBlock:
+    """A view over a block of a tape, header fields are parsed once at construction.
+
+    When built from a tape, `rawData` is a `memoryview` over the tape buffer, no data is copied.
+    """
+
+    __slots__ = ("rawData", "readOnly", "type", "length", "checksum", "body")
+
     @staticmethod
     def computeChecksum(data):
-        sum = 0
-        for byte in data:
-            sum = (sum + byte) & 0xFF
-        checksum = (0x100 - sum) & 0xFF
-        return checksum
+        return (0x100 - (sum(data) & 0xFF)) & 0xFF
 
     @staticmethod
     def buildFromData(data, type: TypeOfTapeBlock = TypeOfTapeBlock.DATA):
@@ -44,25 +50,29 @@ class TapeBlock:
             )
         )
 
-    def __init__(self, rawData, readOnly=True):
-        self.rawData = rawData
-        self.readOnly = readOnly
-
-    @property
-    def type(self):
-        return TypeOfTapeBlock(self.rawData[0])
+    @staticmethod
+    def buildSequenceFromData(data, sizeOfBody: int = 254):
+        """Split the data into a sequence of data blocks.
 
-    @property
-    def length(self):
-        return 256 if self.rawData[1] == 0 else self.rawData[1]
+        Args:
+            data: the data to split.
+            sizeOfBody (int, optional): size of the body of each block, the last one may be
+            smaller. Defaults to 254, the biggest size allowed by the format.
 
-    @property
-    def checksum(self):
-        return self.rawData[-1]
+        Yields:
+            TapeBlock: the data blocks.
+        """
+        for start in range(0, len(data), sizeOfBody):
+            yield TapeBlock.buildFromData(data[start : start + sizeOfBody])
 
-    @property
-    def body(self):
-        return self.rawData[2:-1]  # FIXME
+    def __init__(self, rawData, readOnly=True):
+        view = rawData if isinstance(rawData, memoryview) else memoryview(rawData)
+        self.rawData = view
+        self.readOnly = readOnly
+        self.type = _TYPES_OF_TAPE_BLOCK.get(view[0], view[0])
+        self.length = 256 if view[1] == 0 else view[1]
+        self.checksum = view[-1]
+        self.body = view[2:-1]
 
     def isValidChecksum(self):
         return TapeBlock.computeChecksum(self.body) == self.checksum
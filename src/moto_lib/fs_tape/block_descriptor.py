@@ -34,8 +34,8 @@ class LeaderTapeBlockDescriptor:
     @staticmethod
     def buildFromTapeBlock(rawData):
         return LeaderTapeBlockDescriptor(
-            rawData[2:10].decode("utf-8").strip(),
-            rawData[10:13].decode("utf-8").strip(),
+            bytes(rawData[2:10]).decode("utf-8").strip(),
+            bytes(rawData[10:13]).decode("utf-8").strip(),
             rawData[13],
             rawData[14] * 256 + rawData[15],
         )
@@ -27,3 +27,7 @@ class TypeOfTapeBlock(IntEnum):
     LEADER = 0x00
     DATA = 0x01
     EOF = 0xFF
+
+
+# speed of the tape interface of the MO5, in bits per second
+BAUD_RATE = 1200
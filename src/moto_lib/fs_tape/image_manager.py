@@ -19,6 +19,7 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
+from ..file_cache import forgetFileData, readFileData
 from .tape import Tape
 
 
@@ -39,11 +40,11 @@ class SingleTapeImageManager:
         return self._image
 
     def save(self):
+        forgetFileData(self._filePath)
         with open(self._filePath, "wb") as f:
             f.write(self._image.rawData)
 
 
 class TapeImageFromDiskManager(SingleTapeImageManager):
     def prepareImage(self):
-        with open(self._filePath, "rb") as f:
-            self._image = Tape(f.read())
+        self._image = Tape(readFileData(self._filePath))
@@ -20,14 +20,25 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
-from .base import TapeImageWorker
-from .content_enumerator import TapeImageContentEnumerator
-from .content_extractor import TapeImageContentExtractor
-from .content_injector import TapeImageContentInjector
+from ...lazy import lazyExports
 
 __all__ = [
     "TapeImageWorker",
+    "TapeImageAudioExporter",
+    "TapeImageAudioImporter",
     "TapeImageContentEnumerator",
     "TapeImageContentExtractor",
     "TapeImageContentInjector",
 ]
+
+__getattr__, __dir__ = lazyExports(
+    __name__,
+    {
+        "TapeImageWorker": ".base",
+        "TapeImageAudioExporter": ".audio_exporter",
+        "TapeImageAudioImporter": ".audio_importer",
+        "TapeImageContentEnumerator": ".content_enumerator",
+        "TapeImageContentExtractor": ".content_extractor",
+        "TapeImageContentInjector": ".content_injector",
+    },
+)
@@ -0,0 +1,70 @@
+"""
+File system on disk.
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import os
+
+from .base import TapeImageWorker
+
+from ..audio import TapeAudioEncoder, SILENCE_AFTER_FILE, SILENCE_AFTER_LEADER
+from ..image_manager import SingleTapeImageManager
+from ..listeners import TapeImageCliListener
+from ..consts import TypeOfTapeBlock
+from ..block_descriptor import LeaderTapeBlockDescriptor
+
+
+class TapeImageAudioExporter(TapeImageWorker):
+    """Render the blocks of the tape into a wave file, to be played into a real MO/TO computer."""
+
+    def perform(
+        self,
+        args,
+        imageManager: SingleTapeImageManager,
+        listener: TapeImageCliListener,
+    ):
+        tape = imageManager.image
+        targetDir = (
+            args.into if args.into is not None else os.path.dirname(args.archive)
+        )
+        archiveName = os.path.basename(args.archive)
+        dotPos = archiveName.rfind(".")
+        wavName = f"{archiveName[:dotPos] if dotPos > 0 else archiveName}.wav"
+
+        encoder = TapeAudioEncoder(os.path.join(targetDir, wavName))
+        try:
+            encoder.writeSilence(SILENCE_AFTER_FILE)
+            block = tape.nextBlock()
+            while block is not None:
+                encoder.writeBytes(tape.startOfLastBlock)
+                encoder.writeBytes(block.rawData)
+                if block.type == TypeOfTapeBlock.LEADER:
+                    desc = LeaderTapeBlockDescriptor.buildFromTapeBlock(block.rawData)
+                    listener.onBeginFileBlock(desc)
+                    encoder.writeSilence(SILENCE_AFTER_LEADER)
+                elif block.type == TypeOfTapeBlock.EOF:
+                    listener.onEndBlock()
+                    encoder.writeSilence(SILENCE_AFTER_FILE)
+                else:
+                    listener.onDataBlock(block)
+                block = tape.nextBlock()
+        finally:
+            encoder.close()
+        return 0
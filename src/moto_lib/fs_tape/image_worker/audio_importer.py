@@ -0,0 +1,70 @@
+"""
+File system on disk.
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+from .base import TapeImageWorker
+
+from ..audio import TapeAudioDecoder
+from ..image_manager import SingleTapeImageManager
+from ..listeners import TapeImageCliListener
+from ..consts import TypeOfTapeBlock
+from ..block import TapeBlock
+from ..block_descriptor import LeaderTapeBlockDescriptor
+
+
+class TapeImageAudioImporter(TapeImageWorker):
+    """Decode the recordings of tapes into the blocks of the tape archive.
+
+    Blocks with an invalid length or checksum are reported, and written as they have been decoded.
+    """
+
+    def perform(
+        self,
+        args,
+        imageManager: SingleTapeImageManager,
+        listener: TapeImageCliListener,
+    ):
+        tape = imageManager.image
+        blockNumber = 0
+        countOfInvalidBlocks = 0
+        for src in args.sources:
+            for rawData in TapeAudioDecoder(src).blocks():
+                blockNumber += 1
+                block = TapeBlock(rawData)
+                tape.writeBlock(block, extend=True)
+
+                if block.type == TypeOfTapeBlock.LEADER and block.isValid():
+                    desc = LeaderTapeBlockDescriptor.buildFromTapeBlock(block.rawData)
+                    listener.onBeginFileBlock(desc)
+                elif block.type == TypeOfTapeBlock.EOF:
+                    if listener.currentFile is not None:
+                        listener.onEndBlock()
+                else:
+                    listener.onDataBlock(block)
+
+                if not block.isValidLength():
+                    countOfInvalidBlocks += 1
+                    listener.onError(f"truncated block #{blockNumber}")
+                elif not block.isValidChecksum():
+                    countOfInvalidBlocks += 1
+                    listener.onError(f"invalid checksum on block #{blockNumber}")
+        imageManager.save()
+        return 0 if countOfInvalidBlocks == 0 else 1
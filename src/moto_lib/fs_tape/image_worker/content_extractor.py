@@ -44,16 +44,16 @@ class TapeImageContentExtractor(TapeImageWorker):
             if block.type == TypeOfTapeBlock.LEADER:
                 desc = LeaderTapeBlockDescriptor.buildFromTapeBlock(block.rawData)
                 listener.onBeginFileBlock(desc)
-                fileContent = bytearray()  # initialize accumulator
+                fileContent = []  # initialize accumulator of views over the tape
             elif block.type == TypeOfTapeBlock.EOF:
                 with open(
                     os.path.join(targetDir, f"{desc.fileName}.{desc.fileExtension}"),
                     "wb",
                 ) as f:
-                    f.write(fileContent)
+                    f.write(b"".join(fileContent))
                 listener.onEndBlock()
             else:
                 listener.onDataBlock(block)
-                fileContent += block.body  # update accumulator
+                fileContent.append(block.body)  # update accumulator
             block = tape.nextBlock()
         return 0
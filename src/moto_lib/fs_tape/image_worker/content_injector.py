@@ -26,9 +26,34 @@ from .base import TapeImageWorker
 
 from ..image_manager import SingleTapeImageManager
 from ..listeners import TapeImageCliListener
-from ..consts import TypeOfTapeBlock
-from ..block import TapeBlock
 from ..block_descriptor import LeaderTapeBlockDescriptor
+from ..tape import buildStartOfBlockSequence
+
+
+def nameOnTape(src: str) -> str:
+    name = os.path.basename(src).upper()
+    return name[:-2] if name.endswith(",A") else name
+
+
+def sortByBootSequence(sources: list[str], bootSequence: list[str]) -> list[str]:
+    """Put the files of the boot sequence first, in the order of the boot sequence.
+
+    Args:
+        sources (list[str]): the source files, in the order of the command line.
+        bootSequence (list[str]): the name of the files loaded one after the other when booting
+        the program, e.g. `LOADER.BAS`.
+
+    Returns:
+        list[str]: the source files, the other files keep their relative order.
+    """
+    rankInBootSequence = {name.upper(): i for i, name in enumerate(bootSequence)}
+    missing = set(rankInBootSequence) - set(nameOnTape(src) for src in sources)
+    if len(missing) > 0:
+        raise ValueError(f"error.boot.file.not.found:{','.join(sorted(missing))}")
+    return sorted(
+        sources,
+        key=lambda src: rankInBootSequence.get(nameOnTape(src), len(bootSequence)),
+    )
 
 
 class TapeImageContentInjector(TapeImageWorker):
@@ -39,7 +64,15 @@ class TapeImageContentInjector(TapeImageWorker):
         listener: TapeImageCliListener,
     ):
         tape = imageManager.image
-        for src in args.sources:
+        sources = args.sources
+        try:
+            tape.startOfBlockSequence = buildStartOfBlockSequence(args.sync_length)
+            if args.boot is not None:
+                sources = sortByBootSequence(sources, args.boot)
+        except ValueError as error:
+            listener.onError(str(error))
+            return 1
+        for src in sources:
             dotPos = src.rfind(".")
             fileName = os.path.basename(src.upper())
             fileExtension = ""
@@ -64,28 +97,16 @@ class TapeImageContentInjector(TapeImageWorker):
                 fileName, fileExtension, fileType, fileMode
             )
             try:
-                tape.writeBlock(leadBloc.toTapeBlock())
-                listener.onBeginFileBlock(leadBloc)
                 with open(src, "rb") as f:
                     data = f.read()
-                dataPos = 0
-                dataMax = len(data)
-                dataRemaining = dataMax
-                while dataPos < dataMax:
-                    dataNextPos = (
-                        dataPos + dataRemaining
-                        if dataRemaining < 254
-                        else dataPos + 254
-                    )
-                    block = TapeBlock.buildFromData(data[dataPos:dataNextPos])
-                    tape.writeBlock(block)
-                    listener.onDataBlock(block)
-                    dataPos = dataNextPos
-                    dataRemaining = dataMax - dataPos
-                tape.writeBlock(TapeBlock.buildFromData(None, TypeOfTapeBlock.EOF))
-                listener.onEndBlock()
+                tape.writeFile(leadBloc, data, extend=args.pack, listener=listener)
             except OverflowError:
                 print("Too much data, abort creation.")
                 return 1
+        if args.pack:
+            from ..layout import TapeLayoutReport
+
+            listener.onTapeLayout(TapeLayoutReport.buildFromTape(tape))
+            tape.trim()
         imageManager.save()
         return 0
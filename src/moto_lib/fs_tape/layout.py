@@ -0,0 +1,69 @@
+"""
+Layout of tapes.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+from .audio import SILENCE_AFTER_FILE, SILENCE_AFTER_LEADER
+from .consts import BAUD_RATE, TypeOfTapeBlock
+from .tape import Tape
+
+
+class TapeLayoutReport:
+    """Length of the used part of a tape, and estimation of the time to play it."""
+
+    def __init__(
+        self,
+        sizeOfTape: int,
+        countOfBlocks: int,
+        countOfFiles: int,
+        playbackTime: float,
+    ):
+        self.sizeOfTape = sizeOfTape
+        self.countOfBlocks = countOfBlocks
+        self.countOfFiles = countOfFiles
+        self.playbackTime = playbackTime
+
+    @staticmethod
+    def buildFromTape(tape: Tape):
+        """Measure the tape from its start to its current position.
+
+        The playback time is the time to send each byte at the baud rate of the tape interface,
+        plus the silences inserted before the first block, after each leader and after each end
+        of file block when rendering the tape into a wave file.
+        """
+        sizeOfTape = tape.position
+        reader = Tape(tape.rawData[:sizeOfTape])
+        countOfBlocks = 0
+        countOfFiles = 0
+        countOfLeaders = 0
+        block = reader.nextBlock()
+        while block is not None:
+            countOfBlocks += 1
+            if block.type == TypeOfTapeBlock.LEADER:
+                countOfLeaders += 1
+            elif block.type == TypeOfTapeBlock.EOF:
+                countOfFiles += 1
+            block = reader.nextBlock()
+        playbackTime = (
+            sizeOfTape * 8 / BAUD_RATE
+            + countOfLeaders * SILENCE_AFTER_LEADER
+            + (countOfFiles + 1) * SILENCE_AFTER_FILE
+        )
+        return TapeLayoutReport(sizeOfTape, countOfBlocks, countOfFiles, playbackTime)
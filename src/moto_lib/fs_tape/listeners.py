@@ -24,11 +24,15 @@ import sys
 from abc import ABC, abstractmethod
 from argparse import ArgumentParser, RawDescriptionHelpFormatter, FileType
 
-from typing import List, Union, Optional
+from typing import TYPE_CHECKING, List, Union, Optional
 from enum import Enum
 
 from .block import TapeBlock
 from .block_descriptor import LeaderTapeBlockDescriptor
+from .consts import BAUD_RATE
+
+if TYPE_CHECKING:  # the layout imports the audio encoding, not needed otherwise
+    from .layout import TapeLayoutReport
 
 
 class TapeImageCliListener(ABC):
@@ -41,6 +45,10 @@ class TapeImageCliListener(ABC):
         """
         self.operation = operation
         self.blockIndex = 0
+        self.currentFile = None
+        self.blockCount = 0
+        self.fileSize = 0
+        self.firstBlock = 0
 
     def onBeginFileBlock(self, descriptor: LeaderTapeBlockDescriptor):
         self.blockIndex += 1
@@ -63,6 +71,11 @@ class TapeImageCliListener(ABC):
         self.printOnEndBlock()
         self.currentFile = None
 
+    def onTapeLayout(self, report: "TapeLayoutReport"):
+        print(
+            f"Tape : {report.sizeOfTape} octets\t{report.countOfBlocks} blocks\t{report.playbackTime:.1f} s at {BAUD_RATE} bauds."
+        )
+
     def onError(self, message: str):
         desc = self.currentFile
         print(
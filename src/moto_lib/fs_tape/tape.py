@@ -21,11 +21,25 @@ If not, see <https://www.gnu.org/licenses/>.
 """
 
 from .block import TapeBlock
+from .block_descriptor import LeaderTapeBlockDescriptor
+from .consts import TypeOfTapeBlock
 
 startOfBlockSequenceToRead = b"\x01\x01\x01\x3c\x5a"
-startOfBlockSequenceToWrite = (
-    b"\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x3c\x5a"
-)
+
+# count of sync bytes (0x01) before the start of block marker
+MIN_COUNT_OF_SYNC_BYTES = 3
+DEFAULT_COUNT_OF_SYNC_BYTES = 16
+
+
+def buildStartOfBlockSequence(
+    countOfSyncBytes: int = DEFAULT_COUNT_OF_SYNC_BYTES,
+) -> bytes:
+    if countOfSyncBytes < MIN_COUNT_OF_SYNC_BYTES:
+        raise ValueError(f"error.sync.too.short:{countOfSyncBytes}")
+    return b"\x01" * countOfSyncBytes + b"\x3c\x5a"
+
+
+startOfBlockSequenceToWrite = buildStartOfBlockSequence()
 
 
 class Tape:
@@ -33,36 +47,105 @@ class Tape:
         self.rawData = rawData if rawData is not None else bytearray(21 * 1024)
         self._position = 0
         self.maxPosition = len(self.rawData)
+        self.startOfBlockSequence = startOfBlockSequenceToWrite
+        # the start of block sequence of the last block read, with all its sync bytes
+        self.startOfLastBlock = None
 
     @property
     def position(self):
         return self._position
 
+    def extend(self, size: int):
+        """Append `size` blank bytes at the end of the tape.
+
+        The blocks read from the tape are views of its buffer, that cannot be resized while
+        they are alive ; the buffer is then replaced by a copy, the blocks keep the former one.
+        """
+        try:
+            self.rawData += bytes(size)
+        except BufferError:
+            self.rawData = self.rawData + bytes(size)
+        self.maxPosition = len(self.rawData)
+
+    def trim(self):
+        """Remove the blank bytes after the current position, see `extend` about the blocks
+        read from the tape."""
+        try:
+            del self.rawData[self._position :]
+        except BufferError:
+            self.rawData = self.rawData[: self._position]
+        self.maxPosition = len(self.rawData)
+
     def nextBlock(self) -> TapeBlock:
         pos = self.rawData.find(startOfBlockSequenceToRead, self.position)
         if pos == -1:
             self._position = self.maxPosition
             return None
         else:
+            start = pos  # the sync bytes before the ones that have been searched for
+            while start > self._position and self.rawData[start - 1] == 0x01:
+                start -= 1
             self._position = pos + len(startOfBlockSequenceToRead)
+            self.startOfLastBlock = bytes(self.rawData[start : self._position])
             if self._position + 2 <= self.maxPosition:
                 length = self.rawData[self._position + 1]
                 blockEnd = (
                     self._position + length + 1 if length > 0 else self._position + 257
                 )
-                blocRawData = self.rawData[self._position : blockEnd]
+                blocRawData = memoryview(self.rawData)[self._position : blockEnd]
                 self._position = blockEnd
                 return TapeBlock(blocRawData)
 
-    def writeBlock(self, block: TapeBlock):
+    def writeBlock(self, block: TapeBlock, *, extend: bool = False):
+        """Write the block, preceded by the start of block sequence, at the current position.
+
+        Args:
+            block (TapeBlock): the block to write.
+            extend (bool, optional): When True, the tape is extended instead of raising an
+            OverflowError when reaching the end of tape. Defaults to False.
+        """
         position = self._position
-        nextPosition = position + len(startOfBlockSequenceToWrite)
+        startOfBlockSequence = self.startOfBlockSequence
+        if extend:
+            sizeOfBlock = len(startOfBlockSequence) + len(block.rawData)
+            if position + sizeOfBlock >= self.maxPosition:
+                self.extend(max(sizeOfBlock, 21 * 1024))
+        nextPosition = position + len(startOfBlockSequence)
         if nextPosition >= self.maxPosition:
             raise OverflowError("Reached end of tape.")
-        self.rawData[position:nextPosition] = startOfBlockSequenceToWrite
+        self.rawData[position:nextPosition] = startOfBlockSequence
         position = nextPosition
         nextPosition = position + len(block.rawData)
         if nextPosition >= self.maxPosition:
             raise OverflowError("Reached end of tape.")
         self.rawData[position:nextPosition] = block.rawData
         self._position = nextPosition
+
+    def writeFile(
+        self,
+        leader: LeaderTapeBlockDescriptor,
+        data: bytes,
+        *,
+        extend: bool = False,
+        listener=None,
+    ):
+        """Write a file : its leader block, the blocks of its data, and its end of file block.
+
+        Args:
+            leader (LeaderTapeBlockDescriptor): the description of the file.
+            data (bytes): the content of the file.
+            extend (bool, optional): as for `writeBlock`. Defaults to False.
+            listener (TapeImageCliListener, optional): notified of each written block.
+        """
+        self.writeBlock(leader.toTapeBlock(), extend=extend)
+        if listener is not None:
+            listener.onBeginFileBlock(leader)
+        for block in TapeBlock.buildSequenceFromData(data):
+            self.writeBlock(block, extend=extend)
+            if listener is not None:
+                listener.onDataBlock(block)
+        self.writeBlock(
+            TapeBlock.buildFromData(None, TypeOfTapeBlock.EOF), extend=extend
+        )
+        if listener is not None:
+            listener.onEndBlock()
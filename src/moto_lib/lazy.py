@@ -0,0 +1,51 @@
+"""
+Lazy exports of packages, to import only the modules that are actually used.
+---
+(c) 2022~2024 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import importlib
+
+
+def lazyExports(packageName: str, exports: dict[str, str]):
+    """Create the module level `__getattr__` and `__dir__` of a package (PEP 562), importing
+    the module of an exported name on first access.
+
+    ```python
+    __all__ = ["Tape"]
+    __getattr__, __dir__ = lazyExports(__name__, {"Tape": ".tape"})
+    ```
+
+    Args:
+        packageName (str): the name of the package, i.e. `__name__`.
+        exports (dict[str, str]): the module, relative to the package, of each exported name.
+    """
+    package = importlib.import_module(packageName)
+
+    def __getattr__(name: str):
+        if name not in exports:
+            raise AttributeError(f"module {packageName!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], packageName), name)
+        setattr(package, name, value)  # next accesses do not go through there
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(package)) | set(exports))
+
+    return __getattr__, __dir__
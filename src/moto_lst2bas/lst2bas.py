@@ -19,17 +19,38 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
+import os
 import sys
 import re
 from argparse import ArgumentParser, RawDescriptionHelpFormatter
+from contextlib import nullcontext
 
 import io
 
+from moto_lib.fs_disk.controller import FileSystemController
+from moto_lib.fs_disk.image import TypeOfDiskImage
+from moto_lib.fs_disk.image_manager import (
+    SingleDiskImageManager,
+    DiskImageFromDiskManager,
+)
 from moto_lib.basic import (
+    BasicMemoryMapReport,
     ListingToAsciiBasicConverter,
     ListingToTokenizedBasicConverter,
+    Minifier,
+    TokenizedLineCache,
 )
 
+from moto_lib.basic.converter_from_listing import DEFAULT_LOAD_ADDRESS
+from moto_lib.basic.memory_map import END_OF_MEMORY
+
+from .watcher import ListingWatcher
+
+TYPES_OF_DISK_IMAGE = {
+    "FD": TypeOfDiskImage.EMULATOR_FLOPPY_IMAGE,
+    "SD": TypeOfDiskImage.SDDRIVE_FLOPPY_IMAGE,
+}
+
 
 def createArgParser() -> ArgumentParser:
     parser = ArgumentParser(
@@ -65,7 +86,82 @@ If not, see <https://www.gnu.org/licenses/>. 
         type=str,
         nargs="*",
         help="a list of plain text files to convert, MUST have the 'lst' extension (case insensitive) ;"
-        " to convert into an ASCII listing, append a ',a' after the extension (case insensitive)",
+        " to convert into an ASCII listing, append a ',a' after the extension (case insensitive) ;"
+        " '-' designates the standard input, converted into the standard output",
+    )
+
+    parser.add_argument(
+        "--cache",
+        metavar="<cache file>",
+        help="a json file where tokenized lines are kept between runs, so that only"
+        " the changed lines are tokenized again ; it is created when missing",
+    )
+
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="when converting into a tokenized BASIC file, remove the comments and the non"
+        " significant spaces, and merge the lines that are not referenced by a line number ;"
+        " the count of bytes saved is reported for each file",
+    )
+
+    parser.add_argument(
+        "--memory-map",
+        action="store_true",
+        help="when converting into a tokenized BASIC file, display the address and the size of"
+        " each line, the size of the program and the memory left ; the exit status is 1 when a"
+        " program does not fit",
+    )
+
+    parser.add_argument(
+        "--load-address",
+        metavar="<address>",
+        type=lambda value: int(value, 0),
+        help=f"the address of the first line of the program, e.g. 0x25A4 ; defaults to"
+        f" 0x{DEFAULT_LOAD_ADDRESS:04X}, the value of the BASIC of the MO5 ; required with"
+        " --target to",
+    )
+
+    parser.add_argument(
+        "--target",
+        choices=["mo5", "to"],
+        default="mo5",
+        help="the family of computers giving the end of the memory with --memory-map ;"
+        " with to, --load-address is required ; defaults to mo5",
+    )
+
+    parser.add_argument(
+        "--end-of-memory",
+        metavar="<address>",
+        type=lambda value: int(value, 0),
+        help="with --memory-map, the first address that the program cannot use, e.g. when"
+        " machine code is loaded above the program ; overrides the value of the target",
+    )
+
+    parser.add_argument(
+        "--watch",
+        metavar="<disk archive>",
+        help="a disk archive, with the 'sd' or 'fd' extension (case insensitive), that is kept"
+        " up to date : the source files are numbered like with moto_nl, then converted and"
+        " written into the disk archive each time they are modified ; it is created when missing",
+    )
+
+    parser.add_argument(
+        "--interval",
+        metavar="<seconds>",
+        type=float,
+        default=0.2,
+        help="with --watch, the delay between two checks of the source files ; defaults to 0.2",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="<count>",
+        type=int,
+        default=1,
+        help="the count of processes converting the source files in parallel ; errors are"
+        " reported for each source file, in the order of the source files ; defaults to 1",
     )
 
     return parser
@@ -73,6 +169,12 @@ If not, see <https://www.gnu.org/licenses/>. 
 
 class ListingToBasicCli:
     def __init__(self):
+        self._lineCache = None
+        self._minifier = None
+        self._loadAddress = DEFAULT_LOAD_ADDRESS
+        self._endOfMemory = None  # no memory map when None
+        self.countOfProgramsNotFitting = 0
+        self._reports = None  # where reports are written, the standard output when None
         # setup process dispatcher
         self._processors = {
             "LST": self.processIntoTokenizedBasicFile,
@@ -82,30 +184,224 @@ class ListingToBasicCli:
     def toUint16(self, value):
         return bytes([(value // 256) & 0xFF, value & 0xFF])
 
+    def openSource(self, source):
+        return nullcontext(sys.stdin) if source == "-" else open(source, "rt")
+
+    def openTarget(self, source):
+        return (
+            nullcontext(sys.stdout.buffer)
+            if source == "-"
+            else open(source[:-3] + "bas", "wb")
+        )
+
+    def openReports(self, source):
+        if source == "-":
+            return sys.stderr  # the standard output is the converted program
+        return self._reports if self._reports is not None else sys.stdout
+
+    def minify(self, source, f) -> list[str]:
+        minifier = self._minifier
+        lines = list(f)
+        minified = minifier.minify(lines)
+        sizeBefore = minifier.sizeOfProgram(lines)
+        sizeAfter = minifier.sizeOfProgram(minified)
+        print(
+            f"{source} : {sizeAfter} octets\t{sizeBefore - sizeAfter} octets saved.",
+            file=self.openReports(source),
+        )
+        return [f"{line}\n" for line in minified]
+
     def processIntoTokenizedBasicFile(self, source):
-        with open(source, "rt") as f:
-            with open(source[:-3] + "bas", "wb") as bas:
-                ListingToTokenizedBasicConverter().convert(f, bas)
+        with self.openSource(source) as f:
+            if self._minifier is not None:
+                f = self.minify(source, f)
+            converter = ListingToTokenizedBasicConverter(
+                self._lineCache, self._loadAddress
+            )
+            if self._endOfMemory is None:
+                with self.openTarget(source) as bas:
+                    converter.convert(f, bas)
+                return
+            program = io.BytesIO()
+            converter.convert(f, program)
+        with self.openTarget(source) as bas:
+            bas.write(program.getvalue())
+        self.printMemoryMap(
+            source,
+            BasicMemoryMapReport.buildFromProgram(
+                program.getvalue(), self._loadAddress, self._endOfMemory
+            ),
+        )
+
+    def printMemoryMap(self, source, report: BasicMemoryMapReport):
+        output = self.openReports(source)
+        for lineNumber, address, size in report.lines:
+            print(f"{lineNumber}\t${address:04X}\t{size} octets", file=output)
+        print(
+            f"{source} : {report.sizeOfProgram} octets"
+            f"\t${report.loadAddress:04X}-${report.endAddress - 1:04X}"
+            f"\t{report.freeMemory} octets free.",
+            file=output,
+        )
+        if report.freeMemory < 0:
+            self.countOfProgramsNotFitting += 1
 
     def processIntoAsciiBasicFile(self, source):
         source = source[:-2]  # because source is '<filename>,a'
-        with open(source, "rt") as f:
-            with open(source[:-3] + "bas", "wb") as bas:
+        with self.openSource(source) as f:
+            with self.openTarget(source) as bas:
                 ListingToAsciiBasicConverter().convert(f, bas)
 
+    def processSource(self, source: str):
+        if source.upper() in ["-", "-,A"]:
+            # standard input
+            self._processors[f"LST{source[1:].upper()}"](source)
+            return
+        dotPos = source.rfind(".")
+        if dotPos < 0:
+            raise ValueError(f"file.without.extension:{source}")
+
+        fileExtension = source[dotPos + 1 :].upper()
+        if fileExtension not in self._processors:
+            raise ValueError(
+                f"Extension 'lst' (case insensitive) not found for '{source}'."
+            )
+        self._processors[fileExtension](source)
+
+    def processInParallel(self, sources: list[str], jobs: int, cacheFile: str) -> int:
+        """Convert the source files with a pool of processes.
+
+        Returns:
+            int: 0 when all the source files have been converted, 1 otherwise.
+        """
+        if any(source.upper() in ["-", "-,A"] for source in sources):
+            raise ValueError("error.standard.input.with.jobs")
+        # not imported with the module, it is slow and only needed with --jobs
+        from concurrent.futures import ProcessPoolExecutor
+
+        returnCode = 0
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_initializeWorker,
+            initargs=(
+                cacheFile,
+                self._minifier is not None,
+                self._loadAddress,
+                self._endOfMemory,
+            ),
+        ) as executor:
+            for source, (error, reports, countOfNotFitting, usedLines) in zip(
+                sources, executor.map(_processInWorker, sources)
+            ):
+                sys.stdout.write(reports)
+                self.countOfProgramsNotFitting += countOfNotFitting
+                if self._lineCache is not None:
+                    self._lineCache.addUsedLines(usedLines)
+                if error is not None:
+                    print(f"Error on {source} : {error}")
+                    returnCode = 1
+        return 1 if self.countOfProgramsNotFitting > 0 else returnCode
+
+    def createWatcher(self, archive: str) -> ListingWatcher:
+        extension = archive[archive.rfind(".") + 1 :].upper()
+        typeOfArchive = TYPES_OF_DISK_IMAGE.get(extension)
+        if typeOfArchive is None:
+            raise ValueError(f"error.unknown.type.of.archive:{archive}")
+        if os.path.exists(archive):
+            imageManager = DiskImageFromDiskManager(typeOfArchive, archive)
+        else:
+            imageManager = SingleDiskImageManager(typeOfArchive, archive)
+            for side in imageManager.image.sides:
+                FileSystemController(side).initFileSystem()
+        return ListingWatcher(
+            self.args.sources,
+            imageManager,
+            ListingToTokenizedBasicConverter(self._lineCache, self._loadAddress),
+        )
+
     def run(self) -> int:
-        self.args = args = createArgParser().parse_args()
+        parser = createArgParser()
+        self.args = args = parser.parse_args()
+        if args.load_address is None:
+            if args.target != "mo5":
+                # the start of the programs depends on the model and its extensions
+                parser.error(f"--target {args.target} requires --load-address")
+            args.load_address = DEFAULT_LOAD_ADDRESS
+        self._lineCache = (
+            TokenizedLineCache(args.cache) if args.cache is not None else None
+        )
+        self._minifier = Minifier() if args.minify else None
+        self._loadAddress = args.load_address
+        if args.memory_map:
+            self._endOfMemory = (
+                args.end_of_memory
+                if args.end_of_memory is not None
+                else END_OF_MEMORY[args.target.upper()]
+            )
+        if args.watch is not None:
+            try:
+                self.createWatcher(args.watch).watch(args.interval)
+            except KeyboardInterrupt:
+                pass
+            finally:
+                if self._lineCache is not None:
+                    self._lineCache.save()
+            return 0
+
+        if args.jobs > 1:
+            returnCode = self.processInParallel(args.sources, args.jobs, args.cache)
+        else:
+            returnCode = 0
+            for source in args.sources:
+                self.processSource(source)
+            if self.countOfProgramsNotFitting > 0:
+                returnCode = 1
+
+        if self._lineCache is not None:
+            self._lineCache.save()
+        return returnCode
 
-        for source in args.sources:
-            dotPos = source.rfind(".")
-            if dotPos < 0:
-                raise ValueError(f"file.without.extension:{source}")
 
-            fileExtension = source[dotPos + 1 :].upper()
-            if fileExtension not in self._processors:
-                raise ValueError(
-                    f"Extension 'lst' (case insensitive) not found for '{source}'."
-                )
-            self._processors[fileExtension](source)
+###
+# Conversion inside the processes of the pool, each one having its own command line interface
+# and cache of tokenized lines.
+#
+_workerCli = None
 
-        return 0
+
+def _initializeWorker(cacheFile: str, minify: bool, loadAddress: int, endOfMemory: int):
+    global _workerCli
+    _workerCli = ListingToBasicCli()
+    if minify:
+        _workerCli._minifier = Minifier()
+    _workerCli._loadAddress = loadAddress
+    _workerCli._endOfMemory = endOfMemory
+    if cacheFile is not None:
+        _workerCli._lineCache = TokenizedLineCache(cacheFile)
+
+
+def _processInWorker(source: str) -> (str, str, int, dict[str, bytes]):
+    """Convert a source file.
+
+    The reports are returned instead of being printed, for the parent process to print them
+    in the order of the source files.
+
+    Returns:
+        (str, str, int, dict[str, bytes]): the error message, or None ; the reports ; the
+        count of programs not fitting into the memory ; and the tokenized lines used by the
+        conversion.
+    """
+    _workerCli._reports = io.StringIO()
+    _workerCli.countOfProgramsNotFitting = 0
+    try:
+        _workerCli.processSource(source)
+        error = None
+    except (ValueError, OSError) as e:
+        error = str(e)
+    lineCache = _workerCli._lineCache
+    return (
+        error,
+        _workerCli._reports.getvalue(),
+        _workerCli.countOfProgramsNotFitting,
+        lineCache.popUsedLines() if lineCache is not None else {},
+    )
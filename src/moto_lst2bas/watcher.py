@@ -0,0 +1,134 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import io
+import os
+import time
+
+from moto_lib.basic import (
+    LineNumbering,
+    ListingToAsciiBasicConverter,
+    ListingToTokenizedBasicConverter,
+)
+from moto_lib.fs_disk.catalog import TypeOfData, TypeOfDiskFile
+from moto_lib.fs_disk.controller import FileSystemController
+from moto_lib.fs_disk.image_manager import SingleDiskImageManager
+from moto_lib.fs_disk.sides import replaceFileOnSides
+
+
+class ListingWatcher:
+    """Keep a disk image up to date with a set of listings.
+
+    Each listing is numbered, converted and written into the disk image in memory, replacing
+    the previous version of the file ; the disk image is saved after each round of changes.
+    """
+
+    def __init__(
+        self,
+        sources: list[str],
+        imageManager: SingleDiskImageManager,
+        converter: ListingToTokenizedBasicConverter = None,
+    ):
+        """Initialize the watcher.
+
+        Args:
+            sources (list[str]): the listings to watch, with the 'lst' extension ; a listing to
+            convert into an ASCII basic file is suffixed by ',a'.
+            imageManager (SingleDiskImageManager): the manager of the disk image to update.
+            converter (ListingToTokenizedBasicConverter, optional): the converter to use, e.g.
+            with a line cache. Defaults to a new converter.
+        """
+        self._sources = sources
+        self._imageManager = imageManager
+        self._controllers = [
+            FileSystemController(side) for side in imageManager.image.sides
+        ]
+        self._converter = (
+            converter if converter is not None else ListingToTokenizedBasicConverter()
+        )
+        self._lastModifications = {}
+
+    def convert(self, source: str, asciiMode: bool) -> bytes:
+        numbering = LineNumbering()
+        with open(source, "rt") as f:
+            lines = [f"{numbering.numberLine(line)}\n" for line in f]
+        bas = io.BytesIO()
+        if asciiMode:
+            ListingToAsciiBasicConverter().convert(lines, bas)
+        else:
+            self._converter.convert(lines, bas)
+        return bas.getvalue()
+
+    def patchFile(
+        self, data: bytes, name: str, typeOfData: TypeOfData, extension: str = "BAS"
+    ):
+        """Replace the file inside the disk image, trying the side where it was first.
+
+        Raises:
+            ValueError: when no side has enough space ; the previous version is then kept.
+        """
+        replaceFileOnSides(
+            self._controllers,
+            data,
+            name,
+            extension,
+            typeOfFile=TypeOfDiskFile.BASIC_PROGRAM,
+            typeOfData=typeOfData,
+        )
+
+    def poll(self) -> list[str]:
+        """Convert the listings modified since the last poll, and save the disk image.
+
+        Returns:
+            list[str]: the updated files of the disk image.
+        """
+        updated = []
+        for source in self._sources:
+            asciiMode = source[-2:].upper() == ",A"
+            path = source[:-2] if asciiMode else source
+            try:
+                modification = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if self._lastModifications.get(source) == modification:
+                continue
+            self._lastModifications[source] = modification
+            name = os.path.basename(path)
+            name = name[: name.rfind(".")][:8].upper()
+            try:
+                self.patchFile(
+                    self.convert(path, asciiMode),
+                    name,
+                    TypeOfData.ASCII_DATA if asciiMode else TypeOfData.BINARY_DATA,
+                )
+                updated.append(f"{name}.BAS")
+            except ValueError as error:
+                print(f"Error on {source} : {error}")
+        if len(updated) > 0:
+            self._imageManager.save()
+        return updated
+
+    def watch(self, interval: float):
+        while True:
+            for file in self.poll():
+                print(file)
+            time.sleep(interval)
@@ -20,9 +20,10 @@ If not, see <https://www.gnu.org/licenses/>.
 """
 
 import sys
-import re
 from argparse import ArgumentParser, RawDescriptionHelpFormatter
 
+from moto_lib.basic import LineNumbering, Renumbering, readLines
+
 
 def createArgParser() -> ArgumentParser:
     parser = ArgumentParser(
@@ -93,41 +94,42 @@ If not, see <https://www.gnu.org/licenses/>. 
         default=0,
         help=f"When specified, the number will be padded with spaces to occupy the required width.",
     )
+
+    parser.add_argument(
+        "--renumber",
+        action="store_true",
+        help=f"When present, all the lines are renumbered, and the line numbers following "
+        "GOTO, GOSUB, THEN, ELSE, RESTORE, RESUME and RUN are updated accordingly.",
+    )
     return parser
 
 
 class NumberLineCli:
-    def processLine(self, line: str):
+    def processLine(self, line: str) -> str:
+        return self.numbering.numberLine(line) + "\n"
+
+    def renumber(self, lines: list[str]):
         args = self.args
-        line = line.rstrip("\n")
-        match = re.search("^([1-9][0-9]*).*$", line)
-        if match is None:
-            paddedNumber = f"{self.numberLine}"
-            if len(paddedNumber) < args.number_width:
-                paddedNumber += "".join(
-                    [" " for i in range(len(paddedNumber), args.number_width)]
-                )
-            print(f"{paddedNumber} {line}")
-            self.numberLine += args.line_increment
-        else:
-            print(line)
-            self.numberLine = int(match.group(1)) + args.line_increment
+        renumbering = Renumbering(
+            args.starting_line_number, args.line_increment, args.number_width
+        )
+        sys.stdout.writelines(f"{line}\n" for line in renumbering.renumber(lines))
+        for lineNumber, target in renumbering.undefinedReferences:
+            print(
+                f"Warning : undefined line {target} referenced at line {lineNumber}",
+                file=sys.stderr,
+            )
 
     def run(self) -> int:
         self.args = args = createArgParser().parse_args()
-        self.numberLine = numberLine = args.starting_line_number
-        if len(args.sources) > 0:
-            for source in args.sources:
-                if source == "-":
-                    for line in sys.stdin:
-                        self.processLine(line)
-                else:
-                    with open(source, "rt") as f:
-                        lines = f.readlines()
-                    for line in lines:
-                        self.processLine(line)
-        else:
-            for line in sys.stdin:
-                self.processLine(line)
+        if args.renumber:
+            self.renumber(list(readLines(args.sources)))
+            return 0
+
+        self.numbering = LineNumbering(
+            args.starting_line_number, args.line_increment, args.number_width
+        )
+        # the output is written by chunks by the buffer of sys.stdout
+        sys.stdout.writelines(map(self.processLine, readLines(args.sources)))
 
         return 0
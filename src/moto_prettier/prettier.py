@@ -19,10 +19,12 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
-import re
 import sys
 from argparse import ArgumentParser, RawDescriptionHelpFormatter
 
+from moto_lib.basic.scanner import splitLitterals
+from moto_lib.basic.sources import readLines
+
 
 def createArgParser() -> ArgumentParser:
     parser = ArgumentParser(
@@ -66,32 +68,15 @@ If not, see <https://www.gnu.org/licenses/>. 
 
 
 class PrettierCli:
-    def processLine(self, line: str):
-        args = self.args
-        line = line.rstrip("\n")
-        groups = re.split('([^"])', line)
-        dquote_depth = 0
-        result = ""
-        for group in groups:
-            if group == '"':
-                dquote_depth = (dquote_depth + 1) & 0x1
-            result += group.upper() if dquote_depth == 0 else group
-        print(result)
+    def processLine(self, line: str) -> str:
+        """Convert the line to uppercase, except inside string litterals."""
+        parts = splitLitterals(line.rstrip("\n"))
+        for i in range(0, len(parts), 2):
+            parts[i] = parts[i].upper()
+        return "".join(parts) + "\n"
 
     def run(self) -> int:
         self.args = args = createArgParser().parse_args()
-        if len(args.sources) > 0:
-            for source in args.sources:
-                if source == "-":
-                    for line in sys.stdin:
-                        self.processLine(line)
-                else:
-                    with open(source, "rt") as f:
-                        lines = f.readlines()
-                    for line in lines:
-                        self.processLine(line)
-        else:
-            for line in sys.stdin:
-                self.processLine(line)
-
+        # the output is written by chunks by the buffer of sys.stdout
+        sys.stdout.writelines(map(self.processLine, readLines(args.sources)))
         return 0
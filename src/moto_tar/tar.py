@@ -26,6 +26,7 @@ from argparse import ArgumentParser, RawDescriptionHelpFormatter, FileType
 from typing import List, Union, Optional
 from enum import Enum
 
+from moto_lib.archive_options import addArchiveCacheArguments, addBatchArguments
 from moto_lib.fs_tape import LeaderTapeBlockDescriptor, Tape, TapeBlock, TypeOfTapeBlock
 from moto_lib.fs_tape.listeners import (
     TapeImageCliListener,
@@ -33,15 +34,15 @@ from moto_lib.fs_tape.listeners import (
     TapeImageCliListenerVerbose,
 )
 
+from moto_lib.fs_tape.tape import (
+    DEFAULT_COUNT_OF_SYNC_BYTES,
+    MIN_COUNT_OF_SYNC_BYTES,
+)
 from moto_lib.fs_tape.image_manager import (
     SingleTapeImageManager,
     TapeImageFromDiskManager,
 )
-from moto_lib.fs_tape.image_worker import (
-    TapeImageContentEnumerator,
-    TapeImageContentExtractor,
-    TapeImageContentInjector,
-)
+from moto_lib.fs_tape import image_worker
 
 
 class TapeArchiveCli:
@@ -114,6 +115,20 @@ If not, see <https://www.gnu.org/licenses/>. 
             const="extract",
             help=f"Extract all the files contained inside the designated tape archive.",
         )
+        commandGroup.add_argument(
+            "--to-wav",
+            dest="action",
+            action="store_const",
+            const="to-wav",
+            help=f"Render the designated tape archive into a wave file, to be played into a real MO/TO computer.",
+        )
+        commandGroup.add_argument(
+            "--from-wav",
+            dest="action",
+            action="store_const",
+            const="from-wav",
+            help=f"Decode the designated wave files, recordings of tapes, into the designated tape archive.",
+        )
 
         parser.add_argument(
             "-v",
@@ -126,20 +141,50 @@ If not, see <https://www.gnu.org/licenses/>. 
             "--into",
             help="directory where output files will be generated.",
         )
+
+        packGroup = parser.add_argument_group(
+            "tape layout, when creating a tape archive"
+        )
+        packGroup.add_argument(
+            "--pack",
+            action="store_true",
+            help=f"When present, the tape archive is not padded, and its length and playback time are reported.",
+        )
+        packGroup.add_argument(
+            "--boot",
+            metavar="<file>",
+            action="append",
+            help=f"a file loaded when booting the program, to be put first on the tape ; repeat the option in the order the files are loaded.",
+        )
+        packGroup.add_argument(
+            "--sync-length",
+            metavar="<count>",
+            type=int,
+            default=DEFAULT_COUNT_OF_SYNC_BYTES,
+            help=f"count of synchronization bytes before each block, at least {MIN_COUNT_OF_SYNC_BYTES} ; defaults to {DEFAULT_COUNT_OF_SYNC_BYTES}.",
+        )
+
+        addArchiveCacheArguments(parser)
+        addBatchArguments(parser)
         return parser
 
     def __init__(self):
         self._imageManagers = {
             # "add": TapeImageFromDiskManager,
             "create": SingleTapeImageManager,
+            "from-wav": SingleTapeImageManager,
             "extract": TapeImageFromDiskManager,
             "list": TapeImageFromDiskManager,
+            "to-wav": TapeImageFromDiskManager,
         }
+        # names of the workers, imported only for the requested action
         self._workers = {
-            # "add": TapeImageContentInjector(),
-            "create": TapeImageContentInjector(),
-            "extract": TapeImageContentExtractor(),
-            "list": TapeImageContentEnumerator(),
+            # "add": "TapeImageContentInjector",
+            "create": "TapeImageContentInjector",
+            "from-wav": "TapeImageAudioImporter",
+            "extract": "TapeImageContentExtractor",
+            "list": "TapeImageContentEnumerator",
+            "to-wav": "TapeImageAudioExporter",
         }
         pass
 
@@ -150,13 +195,23 @@ If not, see <https://www.gnu.org/licenses/>. 
             else TapeImageCliListenerQuiet(operation)
         )
 
+    def createWorker(self, action: str) -> "image_worker.TapeImageWorker":
+        return getattr(image_worker, self._workers[action])()
+
     def createImageManager(self, args) -> SingleTapeImageManager:
         if args.action not in self._imageManagers:
             raise RuntimeError(f"action.not.implemented.yet:{args.action}")
         return self._imageManagers[args.action](args.archive)
 
     def run(self) -> int:
-        args = TapeArchiveCli.createArgParser().parse_args()
+        parser = TapeArchiveCli.createArgParser()
+        args = parser.parse_args()
+        if args.batch:
+            if args.action != "list":
+                parser.error("--batch is only supported with --list")
+            from moto_lib.batch import ArchiveBatch
+
+            return ArchiveBatch(args.archive, "k7", args.jobs, args.ordered).run()
         sources = args.sources
 
         listener = self.createListener(
@@ -168,4 +223,24 @@ If not, see <https://www.gnu.org/licenses/>. 
         if args.action not in self._workers:
             raise RuntimeError(f"action.not.implemented.yet:{args.action}")
 
-        return self._workers[args.action].perform(args, imageManager, listener)
+        cache = None
+        if args.action == "create" and args.cache_dir is not None:
+            from moto_lib.build.cache import ArchiveCache, createArchiveCache
+
+            cache = createArchiveCache(args)
+            options = {
+                "pack": args.pack,
+                "boot": args.boot,
+                "syncLength": args.sync_length,
+            }
+            key = ArchiveCache.keyOf("k7", sources, options)
+            if cache.fetch(key, args.archive):
+                if args.verbose:
+                    print(f"{args.archive} : from the cache.")
+                return 0
+
+        worker = self.createWorker(args.action)
+        returnCode = worker.perform(args, imageManager, listener)
+        if cache is not None and returnCode == 0:
+            cache.store(key, args.archive)
+        return returnCode
@@ -0,0 +1,103 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import json
+import sys
+from argparse import ArgumentParser, RawDescriptionHelpFormatter
+
+from moto_lib.basic import ListingAnalyzer
+
+
+def createArgParser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="python3 -m moto_xref",
+        description="Index the line numbers, the references to line numbers, the variables and the DATA statements of BASIC listings, in JSON.",
+        epilog="""---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>. 
+---
+""",
+        formatter_class=RawDescriptionHelpFormatter,
+        allow_abbrev=False,
+    )
+
+    # Add the arguments
+    parser.add_argument(
+        "sources",
+        metavar="<source file>",
+        type=str,
+        nargs="*",
+        help="a list of numbered plain text files to analyze ; '-' designates the standard"
+        " input, that is also used when there is no source file",
+    )
+
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="When present, the exit status is 1 when a listing refers to a missing line.",
+    )
+
+    parser.add_argument(
+        "--indent",
+        metavar="<count>",
+        type=int,
+        default=None,
+        help="the count of spaces to indent the JSON output ; by default, the output is compact",
+    )
+
+    return parser
+
+
+class CrossReferenceCli:
+    def analyzeSource(self, source: str, analyzer: ListingAnalyzer) -> dict:
+        if source == "-":
+            return analyzer.analyze(sys.stdin)
+        with open(source, "rt") as f:
+            return analyzer.analyze(f)
+
+    def run(self) -> int:
+        self.args = args = createArgParser().parse_args()
+        sources = args.sources if len(args.sources) > 0 else ["-"]
+
+        analyzer = ListingAnalyzer()
+        index = {source: self.analyzeSource(source, analyzer) for source in sources}
+        print(json.dumps(index, indent=args.indent))
+
+        if args.check and any(
+            len(analysis["danglingReferences"]) > 0 for analysis in index.values()
+        ):
+            return 1
+        return 0
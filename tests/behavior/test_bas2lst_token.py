@@ -0,0 +1,104 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import filecmp
+import os
+import shutil
+import sys
+import io
+
+from unittest.mock import patch
+from contextlib import redirect_stdout, redirect_stderr
+
+from moto_bas2lst import BasicToListingCli
+
+from .utils import initializeTmpWorkspace
+
+source_dir = os.path.join(".", "tests", "data")
+source_dir_expected = os.path.join(".", "tests", "data.expected")
+
+
+def test_that_it_convert_token_basic_to_plain_text():
+    tmp_dir = initializeTmpWorkspace(
+        [os.path.join(source_dir_expected, "l2bin-to-tokenize.bas")]
+    )
+    baseArgs = ["prog", os.path.join(tmp_dir, "l2bin-to-tokenize.bas")]
+    with patch.object(sys, "argv", baseArgs):
+        with redirect_stdout(io.StringIO()) as out:
+            with redirect_stderr(io.StringIO()) as err:
+                returnCode = BasicToListingCli().run()
+        assert returnCode == 0
+        assert out.getvalue() == ""
+        assert err.getvalue() == ""
+        pathActual = os.path.join(tmp_dir, "l2bin-to-tokenize.lst")
+        assert os.path.exists(pathActual) and os.path.isfile(pathActual)
+        assert filecmp.cmp(
+            pathActual,
+            os.path.join(source_dir, "l2bin-to-tokenize.lst"),
+            shallow=False,
+        )
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_it_converts_all_the_basic_files_of_a_directory():
+    files = ["B2LIN.BAS", "C5000.BAS", "C5002.BAS"]
+    tmp_dir = initializeTmpWorkspace([os.path.join(source_dir, f) for f in files])
+    with patch.object(sys, "argv", ["prog", tmp_dir]):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = BasicToListingCli().run()
+        assert returnCode == 0
+        assert out.getvalue() == ""
+        for f in files:
+            pathActual = os.path.join(tmp_dir, f"{f[:-3]}lst")
+            assert os.path.exists(pathActual) and os.path.isfile(pathActual)
+        assert filecmp.cmp(
+            os.path.join(tmp_dir, "B2LIN.lst"),
+            os.path.join(source_dir_expected, "B2LIN-unix.lst"),
+            shallow=False,
+        )
+        assert filecmp.cmp(
+            os.path.join(tmp_dir, "C5002.lst"),
+            os.path.join(source_dir, "l2bin-to-tokenize.lst"),
+            shallow=False,
+        )
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_parallel_mode_converts_all_files():
+    files = ["B2LIN.BAS", "C5000.BAS", "C5002.BAS"]
+    tmp_dir = initializeTmpWorkspace([os.path.join(source_dir, f) for f in files])
+    with patch.object(sys, "argv", ["prog", "-j", "2", tmp_dir]):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = BasicToListingCli().run()
+        assert returnCode == 0
+        assert out.getvalue() == ""
+        assert filecmp.cmp(
+            os.path.join(tmp_dir, "C5002.lst"),
+            os.path.join(source_dir, "l2bin-to-tokenize.lst"),
+            shallow=False,
+        )
+        assert filecmp.cmp(
+            os.path.join(tmp_dir, "B2LIN.lst"),
+            os.path.join(source_dir_expected, "B2LIN-unix.lst"),
+            shallow=False,
+        )
+    shutil.rmtree(tmp_dir)
@@ -0,0 +1,194 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import io
+import os
+import shutil
+import sys
+
+from unittest.mock import patch
+from contextlib import redirect_stdout
+
+from moto_build import BuildCli
+from moto_lib.fs_disk.catalog import TypeOfData, TypeOfDiskFile
+from moto_lib.fs_disk.controller import FileSystemController
+from moto_lib.fs_disk.image_manager import DiskImageFromDiskManager
+from moto_lib.fs_disk.image import TypeOfDiskImage
+from moto_lib.fs_tape.consts import TypeOfTapeBlock
+from moto_lib.fs_tape.image_manager import TapeImageFromDiskManager
+
+from .utils import initializeTmpWorkspace
+
+
+def prepareSources(tmp_dir: str) -> list[str]:
+    sources = {
+        "hello.lst": "CLS\nPRINT 1\n",
+        "other.lst": "10 END\n",
+        "data.dat": "abc",
+    }
+    for name, content in sources.items():
+        with open(os.path.join(tmp_dir, name), "wt") as f:
+            f.write(content)
+    return [
+        os.path.join(tmp_dir, "hello.lst"),
+        os.path.join(tmp_dir, "other.lst,a"),
+        os.path.join(tmp_dir, "data.dat"),
+    ]
+
+
+def test_that_it_builds_a_disk_archive():
+    tmp_dir = initializeTmpWorkspace([])
+    archive = os.path.join(tmp_dir, "out.sd")
+    with patch.object(
+        sys, "argv", ["prog", "--into", archive] + prepareSources(tmp_dir)
+    ):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = BuildCli().run()
+        assert returnCode == 0
+        assert out.getvalue() == ""
+    image = DiskImageFromDiskManager(TypeOfDiskImage.SDDRIVE_FLOPPY_IMAGE, archive)
+    controller = FileSystemController(image.image.sides[0])
+    files = [
+        (entry.record.toDict(), bytes(controller.readFile(entry)))
+        for entry in controller.listFiles()
+    ]
+    assert [(f["name"], f["extension"], f["typeOfData"]) for f, _ in files] == [
+        ("HELLO   ", "BAS", "TOKEN"),
+        ("OTHER   ", "BAS", "ASCII"),
+        ("DATA    ", "DAT", "BINARY"),
+    ]
+    assert files[0][1] == bytes.fromhex("ff001025aa000a9d0025b20014ab2031000000")
+    assert files[1][1] == b"\r10 END\r"
+    assert files[2][1] == b"abc"
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_it_builds_a_tape_archive():
+    tmp_dir = initializeTmpWorkspace([])
+    archive = os.path.join(tmp_dir, "out.k7")
+    with patch.object(
+        sys, "argv", ["prog", "-v", "--into", archive] + prepareSources(tmp_dir)
+    ):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = BuildCli().run()
+        assert returnCode == 0
+        assert out.getvalue().splitlines()[1] == (
+            f"OTHER.BAS\tBASIC\tASCII\t8 octets\t<-- {tmp_dir}/other.lst,a"
+        )
+    tape = TapeImageFromDiskManager(archive).image
+    types = []
+    block = tape.nextBlock()
+    while block is not None:
+        types.append(block.type)
+        block = tape.nextBlock()
+    assert (
+        types
+        == [
+            TypeOfTapeBlock.LEADER,
+            TypeOfTapeBlock.DATA,
+            TypeOfTapeBlock.EOF,
+        ]
+        * 3
+    )
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_it_fails_on_unknown_type_of_archive():
+    tmp_dir = initializeTmpWorkspace([])
+    archive = os.path.join(tmp_dir, "out.zip")
+    with patch.object(
+        sys, "argv", ["prog", "--into", archive] + prepareSources(tmp_dir)
+    ):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = BuildCli().run()
+        assert returnCode == 1
+        assert out.getvalue().startswith("Error : error.unknown.type.of.archive:")
+    shutil.rmtree(tmp_dir)
+
+
+def runBuild(args: list[str]) -> (int, str):
+    with patch.object(sys, "argv", ["prog"] + args):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = BuildCli().run()
+    return (returnCode, out.getvalue())
+
+
+def test_that_it_builds_a_manifest_incrementally():
+    tmp_dir = initializeTmpWorkspace([])
+    prepareSources(tmp_dir)
+    manifest = os.path.join(tmp_dir, "game.toml")
+    with open(manifest, "wt") as f:
+        f.write(
+            'archive = "game.fd"\n'
+            "[[sides]]\n"
+            "files = [\n"
+            '    { source = "hello.lst", type = "AUTO.BAT" },\n'
+            '    { source = "other.lst", type = "BAS,A" },\n'
+            '    { source = "data.dat" },\n'
+            "]\n"
+        )
+    assert runBuild(["-v", "--manifest", manifest]) == (
+        0,
+        "0:AUTO.BAT\n0:OTHER.BAS\n0:DATA.DAT\n",
+    )
+    # nothing changed
+    assert runBuild(["-v", "--manifest", manifest]) == (0, "")
+
+    # only the modified source is converted again
+    with open(os.path.join(tmp_dir, "hello.lst"), "wt") as f:
+        f.write("CLS\nPRINT 2\n")
+    assert runBuild(["-v", "--manifest", manifest]) == (0, "0:AUTO.BAT\n")
+    image = DiskImageFromDiskManager(
+        TypeOfDiskImage.EMULATOR_FLOPPY_IMAGE, os.path.join(tmp_dir, "game.fd")
+    )
+    controller = FileSystemController(image.image.sides[0])
+    entry = controller.findFile("AUTO", "BAT")
+    assert controller.readFile(entry)[-6:] == b"\xab 2\x00\x00\x00"  # PRINT 2
+    assert len(controller.listFiles()) == 3
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_it_keeps_the_sides_missing_from_the_manifest_when_updating():
+    tmp_dir = initializeTmpWorkspace([])
+    prepareSources(tmp_dir)
+    manifest = os.path.join(tmp_dir, "game.toml")
+    with open(manifest, "wt") as f:
+        f.write(
+            'archive = "game.sd"\n'
+            "[[sides]]\n"
+            'files = [{ source = "hello.lst", type = "AUTO.BAT" }]\n'
+        )
+    assert runBuild(["-v", "--manifest", manifest]) == (0, "0:AUTO.BAT\n")
+
+    # a file written by another tool on a side not listed by the manifest
+    archive = os.path.join(tmp_dir, "game.sd")
+    image = DiskImageFromDiskManager(TypeOfDiskImage.SDDRIVE_FLOPPY_IMAGE, archive)
+    FileSystemController(image.image.sides[1]).writeFile(b"xyz", "OTHER", "DAT")
+    image.save()
+
+    with open(os.path.join(tmp_dir, "hello.lst"), "wt") as f:
+        f.write("CLS\nPRINT 2\n")
+    assert runBuild(["-v", "--manifest", manifest]) == (0, "0:AUTO.BAT\n")
+    image = DiskImageFromDiskManager(TypeOfDiskImage.SDDRIVE_FLOPPY_IMAGE, archive)
+    controller = FileSystemController(image.image.sides[1])
+    assert controller.readFile(controller.findFile("OTHER", "DAT")) == b"xyz"
+    shutil.rmtree(tmp_dir)
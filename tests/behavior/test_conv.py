@@ -0,0 +1,101 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import filecmp
+import os
+import shutil
+import sys
+import io
+
+from unittest.mock import patch
+from contextlib import redirect_stdout
+
+from moto_conv import ArchiveConverterCli
+from moto_lib.fs_disk.catalog import TypeOfData, TypeOfDiskFile
+from moto_lib.fs_disk.controller import FileSystemController
+from moto_lib.fs_disk.image_manager import DiskImageFromDiskManager
+from moto_lib.fs_disk.image import TypeOfDiskImage
+from moto_tar import TapeArchiveCli
+
+from .utils import initializeTmpWorkspace
+
+source_dir = os.path.join(".", "tests", "data")
+input_archive = "sporny-basic.k7"
+expected_listing = """BANNER.BAS\tBASIC\tTOKEN\t#1\t102 octets\t1 blocks.
+BANNER2.BAS\tBASIC\tTOKEN\t#4\t102 octets\t1 blocks.
+C5000.BAS\tBASIC\tTOKEN\t#7\t794 octets\t4 blocks.
+C5001.BAS\tBASIC\tTOKEN\t#13\t804 octets\t4 blocks.
+C5001LST.BAS\tBASIC\tASCII\t#19\t942 octets\t4 blocks.
+C5002.BAS\tBASIC\tTOKEN\t#25\t836 octets\t4 blocks.
+"""
+
+
+def runCli(cli, args):
+    with patch.object(sys, "argv", ["prog"] + args):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = cli.run()
+    return returnCode, out.getvalue()
+
+
+def test_that_it_does_convert_a_tape_into_a_disk_keeping_types():
+    tmp_dir = initializeTmpWorkspace([os.path.join(source_dir, input_archive)])
+    returnCode, out = runCli(
+        ArchiveConverterCli(),
+        ["--to", "sd", "-v", os.path.join(tmp_dir, input_archive)],
+    )
+    assert returnCode == 0
+    assert out == expected_listing
+
+    manager = DiskImageFromDiskManager(
+        TypeOfDiskImage.SDDRIVE_FLOPPY_IMAGE,
+        os.path.join(tmp_dir, "sporny-basic.sd"),
+    )
+    controller = FileSystemController(manager.image.sides[0])
+    entries = {e.toDict()["name"].rstrip(): e for e in controller.listFiles()}
+    assert len(entries) == 6
+    assert entries["C5001LST"].record.typeOfFile == TypeOfDiskFile.BASIC_PROGRAM
+    assert entries["C5001LST"].record.typeOfData == TypeOfData.ASCII_DATA
+    assert entries["C5002"].record.typeOfData == TypeOfData.BINARY_DATA
+    with open(os.path.join(source_dir, "C5002.BAS"), "rb") as f:
+        assert controller.readFile(entries["C5002"]) == f.read()
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_it_does_convert_back_a_disk_into_a_tape():
+    tmp_dir = initializeTmpWorkspace([os.path.join(source_dir, input_archive)])
+    runCli(ArchiveConverterCli(), ["--to", "fd", os.path.join(tmp_dir, input_archive)])
+    os.remove(os.path.join(tmp_dir, input_archive))
+
+    returnCode, out = runCli(
+        ArchiveConverterCli(), ["--to", "k7", os.path.join(tmp_dir, "sporny-basic.fd")]
+    )
+    assert returnCode == 0
+    assert (
+        out
+        == "BANNER.BAS\nBANNER2.BAS\nC5000.BAS\nC5001.BAS\nC5001LST.BAS\nC5002.BAS\n"
+    )
+
+    returnCode, out = runCli(
+        TapeArchiveCli(), ["-tv", os.path.join(tmp_dir, input_archive)]
+    )
+    assert out == expected_listing
+    shutil.rmtree(tmp_dir)
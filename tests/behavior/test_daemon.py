@@ -0,0 +1,124 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import io
+import os
+import shutil
+import sys
+import threading
+
+from unittest.mock import patch
+from contextlib import redirect_stdout
+
+from moto_client import ClientCli, DaemonClient
+from moto_client.client import mustRunLocally
+from moto_daemon import MotoDaemon
+
+from .utils import initializeTmpWorkspace
+
+source_dir = os.path.join(".", "tests", "data")
+
+input_archive = "sporny-basic.k7"
+
+expected_listing = """BANNER.BAS
+BANNER2.BAS
+C5000.BAS
+C5001.BAS
+C5001LST.BAS
+C5002.BAS
+"""
+
+
+def startDaemon(socketPath: str) -> threading.Thread:
+    daemon = MotoDaemon(socketPath)
+    thread = threading.Thread(target=daemon.serve)
+    thread.start()
+    return thread
+
+
+def test_that_the_daemon_runs_the_tools_from_the_directory_of_the_client():
+    tmp_dir = initializeTmpWorkspace([os.path.join(source_dir, input_archive)])
+    socketPath = os.path.join(os.path.abspath(tmp_dir), "daemon.sock")
+    thread = startDaemon(socketPath)
+    try:
+        client = DaemonClient(socketPath)
+        returnCode, out, err = client.run("tar", ["-t", input_archive])
+        assert returnCode == 1  # not in the current directory
+        assert b"FileNotFoundError" in err
+
+        savedDirectory = os.getcwd()
+        os.chdir(tmp_dir)
+        try:
+            returnCode, out, err = client.run("tar", ["-t", input_archive])
+        finally:
+            os.chdir(savedDirectory)
+        assert returnCode == 0
+        assert out.decode("utf-8") == expected_listing
+        assert err == b""
+
+        returnCode, out, err = client.run("tar", [])
+        assert returnCode == 2
+        assert b"error: the following arguments are required" in err
+    finally:
+        DaemonClient(socketPath).stop()
+        thread.join()
+    assert not os.path.exists(socketPath)
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_the_client_runs_the_tool_locally_without_daemon():
+    tmp_dir = initializeTmpWorkspace([])
+    socketPath = os.path.join(tmp_dir, "daemon.sock")
+    baseArgs = ["prog", "tar", "-t", os.path.join(source_dir, input_archive)]
+    with patch.dict(os.environ, {"MOTO_DAEMON_SOCKET": socketPath}):
+        with patch.object(sys, "argv", baseArgs):
+            with redirect_stdout(io.StringIO()) as out:
+                returnCode = ClientCli().run()
+    assert returnCode == 0
+    assert out.getvalue() == expected_listing
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_the_client_runs_the_filters_reading_stdin_locally():
+    assert mustRunLocally("xref", [])
+    assert mustRunLocally("nl", ["-i", "5", "--renumber"])
+    assert mustRunLocally("nl", ["-i", "5", "--"])
+    assert not mustRunLocally("nl", ["-i", "5", "prog.lst"])
+    assert not mustRunLocally("xref", ["--indent", "2", "--", "prog.lst"])
+    assert not mustRunLocally("tar", ["-t", "archive.k7"])
+
+    tmp_dir = initializeTmpWorkspace([])
+    socketPath = os.path.join(os.path.abspath(tmp_dir), "daemon.sock")
+    thread = startDaemon(socketPath)
+    try:
+        stdin = io.TextIOWrapper(io.BytesIO(b"10 PRINT 1\n20 GOTO 10\n"))
+        with patch.dict(os.environ, {"MOTO_DAEMON_SOCKET": socketPath}):
+            with patch.object(sys, "argv", ["prog", "xref"]):
+                with patch.object(sys, "stdin", stdin):
+                    with redirect_stdout(io.StringIO()) as out:
+                        returnCode = ClientCli().run()
+    finally:
+        DaemonClient(socketPath).stop()
+        thread.join()
+    assert returnCode == 0
+    assert '"lines": [10, 20]' in out.getvalue()
+    shutil.rmtree(tmp_dir)
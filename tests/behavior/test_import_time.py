@@ -0,0 +1,106 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# the budget of the import of the entry point of a tool, in microseconds, as measured by
+# `python -X importtime` ; it was about 100 ms for moto_sdar when everything was imported
+# eagerly, and is about 20 ms now. The default budget leaves room for a loaded machine, a
+# stricter budget can be given by the environment.
+BUDGET_OF_IMPORT = int(os.environ.get("MOTO_IMPORT_TIME_BUDGET", "75000"))
+
+# modules that must not be imported before a tool actually needs them
+SLOW_MODULES = [
+    "concurrent.futures",
+    "importlib.metadata",
+    "multiprocessing",
+    "moto_lib.batch",
+    "moto_lib.build.cache",
+]
+
+ENTRY_POINTS = [
+    "moto_bas2lst.__main__",
+    "moto_conv.__main__",
+    "moto_lst2bas.__main__",
+    "moto_sdar.__main__",
+    "moto_tar.__main__",
+    "moto_xref.__main__",
+]
+
+source_dir = os.path.abspath(os.path.join(".", "src"))
+
+
+def measureImport(module: str, countOfRuns: int = 1) -> dict[str, int]:
+    """Import a module in a new interpreter, from the sources.
+
+    Returns:
+        dict[str, int]: the cumulative duration of the import of each imported module, in
+        microseconds ; the lowest of the runs.
+    """
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        [source_dir, environment.get("PYTHONPATH", "")]
+    )
+    measures = {}
+    for _ in range(countOfRuns):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            env=environment,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in result.stderr.splitlines():
+            # import time: <self> | <cumulative> | <indented name>
+            fields = line.removeprefix("import time:").split("|")
+            if len(fields) != 3 or not fields[1].strip().isdigit():
+                continue
+            name, cumulative = fields[2].strip(), int(fields[1])
+            measures[name] = min(cumulative, measures.get(name, cumulative))
+    return measures
+
+
+@pytest.mark.parametrize("entryPoint", ENTRY_POINTS)
+def test_that_the_entry_point_of_a_tool_imports_no_slow_module(entryPoint):
+    measures = measureImport(entryPoint)
+    assert [m for m in SLOW_MODULES if m in measures] == []
+
+
+@pytest.mark.parametrize("entryPoint", ENTRY_POINTS + ["moto_client.__main__"])
+def test_that_the_entry_point_of_a_tool_is_imported_within_budget(entryPoint):
+    measures = measureImport(entryPoint, countOfRuns=3)
+    assert measures[entryPoint] <= BUDGET_OF_IMPORT
+
+
+def test_that_archive_tools_import_no_worker_before_choosing_the_action():
+    for entryPoint in ["moto_sdar.__main__", "moto_tar.__main__"]:
+        measures = measureImport(entryPoint)
+        assert [m for m in measures if ".image_worker." in m] == []
+
+
+def test_that_the_client_imports_nothing_of_the_tools():
+    measures = measureImport("moto_client.__main__")
+    assert [m for m in measures if m.startswith("moto_lib")] == []
@@ -20,6 +20,7 @@ If not, see <https://www.gnu.org/licenses/>.
 """
 
 import filecmp
+import json
 import os
 import shutil
 import time
@@ -27,9 +28,12 @@ import sys
 import io
 from typing import List, Union, Optional
 
+import pytest
+
 from unittest.mock import patch
-from contextlib import redirect_stdout
+from contextlib import redirect_stdout, redirect_stderr
 
+from moto_lib.basic import TokenizedLineCache
 from moto_lst2bas import ListingToBasicCli
 
 from .utils import (
@@ -65,3 +69,185 @@ def test_that_it_convert_plain_text_to_token_basic():
                 shallow=False,
             )
     shutil.rmtree(tmp_dir)
+
+
+def test_that_it_convert_standard_input_into_standard_output():
+    with open(os.path.join(source_dir, "l2bin-to-tokenize.lst"), "rb") as f:
+        stdin = io.TextIOWrapper(io.BytesIO(f.read()))
+    stdout = io.TextIOWrapper(io.BufferedWriter(io.BytesIO()))
+    stdout.buffer.seekable = lambda: False  # like a pipe
+    with patch.object(sys, "argv", ["prog", "-"]):
+        with patch.object(sys, "stdin", stdin), patch.object(sys, "stdout", stdout):
+            returnCode = ListingToBasicCli().run()
+        assert returnCode == 0
+    stdout.flush()
+    with open(os.path.join(source_dir_expected, "l2bin-to-tokenize.bas"), "rb") as f:
+        assert stdout.buffer.raw.getvalue() == f.read()
+
+
+def test_that_it_reuses_the_tokenized_lines_of_the_cache():
+    tmp_dir = initializeTmpWorkspace(
+        [os.path.join(source_dir, f) for f in source_files]
+    )
+    cacheFile = os.path.join(tmp_dir, "cache.json")
+    baseArgs = ["prog", "--cache", cacheFile] + [
+        os.path.join(tmp_dir, f"{source}") for source in source_files
+    ]
+    for run in range(2):
+        with patch.object(sys, "argv", baseArgs):
+            with redirect_stdout(io.StringIO()) as out:
+                returnCode = ListingToBasicCli().run()
+            assert returnCode == 0
+        for f in source_files:
+            assert filecmp.cmp(
+                os.path.join(tmp_dir, f"{f[:-3]}bas"),
+                os.path.join(source_dir_expected, f"{f[:-4]}.bas"),
+                shallow=False,
+            )
+        assert os.path.exists(cacheFile)
+
+    # a tampered cache shows that the lines come from the cache
+    with open(cacheFile, "rt") as f:
+        cache = json.load(f)
+    key = TokenizedLineCache.keyOf("CLS")
+    assert cache["lines"][key] == "9d"
+    cache["lines"][key] = "9e"
+    with open(cacheFile, "wt") as f:
+        json.dump(cache, f)
+    with patch.object(sys, "argv", baseArgs):
+        ListingToBasicCli().run()
+    with open(os.path.join(tmp_dir, "l2bin-to-tokenize.bas"), "rb") as f:
+        assert b"\x00\x1e\x9e\x00" in f.read()
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_parallel_mode_converts_all_files_and_reports_errors_in_order():
+    files = ["l2bin-to-tokenize.lst", "l2bin.lst"]
+    tmp_dir = initializeTmpWorkspace([os.path.join(source_dir, f) for f in files])
+    baseArgs = ["prog", "--jobs", "2"] + [
+        os.path.join(tmp_dir, f)
+        for f in ["missing.lst", "l2bin-to-tokenize.lst", "l2bin.txt", "l2bin.lst,a"]
+    ]
+    with patch.object(sys, "argv", baseArgs):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = ListingToBasicCli().run()
+        assert returnCode == 1
+        assert out.getvalue().splitlines() == [
+            f"Error on {os.path.join(tmp_dir, 'missing.lst')} : [Errno 2] No such file or directory: '{os.path.join(tmp_dir, 'missing.lst')}'",
+            f"Error on {os.path.join(tmp_dir, 'l2bin.txt')} : Extension 'lst' (case insensitive) not found for '{os.path.join(tmp_dir, 'l2bin.txt')}'.",
+        ]
+        for actual, expected in [
+            ("l2bin-to-tokenize.bas", "l2bin-to-tokenize.bas"),
+            ("l2bin.bas", "l2bin-ascii.bas"),
+        ]:
+            assert filecmp.cmp(
+                os.path.join(tmp_dir, actual),
+                os.path.join(source_dir_expected, expected),
+                shallow=False,
+            )
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_it_minifies_the_listing_before_tokenizing():
+    tmp_dir = initializeTmpWorkspace([])
+    pathSource = os.path.join(tmp_dir, "prog.lst")
+    with open(pathSource, "wt") as f:
+        f.write("10 REM title\n20 CLS\n30 PRINT 1\n")
+    with patch.object(sys, "argv", ["prog", "--minify", pathSource]):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = ListingToBasicCli().run()
+        assert returnCode == 0
+        assert out.getvalue() == f"{pathSource} : 14 octets\t17 octets saved.\n"
+    with open(os.path.join(tmp_dir, "prog.bas"), "rb") as f:
+        assert f.read() == bytes(
+            [0xFF, 0x00, 0x0B, 0x25, 0xAD, 0x00, 0x14, 0x9D, 0x3A, 0xAB, 0x31, 0x00]
+            + [0x00, 0x00]
+        )
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_parallel_mode_reports_the_minified_sizes_in_order():
+    tmp_dir = initializeTmpWorkspace([])
+    pathSources = [os.path.join(tmp_dir, f"prog{i}.lst") for i in range(3)]
+    for i, pathSource in enumerate(pathSources):
+        with open(pathSource, "wt") as f:
+            f.write("10 REM title\n20 CLS\n" + "30 PRINT 1\n" * (i + 1))
+    with patch.object(sys, "argv", ["prog", "--minify", "--jobs", "2"] + pathSources):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = ListingToBasicCli().run()
+        assert returnCode == 0
+        assert out.getvalue().splitlines() == [
+            f"{pathSources[0]} : 14 octets\t17 octets saved.",
+            f"{pathSources[1]} : 17 octets\t22 octets saved.",
+            f"{pathSources[2]} : 20 octets\t27 octets saved.",
+        ]
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_it_displays_the_memory_map_and_fails_when_the_program_does_not_fit():
+    tmp_dir = initializeTmpWorkspace([])
+    pathSource = os.path.join(tmp_dir, "prog.lst")
+    with open(pathSource, "wt") as f:
+        f.write("10 CLS\n20 PRINT 1\n")
+    baseArgs = ["prog", "--memory-map", "--load-address", "0x3000"]
+    with patch.object(sys, "argv", baseArgs + [pathSource]):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = ListingToBasicCli().run()
+        assert returnCode == 0
+        assert out.getvalue() == (
+            "10\t$3000\t6 octets\n"
+            "20\t$3006\t8 octets\n"
+            f"{pathSource} : 16 octets\t$3000-$300F\t{0xA000 - 0x3010} octets free.\n"
+        )
+    with patch.object(
+        sys, "argv", baseArgs + ["--end-of-memory", "0x300F", pathSource]
+    ):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = ListingToBasicCli().run()
+        assert returnCode == 1
+        assert out.getvalue().endswith("\t-1 octets free.\n")
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_parallel_mode_displays_the_memory_maps_like_the_serial_mode():
+    tmp_dir = initializeTmpWorkspace([])
+    pathSources = [os.path.join(tmp_dir, f"prog{i}.lst") for i in range(4)]
+    for i, pathSource in enumerate(pathSources):
+        with open(pathSource, "wt") as f:
+            f.write("".join(f"{10 * (n + 1)} PRINT {n}\n" for n in range(4 * i + 1)))
+    baseArgs = ["prog", "--memory-map", "--end-of-memory", "0x25D0"]
+    outputs = []
+    for jobs in ["1", "3"]:
+        with patch.object(sys, "argv", baseArgs + ["--jobs", jobs] + pathSources):
+            with redirect_stdout(io.StringIO()) as out:
+                returnCode = ListingToBasicCli().run()
+            assert returnCode == 1
+            outputs.append(out.getvalue())
+    assert outputs[1] == outputs[0]
+    assert outputs[0].count("octets free.\n") == 4
+    assert "\t-" in outputs[0]
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_target_to_requires_the_load_address():
+    tmp_dir = initializeTmpWorkspace([])
+    pathSource = os.path.join(tmp_dir, "prog.lst")
+    with open(pathSource, "wt") as f:
+        f.write("10 CLS\n20 PRINT 1\n")
+    baseArgs = ["prog", "--memory-map", "--target", "to"]
+    with patch.object(sys, "argv", baseArgs + [pathSource]):
+        with redirect_stderr(io.StringIO()) as err:
+            with pytest.raises(SystemExit) as e:
+                ListingToBasicCli().run()
+        assert e.value.code == 2
+        assert "--target to requires --load-address" in err.getvalue()
+    with patch.object(sys, "argv", baseArgs + ["--load-address", "0x8C00", pathSource]):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = ListingToBasicCli().run()
+        assert returnCode == 0
+        assert out.getvalue() == (
+            "10\t$8C00\t6 octets\n"
+            "20\t$8C06\t8 octets\n"
+            f"{pathSource} : 16 octets\t$8C00-$8C0F\t{0xE000 - 0x8C10} octets free.\n"
+        )
+    shutil.rmtree(tmp_dir)
@@ -0,0 +1,110 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import os
+import shutil
+
+from moto_lib.fs_disk.controller import FileSystemController
+from moto_lib.fs_disk.image import TypeOfDiskImage
+from moto_lib.fs_disk.image_manager import (
+    DiskImageFromDiskManager,
+    SingleDiskImageManager,
+)
+from moto_lst2bas.watcher import ListingWatcher
+
+from .utils import initializeTmpWorkspace
+
+source_dir = os.path.join(".", "tests", "data")
+source_dir_expected = os.path.join(".", "tests", "data.expected")
+
+
+def readFileFromArchive(archive: str, name: str) -> bytes:
+    image = DiskImageFromDiskManager(
+        TypeOfDiskImage.EMULATOR_FLOPPY_IMAGE, archive
+    ).image
+    controller = FileSystemController(image.sides[0])
+    return bytes(controller.readFile(controller.findFile(name, "BAS")))
+
+
+def test_that_it_updates_the_disk_archive_when_a_listing_is_modified():
+    tmp_dir = initializeTmpWorkspace(
+        [os.path.join(source_dir, "l2bin-to-tokenize.lst")]
+    )
+    listing = os.path.join(tmp_dir, "program.lst")
+    with open(os.path.join(tmp_dir, "l2bin-to-tokenize.lst"), "rt") as f:
+        lines = f.readlines()
+    # remove the first line numbers (10, 20, 30), to be restored by the numbering
+    lines[:3] = [line[line.index(" ") + 1 :] for line in lines[:3]]
+    with open(listing, "wt") as f:
+        f.write("".join(lines[:20]))
+    archive = os.path.join(tmp_dir, "work.fd")
+    imageManager = SingleDiskImageManager(
+        TypeOfDiskImage.EMULATOR_FLOPPY_IMAGE, archive
+    )
+    for side in imageManager.image.sides:
+        FileSystemController(side).initFileSystem()
+    watcher = ListingWatcher([listing], imageManager)
+
+    assert watcher.poll() == ["PROGRAM.BAS"]
+    assert watcher.poll() == []
+    assert os.path.exists(archive)
+
+    with open(listing, "wt") as f:
+        f.write("".join(lines))
+    stat = os.stat(listing)
+    os.utime(listing, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert watcher.poll() == ["PROGRAM.BAS"]
+    with open(os.path.join(source_dir_expected, "l2bin-to-tokenize.bas"), "rb") as f:
+        assert readFileFromArchive(archive, "PROGRAM") == f.read()
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_it_keeps_the_previous_version_of_a_file_that_does_not_fit_anymore():
+    tmp_dir = initializeTmpWorkspace([])
+    listings = [os.path.join(tmp_dir, f"{name}.lst") for name in ["program", "other"]]
+    for listing in listings:
+        with open(listing, "wt") as f:
+            f.write("CLS\n")
+    archive = os.path.join(tmp_dir, "work.fd")
+    imageManager = SingleDiskImageManager(
+        TypeOfDiskImage.EMULATOR_FLOPPY_IMAGE, archive
+    )
+    for side in imageManager.image.sides:
+        FileSystemController(side).initFileSystem()
+    watcher = ListingWatcher(listings, imageManager)
+    assert watcher.poll() == ["PROGRAM.BAS", "OTHER.BAS"]
+    previous = readFileFromArchive(archive, "PROGRAM")
+
+    # no space left on any side
+    for i, side in enumerate(imageManager.image.sides):
+        controller = FileSystemController(side)
+        free = controller.computeUsage().free
+        controller.writeFile(bytes(free * 8 * 255), f"FILLER{i}", "DAT")
+
+    for listing, text in zip(listings, ["CLS\n" * 1000, "END\n"]):
+        with open(listing, "wt") as f:
+            f.write(text)
+        stat = os.stat(listing)
+        os.utime(listing, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert watcher.poll() == ["OTHER.BAS"]
+    assert readFileFromArchive(archive, "PROGRAM") == previous
+    shutil.rmtree(tmp_dir)
@@ -27,7 +27,7 @@ import io
 from typing import List, Union, Optional
 
 from unittest.mock import patch
-from contextlib import redirect_stdout
+from contextlib import redirect_stdout, redirect_stderr
 
 from moto_nl import NumberLineCli
 
@@ -149,3 +149,28 @@ def test_that_it_can_manage_files_and_stdin():
 50 print "hello from in2"
 """
         )
+
+
+def test_that_it_does_renumber_lines_and_references():
+    input_lines = [
+        "5 ON X GOTO 10,20",
+        "10 IF A THEN 20 ELSE 99",
+        'Print "Hello"',
+        "20 GOSUB 10:REM GOTO 10",
+    ]
+    baseArgs = ["prog", "--renumber", "-v", "100", "-i", "5"]
+    with patch.object(sys, "argv", baseArgs):
+        with patch.object(sys, "stdin", mockStdInput(input_lines)):
+            with redirect_stdout(io.StringIO()) as out:
+                with redirect_stderr(io.StringIO()) as err:
+                    returnCode = NumberLineCli().run()
+        assert returnCode == 0
+        assert (
+            out.getvalue()
+            == """100 ON X GOTO 105,115
+105 IF A THEN 115 ELSE 99
+110 Print "Hello"
+115 GOSUB 105:REM GOTO 10
+"""
+        )
+        assert err.getvalue() == "Warning : undefined line 99 referenced at line 105\n"
@@ -114,3 +114,14 @@ def test_that_it_can_manage_files_and_stdin():
 20 PRINT "Hello from stdin !":PRINT "How are you doing ?"
 """
         )
+
+
+def test_that_an_unclosed_string_litteral_ends_with_its_line():
+    input_lines = ['10 print "Hello', "20 cls"]
+    baseArgs = ["prog"]
+    with patch.object(sys, "argv", baseArgs):
+        with patch.object(sys, "stdin", mockStdInput(input_lines)):
+            with redirect_stdout(io.StringIO()) as out:
+                returnCode = PrettierCli().run()
+        assert returnCode == 0
+        assert out.getvalue() == '10 PRINT "Hello\n20 CLS\n'
@@ -693,3 +693,52 @@ TOTAL
         assert usage.reserved == 3
         assert usage.free == 157
         assert len(fs.listFiles()) == 0
+
+
+def test_that_a_cached_image_is_reused():
+    sourceFileSet = COMMON_FILESET
+    tmp_dir = initializeTmpWorkspace(
+        [os.path.join(source_dir, f) for f in sourceFileSet]
+    )
+    cacheDir = os.path.join(tmp_dir, "cache")
+    createdImageFile = os.path.join(tmp_dir, FILE_IMAGE)
+    baseArgs = ["prog", "--cache-dir", cacheDir, "--create", "-v", createdImageFile]
+    sourceArgs = [os.path.join(tmp_dir, f) for f in sourceFileSet]
+    sourceArgs[1] = sourceArgs[1] + ",a"
+    sourceArgs = sourceArgs[0:2] + ["--eos"] + sourceArgs[2:]
+    with patch.object(sys, "argv", baseArgs + ["--"] + sourceArgs):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = DiskArchiveCli().run()
+        assert returnCode == 0
+        assert out.getvalue().startswith("Side 0\n")
+        with open(createdImageFile, mode="rb") as infile:
+            expectedImageData = infile.read()
+        assert len(os.listdir(cacheDir)) == 1
+
+        os.remove(createdImageFile)
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = DiskArchiveCli().run()
+        assert returnCode == 0
+        assert out.getvalue() == f"{createdImageFile} : from the cache.\n"
+        with open(createdImageFile, mode="rb") as infile:
+            assert infile.read() == expectedImageData
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_an_image_with_skipped_sources_is_not_cached():
+    sourceFileSet = COMMON_FILESET
+    tmp_dir = initializeTmpWorkspace(
+        [os.path.join(source_dir, f) for f in sourceFileSet]
+    )
+    cacheDir = os.path.join(tmp_dir, "cache")
+    createdImageFile = os.path.join(tmp_dir, FILE_IMAGE)
+    baseArgs = ["prog", "--cache-dir", cacheDir, "--create", createdImageFile]
+    sourceArgs = [os.path.join(tmp_dir, f) for f in sourceFileSet]
+    sourceArgs += [os.path.join(tmp_dir, "MISSING.BAS")]
+    with patch.object(sys, "argv", baseArgs + ["--"] + sourceArgs):
+        with redirect_stdout(io.StringIO()):
+            returnCode = DiskArchiveCli().run()
+        assert returnCode == 0
+        assert os.path.exists(createdImageFile)
+        assert not os.path.exists(cacheDir) or os.listdir(cacheDir) == []
+    shutil.rmtree(tmp_dir)
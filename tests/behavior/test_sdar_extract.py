@@ -157,6 +157,39 @@ TOTAL
         then_all_the_files_have_been_extracted(tmp_dir, expected_dir)
 
 
+def test_that_parallel_mode_does_extract_the_same_files_with_the_same_output():
+    source_dir = os.path.join(".", "tests", "data")
+    outputs = []
+    tmp_dirs = []
+    for jobs in ["1", "4"]:
+        tmp_dir = initializeTmpWorkspace([os.path.join(source_dir, SOURCE_ARCHIVE)])
+        baseArgs = [
+            "prog",
+            "--extract",
+            "--verbose",
+            "--jobs",
+            jobs,
+            os.path.join(tmp_dir, SOURCE_ARCHIVE),
+        ]
+        with patch.object(sys, "argv", baseArgs):
+            with redirect_stdout(io.StringIO()) as out:
+                returnCode = DiskArchiveCli().run()
+        assert returnCode == 0
+        outputs.append(out.getvalue())
+        tmp_dirs.append(tmp_dir)
+    assert outputs[0] == outputs[1]
+    for i in range(4):
+        side = f"side{i}"
+        files = sorted(os.listdir(os.path.join(tmp_dirs[0], side)))
+        assert files == sorted(os.listdir(os.path.join(tmp_dirs[1], side)))
+        for f in files:
+            assert_that_source_is_converted_as_expected(
+                os.path.join(tmp_dirs[1], side, f), os.path.join(tmp_dirs[0], side, f)
+            )
+    for tmp_dir in tmp_dirs:
+        shutil.rmtree(tmp_dir)
+
+
 def then_all_the_files_have_been_extracted(actualdir, expecteddir):
     """common verification for both extractions
 
@@ -19,6 +19,7 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
+import json
 import os
 import shutil
 import time
@@ -135,3 +136,35 @@ Side 3
 empty, (0 + 0) blocks used (0.0%)
 """
         )
+
+
+def test_that_batch_mode_does_list_archives_of_a_directory_as_ndjson():
+    tmp_dir = initializeTmpWorkspace([])
+    os.makedirs(os.path.join(tmp_dir, "sub"))
+    names = ["a.sd", "b.sd", os.path.join("sub", "c.SD")]
+    for name in [names[0], names[2]]:
+        shutil.copy(
+            os.path.join(source_dir, SOURCE_ARCHIVE), os.path.join(tmp_dir, name)
+        )
+    with open(os.path.join(tmp_dir, names[1]), "wb") as f:
+        f.write(b"not a disk image")
+    baseArgs = ["prog", "-t", "--batch", tmp_dir, "--jobs", "2", "--ordered"]
+    with patch.object(sys, "argv", baseArgs):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = DiskArchiveCli().run()
+    assert returnCode == 1
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r["archive"] for r in results] == [
+        os.path.join(tmp_dir, name) for name in names
+    ]
+    assert results[0]["files"][0] == {
+        "name": "0000",
+        "extension": "BAS",
+        "typeOfFile": "BASIC",
+        "typeOfData": "TOKEN",
+        "size": results[0]["files"][0]["size"],
+        "side": 0,
+    }
+    assert results[0]["files"] == results[2]["files"]
+    assert "files" not in results[1] and "error" in results[1]
+    shutil.rmtree(tmp_dir)
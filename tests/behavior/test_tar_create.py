@@ -135,3 +135,107 @@ def test_that_it_fails_when_there_is_too_much_data():
         pathActual = os.path.join(tmp_dir, output_archive)
         assert not os.path.exists(pathActual)
     shutil.rmtree(tmp_dir)
+
+
+def test_that_pack_mode_puts_boot_files_first_and_reports_the_layout():
+    tmp_dir = initializeTmpWorkspace(
+        [os.path.join(source_dir, f) for f in source_files]
+    )
+    baseArgs = [
+        "prog",
+        "-c",
+        "--pack",
+        "--boot",
+        "c5002.bas",
+        "--boot",
+        "C5001LST.BAS",
+        "--sync-length",
+        "4",
+        os.path.join(tmp_dir, output_archive),
+    ] + [os.path.join(tmp_dir, f) for f in source_files]
+    with patch.object(sys, "argv", baseArgs):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = TapeArchiveCli().run()
+        assert returnCode == 0
+        pathActual = os.path.join(tmp_dir, output_archive)
+        sizeOfTape = os.path.getsize(pathActual)
+        assert (
+            out.getvalue()
+            == f"""C5002.BAS
+C5001LST.BAS
+BANNER.BAS
+BANNER2.BAS
+C5000.BAS
+C5001.BAS
+Tape : {sizeOfTape} octets\t30 blocks\t{sizeOfTape * 8 / 1200 + 6 * 0.5 + 7 * 1.0:.1f} s at 1200 bauds.
+"""
+        )
+        assert sizeOfTape < os.path.getsize(os.path.join(source_dir, reference_archive))
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_pack_mode_extends_the_tape_beyond_its_default_size():
+    tmp_dir = initializeTmpWorkspace([])
+    with open(os.path.join(tmp_dir, "BIG.DAT"), "wb") as f:
+        f.write(bytes(range(256)) * 100)  # 25600 bytes, more than 21 KB
+    pathActual = os.path.join(tmp_dir, output_archive)
+    baseArgs = ["prog", "-c", "--pack", pathActual, os.path.join(tmp_dir, "BIG.DAT")]
+    with patch.object(sys, "argv", baseArgs):
+        with redirect_stdout(io.StringIO()):
+            returnCode = TapeArchiveCli().run()
+        assert returnCode == 0
+    assert os.path.getsize(pathActual) > 25600
+    with patch.object(sys, "argv", ["prog", "-x", pathActual]):
+        os.remove(os.path.join(tmp_dir, "BIG.DAT"))
+        with redirect_stdout(io.StringIO()):
+            returnCode = TapeArchiveCli().run()
+        assert returnCode == 0
+    with open(os.path.join(tmp_dir, "BIG.DAT"), "rb") as f:
+        assert f.read() == bytes(range(256)) * 100
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_it_fails_when_a_boot_file_is_not_a_source_file():
+    tmp_dir = initializeTmpWorkspace(
+        [os.path.join(source_dir, f) for f in source_files]
+    )
+    baseArgs = [
+        "prog",
+        "-c",
+        "--boot",
+        "LOADER.BAS",
+        os.path.join(tmp_dir, output_archive),
+    ] + [os.path.join(tmp_dir, f) for f in source_files]
+    with patch.object(sys, "argv", baseArgs):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = TapeArchiveCli().run()
+        assert returnCode == 1
+        assert out.getvalue() == "Error : error.boot.file.not.found:LOADER.BAS\n"
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_a_cached_archive_is_reused():
+    tmp_dir = initializeTmpWorkspace(
+        [os.path.join(source_dir, f) for f in source_files]
+    )
+    cache_dir = os.path.join(tmp_dir, "cache")
+    pathActual = os.path.join(tmp_dir, output_archive)
+    baseArgs = ["prog", "--cache-dir", cache_dir, "-cv", pathActual] + [
+        os.path.join(tmp_dir, f) for f in source_files
+    ]
+    with patch.object(sys, "argv", baseArgs):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = TapeArchiveCli().run()
+        assert returnCode == 0
+        assert out.getvalue().startswith("BANNER.BAS\tBASIC\tTOKEN")
+        assert len(os.listdir(cache_dir)) == 1
+
+        os.remove(pathActual)
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = TapeArchiveCli().run()
+        assert returnCode == 0
+        assert out.getvalue() == f"{pathActual} : from the cache.\n"
+        assert filecmp.cmp(
+            pathActual, os.path.join(source_dir, reference_archive), shallow=False
+        )
+    shutil.rmtree(tmp_dir)
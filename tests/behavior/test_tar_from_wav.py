@@ -0,0 +1,103 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import filecmp
+import os
+import shutil
+import sys
+import io
+
+from unittest.mock import patch
+from contextlib import redirect_stdout
+
+from moto_lib.fs_tape import LeaderTapeBlockDescriptor, Tape, TapeBlock
+from moto_tar import TapeArchiveCli
+
+from .utils import initializeTmpWorkspace
+
+input_archive = "sporny-basic.k7"
+
+
+def runTapeArchiveCli(args):
+    with patch.object(sys, "argv", ["prog"] + args):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = TapeArchiveCli().run()
+    return returnCode, out.getvalue()
+
+
+def test_that_it_does_decode_a_rendered_tape():
+    source_dir = os.path.join(".", "tests", "data")
+    tmp_dir = initializeTmpWorkspace([os.path.join(source_dir, input_archive)])
+    returnCode, out = runTapeArchiveCli(
+        ["--to-wav", os.path.join(tmp_dir, input_archive)]
+    )
+    assert returnCode == 0
+
+    returnCode, out = runTapeArchiveCli(
+        [
+            "--from-wav",
+            "-v",
+            os.path.join(tmp_dir, "decoded.k7"),
+            os.path.join(tmp_dir, "sporny-basic.wav"),
+        ]
+    )
+    assert returnCode == 0
+    assert (
+        out
+        == """BANNER.BAS\tBASIC\tTOKEN\t#1\t102 octets\t1 blocks.
+BANNER2.BAS\tBASIC\tTOKEN\t#4\t102 octets\t1 blocks.
+C5000.BAS\tBASIC\tTOKEN\t#7\t794 octets\t4 blocks.
+C5001.BAS\tBASIC\tTOKEN\t#13\t804 octets\t4 blocks.
+C5001LST.BAS\tBASIC\tASCII\t#19\t942 octets\t4 blocks.
+C5002.BAS\tBASIC\tTOKEN\t#25\t836 octets\t4 blocks.
+"""
+    )
+
+    os.remove(os.path.join(tmp_dir, input_archive))
+    returnCode, out = runTapeArchiveCli(["-x", os.path.join(tmp_dir, "decoded.k7")])
+    assert returnCode == 0
+    for f in ["BANNER.BAS", "C5001LST.BAS", "C5002.BAS"]:
+        pathActual = os.path.join(tmp_dir, f)
+        assert filecmp.cmp(pathActual, os.path.join(source_dir, f), shallow=False)
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_it_does_report_invalid_checksums():
+    tmp_dir = initializeTmpWorkspace([])
+    tape = Tape()
+    tape.writeBlock(LeaderTapeBlockDescriptor("broken", "bin", 2, 0).toTapeBlock())
+    tape.writeBlock(TapeBlock(b"\x01\x05\x41\x42\x43\x00"))  # wrong checksum
+    tape.writeBlock(TapeBlock(b"\xff\x02\x00"))
+    with open(os.path.join(tmp_dir, "broken.k7"), "wb") as f:
+        f.write(tape.rawData)
+    runTapeArchiveCli(["--to-wav", os.path.join(tmp_dir, "broken.k7")])
+
+    returnCode, out = runTapeArchiveCli(
+        [
+            "--from-wav",
+            os.path.join(tmp_dir, "decoded.k7"),
+            os.path.join(tmp_dir, "broken.wav"),
+        ]
+    )
+    assert returnCode == 1
+    assert out == "Error on BROKEN.BIN : invalid checksum on block #2\nBROKEN.BIN\n"
+    shutil.rmtree(tmp_dir)
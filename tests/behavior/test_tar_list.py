@@ -19,6 +19,7 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
+import json
 import os
 import shutil
 import time
@@ -32,6 +33,7 @@ from contextlib import redirect_stdout
 from moto_tar import TapeArchiveCli
 
 from .utils import (
+    initializeTmpWorkspace,
     makeTmpDirOrDie,
     assert_that_source_is_converted_as_expected,
 )
@@ -75,3 +77,30 @@ C5001LST.BAS\tBASIC\tASCII\t#19\t942 octets\t4 blocks.
 C5002.BAS\tBASIC\tTOKEN\t#25\t836 octets\t4 blocks.
 """
         )
+
+
+def test_that_batch_mode_does_list_archives_in_the_order_of_completion():
+    source_dir = os.path.join(".", "tests", "data")
+    tmp_dir = initializeTmpWorkspace([])
+    for name in ["a.k7", "b.k7", "c.k7", "ignored.sd"]:
+        shutil.copy(
+            os.path.join(source_dir, input_archive), os.path.join(tmp_dir, name)
+        )
+    baseArgs = ["prog", "--list", "--batch", "--jobs", "3", tmp_dir]
+    with patch.object(sys, "argv", baseArgs):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = TapeArchiveCli().run()
+    assert returnCode == 0
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert sorted(r["archive"] for r in results) == [
+        os.path.join(tmp_dir, name) for name in ["a.k7", "b.k7", "c.k7"]
+    ]
+    assert [f["name"] for f in results[0]["files"]] == [
+        "BANNER",
+        "BANNER2",
+        "C5000",
+        "C5001",
+        "C5001LST",
+        "C5002",
+    ]
+    shutil.rmtree(tmp_dir)
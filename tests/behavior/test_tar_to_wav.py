@@ -0,0 +1,98 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+import os
+import shutil
+import sys
+import io
+import wave
+
+from unittest.mock import patch
+from contextlib import redirect_stdout
+
+from moto_lib import Tape
+from moto_lib.fs_tape.audio import SAMPLES_PER_BIT
+from moto_tar import TapeArchiveCli
+
+from .utils import initializeTmpWorkspace
+
+input_archive = "sporny-basic.k7"
+
+
+def test_that_it_does_render_the_tape_into_a_wave_file():
+    source_dir = os.path.join(".", "tests", "data")
+    tmp_dir = initializeTmpWorkspace([os.path.join(source_dir, input_archive)])
+    baseArgs = ["prog", "--to-wav", os.path.join(tmp_dir, input_archive)]
+    with patch.object(sys, "argv", baseArgs):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = TapeArchiveCli().run()
+        assert returnCode == 0
+        assert (
+            out.getvalue()
+            == """BANNER.BAS
+BANNER2.BAS
+C5000.BAS
+C5001.BAS
+C5001LST.BAS
+C5002.BAS
+"""
+        )
+        pathActual = os.path.join(tmp_dir, "sporny-basic.wav")
+        assert os.path.exists(pathActual) and os.path.isfile(pathActual)
+        with wave.open(pathActual, "rb") as wav:
+            assert wav.getnchannels() == 1
+            assert wav.getsampwidth() == 1
+            assert wav.getframerate() == 48000
+            assert wav.getnframes() > 0
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_it_renders_the_sync_bytes_of_each_block():
+    source_dir = os.path.join(".", "tests", "data")
+    sources = ["BANNER.BAS", "C5000.BAS"]
+    tmp_dir = initializeTmpWorkspace([os.path.join(source_dir, f) for f in sources])
+    countsOfFrames = []
+    for syncLength in [4, 16]:
+        archive = os.path.join(tmp_dir, f"sync{syncLength}.k7")
+        baseArgs = ["prog", "-c", "--pack", "--sync-length", f"{syncLength}", archive]
+        with patch.object(
+            sys, "argv", baseArgs + [os.path.join(tmp_dir, f) for f in sources]
+        ):
+            with redirect_stdout(io.StringIO()):
+                assert TapeArchiveCli().run() == 0
+        with patch.object(sys, "argv", ["prog", "--to-wav", archive]):
+            with redirect_stdout(io.StringIO()):
+                assert TapeArchiveCli().run() == 0
+        with wave.open(archive[:-2] + "wav", "rb") as wav:
+            countsOfFrames.append(wav.getnframes())
+
+    with open(archive, "rb") as f:
+        tape = Tape(bytearray(f.read()))
+    countOfBlocks = 0
+    while tape.nextBlock() is not None:
+        assert tape.startOfLastBlock == b"\x01" * 16 + b"\x3c\x5a"
+        countOfBlocks += 1
+    assert countOfBlocks > 2
+    assert (
+        countsOfFrames[1] - countsOfFrames[0]
+        == countOfBlocks * 12 * 8 * SAMPLES_PER_BIT
+    )
+    shutil.rmtree(tmp_dir)
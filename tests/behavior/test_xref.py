@@ -0,0 +1,79 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import json
+import os
+import shutil
+import sys
+import io
+
+from unittest.mock import patch
+from contextlib import redirect_stdout
+
+from moto_xref import CrossReferenceCli
+
+from .utils import initializeTmpWorkspace
+
+
+def test_that_it_prints_the_index_of_each_source_in_json():
+    tmp_dir = initializeTmpWorkspace([])
+    pathSource = os.path.join(tmp_dir, "prog.lst")
+    with open(pathSource, "wt") as f:
+        f.write("10 A=1:GOSUB 30\n20 END\n30 PRINT A:RETURN\n")
+    with patch.object(sys, "argv", ["prog", "--check", pathSource]):
+        with redirect_stdout(io.StringIO()) as out:
+            returnCode = CrossReferenceCli().run()
+        assert returnCode == 0
+        assert json.loads(out.getvalue()) == {
+            pathSource: {
+                "lines": [10, 20, 30],
+                "jumps": {"30": [10]},
+                "danglingReferences": [],
+                "variables": {"A": {"assigned": [10], "used": [30]}},
+                "data": [],
+            }
+        }
+    shutil.rmtree(tmp_dir)
+
+
+def test_that_check_fails_on_dangling_references():
+    stdin = io.StringIO("10 GOTO 20\n")
+    with patch.object(sys, "argv", ["prog", "--check"]):
+        with patch.object(sys, "stdin", stdin):
+            with redirect_stdout(io.StringIO()) as out:
+                returnCode = CrossReferenceCli().run()
+        assert returnCode == 1
+        assert json.loads(out.getvalue())["-"]["danglingReferences"] == [
+            {"line": 10, "target": 20}
+        ]
+
+
+def test_that_check_accepts_the_zero_of_on_error_goto_and_resume():
+    stdin = io.StringIO("10 ON ERROR GOTO 100\n20 ON ERROR GOTO 0\n100 RESUME 0\n")
+    with patch.object(sys, "argv", ["prog", "--check"]):
+        with patch.object(sys, "stdin", stdin):
+            with redirect_stdout(io.StringIO()) as out:
+                returnCode = CrossReferenceCli().run()
+        assert returnCode == 0
+        index = json.loads(out.getvalue())["-"]
+        assert index["jumps"] == {"100": [10]}
+        assert index["danglingReferences"] == []
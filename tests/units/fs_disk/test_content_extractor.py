@@ -0,0 +1,73 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import time
+
+import pytest
+
+from moto_lib.fs_disk.image import TypeOfDiskImage
+from moto_lib.fs_disk.image_worker import DiskImageContentExtractor
+
+
+class RecordingListener:
+    def __init__(self):
+        self.events = []
+
+    def __getattr__(self, name: str):
+        return lambda data: self.events.append((name, data))
+
+
+class SlowContentExtractor(DiskImageContentExtractor):
+    """The last sides are the fastest, and the side 1 fails after its first file."""
+
+    def extractSide(self, indexOfSide: int, side, targetDir: str, listener):
+        listener.onBeginOfSide(indexOfSide)
+        for i in range(2):
+            time.sleep(0.01 * (4 - indexOfSide))
+            if indexOfSide == 1 and i == 1:
+                raise OSError("error.side.1")
+            listener.onBeginOfFile((indexOfSide, i))
+            listener.onEndOfFile((indexOfSide, i))
+        listener.onEndOfSide(indexOfSide)
+
+
+def expectedEvents(indexOfSide: int, countOfFiles: int = 2, isDone: bool = True):
+    events = [("onBeginOfSide", indexOfSide)]
+    for i in range(countOfFiles):
+        events += [
+            ("onBeginOfFile", (indexOfSide, i)),
+            ("onEndOfFile", (indexOfSide, i)),
+        ]
+    return events + ([("onEndOfSide", indexOfSide)] if isDone else [])
+
+
+def test_DiskImageContentExtractor_should_replay_the_events_of_the_sides_in_order():
+    listener = RecordingListener()
+    extractor = SlowContentExtractor(TypeOfDiskImage.SDDRIVE_FLOPPY_IMAGE)
+    with pytest.raises(OSError, match="error.side.1"):
+        extractor.extractSidesInParallel([0, 1, 2, 3], ".", listener, 4)
+    assert listener.events == (
+        expectedEvents(0)
+        + expectedEvents(1, countOfFiles=1, isDone=False)
+        + expectedEvents(2)
+        + expectedEvents(3)
+    )
@@ -0,0 +1,60 @@
+"""
+@Since v0.0.4
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+from moto_lib.fs_disk.controller import FileSystemController
+from moto_lib.fs_disk.image import TypeOfDiskImage, DiskImage
+from moto_lib.fs_disk.catalog import CatalogEntryStatus
+
+
+def prepareController() -> FileSystemController:
+    image = DiskImage(bytes(), typeOfDiskImage=TypeOfDiskImage.EMULATOR_FLOPPY_IMAGE)
+    controller = FileSystemController(image.sides[0])
+    controller.initFileSystem()
+    controller.writeFile(bytes(300), "first", "bas")
+    controller.writeFile(bytes(3000), "second", "bin")
+    return controller
+
+
+def test_that_findFile_returns_the_alive_entry_of_the_file():
+    controller = prepareController()
+    entry = controller.findFile("SECOND", "BIN")
+    assert entry.status == CatalogEntryStatus.ALIVE
+    assert entry.toDict()["sizeInBytes"] == 3000
+    assert controller.findFile("second", "bas") is None
+
+
+def test_that_deleteFile_frees_the_blocks_and_the_catalog_entry():
+    controller = prepareController()
+    assert controller.computeUsage().used == 3
+    assert controller.deleteFile("second", "bin")
+    assert controller.computeUsage().used == 1
+    assert controller.findFile("second", "bin") is None
+    assert [e.toDict()["name"] for e in controller.listFiles()] == ["FIRST   "]
+    assert not controller.deleteFile("second", "bin")
+
+    # the entry and the blocks are reused
+    controller.writeFile(bytes(600), "third", "bas")
+    assert [e.toDict()["name"] for e in controller.listFiles()] == [
+        "FIRST   ",
+        "THIRD   ",
+    ]
+    assert controller.computeUsage().used == 2
@@ -0,0 +1,88 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import pytest
+
+from moto_lib.fs_disk.controller import DiskIsFullError, FileSystemController
+from moto_lib.fs_disk.image import DiskImage
+from moto_lib.fs_disk.sides import replaceFileOnSides, sidesFrom, writeFileOnSides
+
+
+def prepareControllers(countOfSides: int = 2) -> list[FileSystemController]:
+    image = DiskImage(bytearray(countOfSides * 80 * 16 * 256))
+    controllers = [FileSystemController(side) for side in image.sides]
+    for controller in controllers:
+        controller.initFileSystem()
+    return controllers
+
+
+def fill(controller: FileSystemController):
+    free = controller.computeUsage().free
+    controller.writeFile(b"\x02" * (free * 8 * 255), "FILL", "DAT")
+
+
+def test_that_sidesFrom_wraps_around():
+    assert sidesFrom(2, 4) == [2, 3, 0, 1]
+    assert sidesFrom(0, 2) == [0, 1]
+
+
+def test_that_writeFileOnSides_goes_back_to_an_earlier_side():
+    controllers = prepareControllers()
+    fill(controllers[1])
+    assert writeFileOnSides(controllers, b"\x01", "SMALL", "DAT", sides=[1, 0]) == 0
+
+
+def test_that_writeFileOnSides_fails_when_all_the_sides_are_full():
+    controllers = prepareControllers()
+    for controller in controllers:
+        fill(controller)
+    with pytest.raises(DiskIsFullError, match="error.disk.image.is.full:SMALL.DAT"):
+        writeFileOnSides(controllers, b"\x01", "SMALL", "DAT")
+
+
+class FailingController:
+    def writeFile(self, *args, **kwargs):
+        raise ValueError("error.something.else")
+
+
+def test_that_writeFileOnSides_does_not_hide_other_errors():
+    controllers = [FailingController()] + prepareControllers(1)
+    with pytest.raises(ValueError, match="error.something.else"):
+        writeFileOnSides(controllers, b"\x01", "SMALL", "DAT")
+
+
+def test_that_replaceFileOnSides_keeps_the_replaced_file_when_it_does_not_fit():
+    controllers = prepareControllers()
+    controllers[1].writeFile(b"\x01" * 300, "BIG", "DAT")
+    fill(controllers[0])
+    fill(controllers[1])
+    with pytest.raises(DiskIsFullError):
+        replaceFileOnSides(controllers, b"\x03" * 5000, "BIG", "DAT")
+    entry = controllers[1].findFile("BIG", "DAT")
+    assert bytes(controllers[1].readFile(entry)) == b"\x01" * 300
+
+
+def test_that_replaceFileOnSides_starts_with_the_side_of_the_replaced_file():
+    controllers = prepareControllers()
+    controllers[1].writeFile(b"\x01", "SMALL", "DAT")
+    assert replaceFileOnSides(controllers, b"\x03", "SMALL", "DAT") == 1
+    assert controllers[0].findFile("SMALL", "DAT") is None
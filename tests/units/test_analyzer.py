@@ -0,0 +1,56 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+from moto_lib.basic import ListingAnalyzer
+
+
+def test_ListingAnalyzer_should_index_lines_and_references():
+    index = ListingAnalyzer().analyze(
+        [
+            "10 GOSUB 30:IF A THEN 10 ELSE 1200\n",
+            "20 ON A GOTO 10, 30\n",
+            '30 PRINT "GOTO 20":RETURN \' GOTO 20\n',
+        ]
+    )
+    assert index["lines"] == [10, 20, 30]
+    assert index["jumps"] == {"10": [10, 20], "30": [10, 20], "1200": [10]}
+    assert index["danglingReferences"] == [{"line": 10, "target": 1200}]
+
+
+def test_ListingAnalyzer_should_index_variables_and_data():
+    index = ListingAnalyzer().analyze(
+        [
+            "10 DIM T(10):LET N = 0\n",
+            "20 FOR I = 1 TO N : READ T(I), B$ : NEXT I\n",
+            '30 INPUT "NAME";A$:IF A$="" THEN X(I+1)=B$\n',
+            '40 DATA 1, "a,b" , 3\n',
+        ]
+    )
+    assert index["variables"] == {
+        "A$": {"assigned": [30], "used": [30]},
+        "B$": {"assigned": [20], "used": [30]},
+        "I": {"assigned": [20], "used": [20, 30]},
+        "N": {"assigned": [10], "used": [20]},
+        "T()": {"assigned": [20], "used": [10]},
+        "X()": {"assigned": [30], "used": []},
+    }
+    assert index["data"] == [{"line": 40, "values": ["1", '"a,b"', "3"]}]
@@ -0,0 +1,119 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import os
+import tempfile
+
+import pytest
+
+from moto_lib import DiskArchive, TapeArchive
+from moto_lib.fs_disk.catalog import TypeOfData, TypeOfDiskFile
+
+source_dir = os.path.join(".", "tests", "data")
+
+
+def test_DiskArchive_should_write_read_and_delete_files_in_memory():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        path = os.path.join(tmpDir, "archive.sd")
+        archive = DiskArchive.create(path)
+        assert archive.countOfSides == 4
+        archive.write("hello.bas", b"\xff\x00\x01")
+        archive.write("NOTES.TXT", b"some notes", side=2)
+        archive.write("DATA", b"\x00" * 1000)
+        assert [(e.side, e.fullName, e.size) for e in archive.entries()] == [
+            (0, "HELLO.BAS", 3),
+            (0, "DATA", 1000),
+            (2, "NOTES.TXT", 10),
+        ]
+        notes = archive.find("notes.txt")
+        assert (notes.typeOfFile, notes.typeOfData) == (
+            TypeOfDiskFile.TEXT_FILE,
+            TypeOfData.ASCII_DATA,
+        )
+        assert archive.read("NOTES.TXT") == b"some notes"
+        with pytest.raises(ValueError, match="error.file.not.found:NOTES.TXT"):
+            archive.read("NOTES.TXT", side=0)
+
+        # replaced on its side
+        archive.write("NOTES.TXT", b"other notes")
+        assert archive.find("NOTES.TXT").side == 2
+        assert archive.read("NOTES.TXT") == b"other notes"
+
+        assert archive.delete("HELLO.BAS")
+        assert not archive.delete("HELLO.BAS")
+        archive.save()
+
+        archive = DiskArchive.open(path)
+        assert [e.fullName for e in archive.entries()] == ["DATA", "NOTES.TXT"]
+        assert archive.read("DATA") == b"\x00" * 1000
+
+
+def test_DiskArchive_should_keep_a_replaced_file_when_there_is_not_enough_space():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        archive = DiskArchive.create(os.path.join(tmpDir, "archive.fd"))
+        archive.write("BIG.DAT", b"\x01" * 300, side=0)
+        free = archive.usage(0).free
+        archive.write("FILL.DAT", b"\x02" * (free * 8 * 255), side=0)
+        assert archive.usage(0).free == 0
+        with pytest.raises(ValueError, match="error.disk.image.is.full:BIG.DAT"):
+            archive.write("BIG.DAT", b"\x03" * 5000)
+        assert archive.read("BIG.DAT") == b"\x01" * 300
+
+
+def test_DiskArchive_should_reject_unknown_types_of_archive_and_long_names():
+    with pytest.raises(ValueError, match="error.file.name.extension.should.be"):
+        DiskArchive.create("archive.k7")
+    with tempfile.TemporaryDirectory() as tmpDir:
+        archive = DiskArchive.create(os.path.join(tmpDir, "archive.sd"))
+        with pytest.raises(ValueError, match="error.file.name.too.long"):
+            archive.write("VERYLONGNAME.BAS", b"")
+
+
+def test_TapeArchive_should_list_and_read_the_files_of_a_tape():
+    archive = TapeArchive.open(os.path.join(source_dir, "sporny-basic.k7"))
+    assert [(e.fullName, e.typeOfData) for e in archive.entries()][3:5] == [
+        ("C5001.BAS", TypeOfData.BINARY_DATA),
+        ("C5001LST.BAS", TypeOfData.ASCII_DATA),
+    ]
+    with open(os.path.join(source_dir, "C5000.BAS"), "rb") as f:
+        assert archive.read("C5000.BAS") == f.read()
+
+
+def test_TapeArchive_should_write_the_files_again_when_saved():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        path = os.path.join(tmpDir, "archive.k7")
+        archive = TapeArchive.create(path)
+        archive.write("LOADER.BAS", b"\xff\x00\x01")
+        archive.write("GAME.BIN", b"\x00" * 600)
+        archive.write("LOADER.BAS", b"\xff\x00\x02")  # replaced at the same place
+        archive.save(pack=True)
+
+        archive = TapeArchive.open(path)
+        assert [(e.fullName, e.size) for e in archive.entries()] == [
+            ("LOADER.BAS", 3),
+            ("GAME.BIN", 600),
+        ]
+        assert archive.read("LOADER.BAS") == b"\xff\x00\x02"
+        assert archive.delete("LOADER.BAS")
+        archive.save()
+        assert [e.fullName for e in TapeArchive.open(path).entries()] == ["GAME.BIN"]
+        assert os.path.getsize(path) >= 21 * 1024
@@ -0,0 +1,94 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import os
+import tempfile
+import time
+
+from moto_lib.build import ArchiveCache
+
+
+def writeFile(path: str, data: bytes):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def readFile(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_ArchiveCache_key_should_depend_on_type_options_order_and_contents():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        a = os.path.join(tmpDir, "A.BAS")
+        b = os.path.join(tmpDir, "B.BAS")
+        writeFile(a, b"aaa")
+        writeFile(b, b"bbb")
+        key = ArchiveCache.keyOf("k7", [a, b], {"pack": False})
+        assert ArchiveCache.keyOf("k7", [a, b], {"pack": False}) == key
+        assert ArchiveCache.keyOf("sd", [a, b], {"pack": False}) != key
+        assert ArchiveCache.keyOf("k7", [a, b], {"pack": True}) != key
+        assert ArchiveCache.keyOf("k7", [b, a], {"pack": False}) != key
+        assert ArchiveCache.keyOf("k7", [a + ",a", b], {"pack": False}) != key
+        writeFile(b, b"bbc")
+        assert ArchiveCache.keyOf("k7", [a, b], {"pack": False}) != key
+
+
+def test_ArchiveCache_should_give_back_a_stored_archive():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        cache = ArchiveCache(os.path.join(tmpDir, "cache"))
+        archive = os.path.join(tmpDir, "archive.k7")
+        target = os.path.join(tmpDir, "copy.k7")
+        writeFile(archive, b"archive")
+        assert not cache.fetch("0123", target)
+        assert not os.path.exists(target)
+        cache.store("0123", archive)
+        assert cache.fetch("0123", target)
+        assert readFile(target) == b"archive"
+
+
+def test_ArchiveCache_should_hard_link_when_required():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        cache = ArchiveCache(os.path.join(tmpDir, "cache"), link=True)
+        archive = os.path.join(tmpDir, "archive.k7")
+        target = os.path.join(tmpDir, "copy.k7")
+        writeFile(archive, b"archive")
+        cache.store("0123", archive)
+        assert cache.fetch("0123", target)
+        assert os.path.samefile(target, cache.pathOf("0123"))
+
+
+def test_ArchiveCache_should_remove_the_least_recently_used_archives():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        cache = ArchiveCache(os.path.join(tmpDir, "cache"), maxSize=25)
+        archive = os.path.join(tmpDir, "archive.k7")
+        target = os.path.join(tmpDir, "copy.k7")
+        writeFile(archive, b"0123456789")
+        cache.store("first", archive)
+        cache.store("second", archive)
+        os.utime(cache.pathOf("first"), (time.time() - 60, time.time() - 60))
+        os.utime(cache.pathOf("second"), (time.time() - 30, time.time() - 30))
+        assert cache.fetch("first", target)  # now the most recently used
+        cache.store("third", archive)
+        assert os.path.exists(cache.pathOf("first"))
+        assert not os.path.exists(cache.pathOf("second"))
+        assert os.path.exists(cache.pathOf("third"))
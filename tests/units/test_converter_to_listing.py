@@ -0,0 +1,44 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import io
+
+from moto_lib.basic import (
+    ListingToTokenizedBasicConverter,
+    TokenizedBasicToListingConverter,
+)
+
+
+def test_TokenizedBasicToListingConverter_decodes_else_and_keeps_string_litterals():
+    listing = '10 IF A=1 THEN PRINT "IF A THEN";LEFT$(B$,2) ELSE END\n'
+    bas = io.BytesIO()
+    ListingToTokenizedBasicConverter().convert(io.StringIO(listing), bas)
+    lst = io.BytesIO()
+    TokenizedBasicToListingConverter().convert(bas.getvalue(), lst)
+    assert lst.getvalue() == bytes(listing, "utf-8")
+
+
+def test_TokenizedBasicToListingConverter_decodes_unknown_tokens_as_themselves():
+    program = b"\x25\xa4\x00\x0a\xab\x95\xff\x20\x00\x00\x00"
+    data = bytes([0xFF, 0, len(program)]) + program
+    decoded = TokenizedBasicToListingConverter().decodeProgram(data)
+    assert decoded == b"10 PRINT\x95\xff\x20\n"
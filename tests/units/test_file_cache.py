@@ -0,0 +1,83 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import os
+import tempfile
+import time
+
+from moto_lib.file_cache import FileDataCache
+
+
+def writeFile(path: str, data: bytes, mtime: int):
+    with open(path, "wb") as f:
+        f.write(data)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_FileDataCache_should_read_a_file_again_only_when_it_has_changed():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        path = os.path.join(tmpDir, "image.sd")
+        cache = FileDataCache()
+        writeFile(path, b"first", 1_000_000_000)
+        data = cache.read(path)
+        assert data == b"first"
+        assert cache.read(path) is data  # not read again
+
+        # same size and modification time, but the change time tells the new content
+        writeFile(path, b"other", 1_000_000_000)
+        assert cache.read(path) == b"other"
+
+        writeFile(path, b"second", 2_000_000_000)
+        assert cache.read(path) == b"second"
+        cache.forget(path)
+        assert cache.size == 0
+        writeFile(path, b"third!", 2_000_000_000)
+        assert cache.read(path) == b"third!"
+
+
+def test_FileDataCache_should_not_keep_a_file_that_has_just_been_modified():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        path = os.path.join(tmpDir, "image.sd")
+        cache = FileDataCache()
+        now = time.time_ns()
+        writeFile(path, b"first", now)
+        data = cache.read(path)
+        assert data == b"first"
+        assert cache.size == 0
+        assert cache.read(path) is not data
+
+
+def test_FileDataCache_should_forget_the_least_recently_read_files():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        paths = [os.path.join(tmpDir, f"{i}.k7") for i in range(3)]
+        for path in paths:
+            writeFile(path, b"0123456789", 1_000_000_000)
+        cache = FileDataCache(maxSize=25)
+        data = [cache.read(path) for path in paths[0:2]]
+        assert cache.read(paths[0]) is data[0]
+        cache.read(paths[2])
+        assert cache.size == 20
+
+        # the forgotten file is read again, the others are still known
+        assert cache.read(paths[1]) is not data[1]
+        assert cache.read(paths[1]) == b"0123456789"
+        assert cache.size == 20
@@ -20,6 +20,7 @@ If not, see <https://www.gnu.org/licenses/>.
 """
 
 from moto_lib import Tape, TapeBlock, LeaderTapeBlockDescriptor, TypeOfTapeBlock
+from moto_lib.fs_tape.tape import buildStartOfBlockSequence
 import pytest
 
 
@@ -188,3 +189,54 @@ def test_Tape_next_block_return_257_bytes_of_raw_data_when_length_byte_is_zero()
     ).nextBlock()
     assert block is not None
     assert len(block.rawData) == 257
+
+
+def test_TapeBlock_from_tape_is_a_view_over_the_tape_buffer():
+    tapeData = bytearray(
+        b"\x01\x01\x01\x3c\x5a\x01\x05\x41\x42\x43\x3a\x01\x01\x01\x01"
+    )
+    block = Tape(tapeData).nextBlock()
+    assert isinstance(block.body, memoryview)
+    assert block.body == b"\x41\x42\x43"
+    tapeData[7] = 0x5A
+    assert block.body == b"\x5a\x42\x43"
+
+
+def test_TapeBlock_keeps_unknown_type_as_int():
+    but = TapeBlock(b"\x42\x02\x00")
+    assert but.type == 0x42
+    assert but.isValid()
+    with pytest.raises(AttributeError):
+        but.whatever = 0
+
+
+def test_Tape_with_shorter_start_of_block_sequence_can_be_read_and_trimmed():
+    tape = Tape()
+    tape.startOfBlockSequence = buildStartOfBlockSequence(3)
+    tape.writeBlock(TapeBlock.buildFromData(b"\x55" * 10))
+    tape.writeBlock(TapeBlock.buildFromData(None, TypeOfTapeBlock.EOF))
+    tape.trim()
+    assert len(tape.rawData) == (5 + 13) + (5 + 3)
+    tape = Tape(tape.rawData)
+    assert tape.nextBlock().body == b"\x55" * 10
+    assert tape.nextBlock().type == TypeOfTapeBlock.EOF
+    assert tape.nextBlock() is None
+
+
+def test_Tape_can_be_extended_and_trimmed_while_a_block_read_from_it_is_alive():
+    tape = Tape()
+    tape.writeBlock(TapeBlock.buildFromData(b"\x55" * 10))
+    tape.trim()
+    tape = Tape(tape.rawData)
+    block = tape.nextBlock()
+    tape.extend(100)
+    assert len(tape.rawData) == len(tape.startOfLastBlock) + 13 + 100
+    tape.writeBlock(TapeBlock.buildFromData(None, TypeOfTapeBlock.EOF))
+    tape.trim()
+    assert tape.position == len(tape.rawData)
+    assert block.body == b"\x55" * 10
+
+
+def test_buildStartOfBlockSequence_rejects_sequences_that_cannot_be_read():
+    with pytest.raises(ValueError):
+        buildStartOfBlockSequence(2)
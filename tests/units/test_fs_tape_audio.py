@@ -0,0 +1,77 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import array
+import os
+import tempfile
+import wave
+
+from moto_lib.fs_tape.audio import TapeAudioDecoder, TapeAudioEncoder
+
+block = b"\x01\x05\x41\x42\x43\x3a"
+
+
+def renderBlocks(path: str, blocks: list[bytes]):
+    encoder = TapeAudioEncoder(path)
+    encoder.writeSilence(0.1)
+    for b in blocks:
+        encoder.writeBytes(b"\x01\x01\x01\x01\x3c\x5a" + b)
+        encoder.writeSilence(0.1)
+    encoder.close()
+
+
+def test_TapeAudioDecoder_does_decode_rendered_blocks():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        path = os.path.join(tmpDir, "tape.wav")
+        renderBlocks(path, [block, b"\xff\x02\x00"])
+        assert list(TapeAudioDecoder(path).blocks()) == [block, b"\xff\x02\x00"]
+
+
+def test_TapeAudioDecoder_does_decode_16_bits_stereo_at_any_sample_rate():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        path = os.path.join(tmpDir, "tape.wav")
+        renderBlocks(path, [block])
+        with wave.open(path, "rb") as wav:
+            frames = wav.readframes(wav.getnframes())
+
+        # resample from 48000 Hz to 44100 Hz, the second channel is silent
+        samples = array.array("h")
+        for i in range(len(frames) * 44100 // 48000):
+            samples.append((frames[i * 48000 // 44100] - 0x80) * 256)
+            samples.append(0)
+        convertedPath = os.path.join(tmpDir, "converted.wav")
+        with wave.open(convertedPath, "wb") as wav:
+            wav.setnchannels(2)
+            wav.setsampwidth(2)
+            wav.setframerate(44100)
+            wav.writeframes(samples.tobytes())
+
+        assert list(TapeAudioDecoder(convertedPath).blocks()) == [block]
+
+
+def test_TapeAudioDecoder_does_decode_across_chunks():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        path = os.path.join(tmpDir, "tape.wav")
+        renderBlocks(path, [block, block, block])
+        decoder = TapeAudioDecoder(path)
+        decoder.SIZE_OF_CHUNK = 37  # ensure that many runs overlap two chunks
+        assert list(decoder.blocks()) == [block, block, block]
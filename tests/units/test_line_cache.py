@@ -0,0 +1,95 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import json
+import os
+import tempfile
+
+from moto_lib.basic import TokenizedLineCache
+
+
+class FakeTokenizer:
+    def __init__(self):
+        self.lines = []
+
+    def tokenize(self, line: str) -> bytes:
+        self.lines.append(line)
+        return line.encode("ascii")
+
+
+def savedKeys(path: str) -> list[str]:
+    with open(path, "rt") as f:
+        return list(json.load(f)["lines"])
+
+
+def test_TokenizedLineCache_should_keep_the_lines_of_the_previous_runs():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        path = os.path.join(tmpDir, "lines.json")
+        cache = TokenizedLineCache(path)
+        cache.tokenize("CLS", FakeTokenizer())
+        cache.save()
+
+        cache = TokenizedLineCache(path)
+        cache.tokenize("PRINT", FakeTokenizer())
+        cache.save()
+        assert savedKeys(path) == [
+            TokenizedLineCache.keyOf("CLS"),
+            TokenizedLineCache.keyOf("PRINT"),
+        ]
+
+        tokenizer = FakeTokenizer()
+        cache = TokenizedLineCache(path)
+        assert cache.tokenize("CLS", tokenizer) == b"CLS"
+        assert tokenizer.lines == []
+
+
+def test_TokenizedLineCache_should_drop_the_least_recently_used_lines_first():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        path = os.path.join(tmpDir, "lines.json")
+        cache = TokenizedLineCache(path, maxCountOfLines=2)
+        for line in ["A", "B", "C"]:
+            cache.tokenize(line, FakeTokenizer())
+        cache.save()
+        assert savedKeys(path) == [
+            TokenizedLineCache.keyOf("B"),
+            TokenizedLineCache.keyOf("C"),
+        ]
+
+        cache = TokenizedLineCache(path, maxCountOfLines=2)
+        for line in ["B", "D"]:
+            cache.tokenize(line, FakeTokenizer())
+        cache.save()
+        assert savedKeys(path) == [
+            TokenizedLineCache.keyOf("B"),
+            TokenizedLineCache.keyOf("D"),
+        ]
+
+
+def test_TokenizedLineCache_should_save_the_lines_used_in_another_process():
+    with tempfile.TemporaryDirectory() as tmpDir:
+        path = os.path.join(tmpDir, "lines.json")
+        worker = TokenizedLineCache(path)
+        worker.tokenize("CLS", FakeTokenizer())
+        cache = TokenizedLineCache(path)
+        cache.addUsedLines(worker.popUsedLines())
+        cache.save()
+        assert savedKeys(path) == [TokenizedLineCache.keyOf("CLS")]
@@ -0,0 +1,51 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+import io
+
+import pytest
+
+from moto_lib.basic import BasicMemoryMapReport, ListingToTokenizedBasicConverter
+
+
+def tokenize(listing: str, loadAddress: int) -> bytes:
+    bas = io.BytesIO()
+    ListingToTokenizedBasicConverter(loadAddress=loadAddress).convert(
+        io.StringIO(listing), bas
+    )
+    return bas.getvalue()
+
+
+def test_BasicMemoryMapReport_should_give_address_and_size_of_each_line():
+    program = tokenize("10 CLS\n20 PRINT 1\n", 0x3000)
+    # pointers to the next lines are computed from the load address
+    assert program[3:5] == bytes([0x30, 0x06])
+    report = BasicMemoryMapReport.buildFromProgram(program, 0x3000, 0x3010)
+    assert report.lines == [(10, 0x3000, 6), (20, 0x3006, 8)]
+    assert report.sizeOfProgram == 6 + 8 + 2
+    assert report.endAddress == 0x3010
+    assert report.freeMemory == 0
+
+
+def test_BasicMemoryMapReport_should_reject_data_that_are_not_tokenized_basic():
+    with pytest.raises(ValueError):
+        BasicMemoryMapReport.buildFromProgram(b"\x0d10 CLS\x0d")
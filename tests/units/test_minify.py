@@ -0,0 +1,69 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+from moto_lib.basic import Minifier
+
+
+def test_Minifier_should_remove_comments_and_spaces_outside_litterals_and_data():
+    minifier = Minifier()
+    assert (
+        minifier.minifyLine('CLS : PRINT "A  B" ; X : REM done') == 'CLS:PRINT"A  B";X'
+    )
+    assert (
+        minifier.minifyLine("A = A + 1 : DATA 1, 2 , 3 : REM data")
+        == "A=A+1:DATA 1, 2 , 3"
+    )
+    assert minifier.minifyLine("REM nothing") == ""
+
+
+def test_Minifier_should_keep_the_spaces_that_change_the_tokens():
+    minifier = Minifier()
+    # 'FORI=1TO10' would not be tokenized as 'FOR I=1 TO 10'
+    assert minifier.minifyLine("FOR I = 1 TO 10") == "FOR I=1 TO 10"
+    assert minifier.minifyLine("IF A THEN ' nothing") == "IF A THEN ' nothing"
+
+
+def test_Minifier_should_merge_lines_that_are_not_referenced():
+    assert Minifier().minify(
+        [
+            "10 REM title\n",
+            "20 CLS\n",
+            "30 PRINT I\n",
+            "40 IF I < 10 THEN 70\n",
+            "50 I = I + 1\n",
+            "60 GOTO 30\n",
+            "70 REM the end\n",
+            "80 END\n",
+        ]
+    ) == [
+        "20 CLS",
+        "30 PRINTI:IF I<10 THEN 70",
+        "50 I=I+1:GOTO 30",
+        "70 END",
+    ]
+
+
+def test_Minifier_should_shrink_the_tokenized_program():
+    minifier = Minifier()
+    lines = ["10 REM title\n", "20 CLS\n", "30 PRINT 1\n"]
+    assert minifier.sizeOfProgram(lines) == 5 + (5 + 7) + (5 + 1) + (5 + 3)
+    assert minifier.sizeOfProgram(minifier.minify(lines)) == 5 + (5 + 4)
@@ -0,0 +1,70 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+from moto_lib.basic import Renumbering
+
+
+def renumber(lines: list[str]) -> list[str]:
+    return list(Renumbering(100, 10).renumber(lines))
+
+
+def test_Renumbering_should_not_rewrite_string_litterals_comments_and_data():
+    assert renumber(
+        [
+            '1 PRINT "GOTO 1":GOTO 1',
+            '2 DATA 1,"a:GOTO 1",2:RESTORE 2:GOTO 1\' GOTO 1',
+            "3 goto1:gosub 2:REM GOSUB 2",
+        ]
+    ) == [
+        '100 PRINT "GOTO 1":GOTO 100',
+        '110 DATA 1,"a:GOTO 1",2:RESTORE 110:GOTO 100\' GOTO 1',
+        "120 goto100:gosub 110:REM GOSUB 2",
+    ]
+
+
+def test_Renumbering_should_rewrite_lists_of_line_numbers():
+    assert renumber(["7 ON A GO TO 8 , 9:ON B GOSUB 9,7", "8 RUN 9", "9 RESUME 8"]) == [
+        "100 ON A GO TO 110 , 120:ON B GOSUB 120,100",
+        "110 RUN 120",
+        "120 RESUME 110",
+    ]
+
+
+def test_Renumbering_should_report_undefined_references():
+    renumbering = Renumbering(10, 10)
+    assert list(renumbering.renumber(["5 GOTO 6", "IF A THEN 5"])) == [
+        "10 GOTO 6",
+        "20 IF A THEN 10",
+    ]
+    assert renumbering.undefinedReferences == [(10, 6)]
+
+
+def test_Renumbering_should_keep_the_zero_of_on_error_goto_and_resume():
+    renumbering = Renumbering(10, 10)
+    assert list(
+        renumbering.renumber(["5 ON ERROR GOTO 7", "6 ON ERROR GOTO 0", "7 RESUME 0"])
+    ) == [
+        "10 ON ERROR GOTO 30",
+        "20 ON ERROR GOTO 0",
+        "30 RESUME 0",
+    ]
+    assert renumbering.undefinedReferences == []
@@ -0,0 +1,44 @@
+"""
+---
+(c) 2022 David SPORN
+---
+This is part of MO/TO tools.
+
+MO/TO tools is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your option)
+any later version.
+
+MO/TO tools is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.
+
+See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with MO/TO tools.
+If not, see <https://www.gnu.org/licenses/>.
+---
+"""
+
+
+from moto_lib.basic.scanner import TypeOfSegment, splitLine, splitLitterals
+
+
+def test_splitLitterals_should_alternate_code_and_string_litterals():
+    assert splitLitterals('PRINT "A":PRINT"":B$="C') == [
+        "PRINT ",
+        '"A"',
+        ":PRINT",
+        '""',
+        ":B$=",
+        '"C',
+        "",
+    ]
+    assert splitLitterals("CLS") == ["CLS"]
+
+
+def test_splitLine_should_find_comments_and_data():
+    assert splitLine('DATA 1,":":A=1 REM "') == [
+        (TypeOfSegment.DATA, 'DATA 1,":"'),
+        (TypeOfSegment.CODE, ":A=1 "),
+        (TypeOfSegment.COMMENT, 'REM "'),
+    ]
@@ -19,7 +19,15 @@ If not, see <https://www.gnu.org/licenses/>.
 ---
 """
 
+import os
+
 from moto_lib import TokenizerContext, TokenizerPhase, TokenizerPhaseAutomaton
+from moto_lib.basic.converter_from_listing import (
+    ListingToTokenizedBasicConverter,
+    basicTokensDb,
+    litteralTokensDb,
+)
+from moto_lib.basic.tokenizer import TokenizerEngine
 
 
 def buildDatabase(tokens):
@@ -57,3 +65,25 @@ def test_TokenizerPhaseAutomaton_should_switch_when_conditions_are_met():
 
     context.appendAsToken("nevermind")
     assert not automaton.update(context, "don't mind me")
+
+
+def test_TokenizerEngine_should_give_the_same_output_as_TokenizerContext():
+    converter = ListingToTokenizedBasicConverter()
+    engine = TokenizerEngine(basicTokensDb, converter.SPECIAL_CHARS)
+    lines = [
+        'IF A THEN PRINT "#"; ELSE PRINT "+";',
+        "GOTO 10:GOSUB20",
+        "PRINTEND-1",
+        "A=-ENDX",
+        'PRINT "unterminated',
+        "straße=ÉLÉMENT'REM",
+    ]
+    sourceDir = os.path.join(".", "tests", "data")
+    for f in ["l2bin-to-tokenize.lst", "in_ugly.bas", "big_18k.txt"]:
+        with open(os.path.join(sourceDir, f), "rt") as source:
+            lines += source.read().splitlines()
+    for line in lines:
+        context = TokenizerContext(basicTokensDb, litteralTokensDb)
+        converter.parseLine(line, context)
+        context.commit()
+        assert engine.tokenize(line) == context.doneBuffer, line